@@ -12,13 +12,23 @@ echo.
 echo Iniciando servidor...
 echo.
 
+:: Si hay exportación estática (python -m pipeline publish), se sirve sin Node
+if not exist "out\asset-manifest.json" goto node
+python -m pipeline serve --host 0.0.0.0
+if %errorlevel% equ 0 goto fin
+echo.
+echo ❌ No se pudo servir la exportación estática. Probando con Node...
+
+:node
 :: Intenta iniciar en modo producción (optimizado)
 call npm start
 
 if %errorlevel% neq 0 (
     echo.
     echo ❌ Algo falló al iniciar. Intentando modo desarrollo...
+    rem predev (python -m pipeline build) genera public/assets y public/optimized
     call npm run dev
 )
 
+:fin
 pause
@@ -0,0 +1,58 @@
+'use client';
+
+import { useEffect, useState } from 'react';
+import { Search } from 'lucide-react';
+import { idioma } from '../data/idioma';
+import { search, type Resultado } from '../lib/search';
+
+export default function Buscador({ onSelect }: { onSelect: (tab: string) => void }) {
+    const [query, setQuery] = useState('');
+    const [resultados, setResultados] = useState<Resultado[]>([]);
+
+    useEffect(() => {
+        let cancelled = false;
+        const timer = setTimeout(() => {
+            search(query, idioma).then((lista) => {
+                if (!cancelled) setResultados(lista);
+            });
+        }, 150);
+        return () => {
+            cancelled = true;
+            clearTimeout(timer);
+        };
+    }, [query]);
+
+    return (
+        <div className="relative w-full max-w-md mx-auto">
+            <div className="flex items-center gap-2 bg-slate-800/50 rounded-xl px-4 py-2 border border-slate-700/50 focus-within:border-amber-500/50 transition-colors">
+                <Search className="w-4 h-4 text-slate-400" />
+                <input
+                    type="search"
+                    value={query}
+                    onChange={(e) => setQuery(e.target.value)}
+                    placeholder="Buscar en el archivo..."
+                    className="bg-transparent outline-none text-slate-200 placeholder-slate-500 w-full text-sm"
+                />
+            </div>
+
+            {query && resultados.length > 0 && (
+                <ul className="absolute left-0 right-0 mt-2 max-h-96 overflow-y-auto bg-slate-900/95 backdrop-blur-xl rounded-xl border border-slate-700/50 shadow-2xl z-50">
+                    {resultados.map((resultado, index) => (
+                        <li key={index}>
+                            <button
+                                onClick={() => {
+                                    onSelect(resultado.tab);
+                                    setQuery('');
+                                }}
+                                className="w-full text-left px-4 py-3 hover:bg-slate-800/70 transition-colors"
+                            >
+                                <p className="text-amber-400 text-sm font-semibold">{resultado.title}</p>
+                                <p className="text-slate-400 text-xs line-clamp-2">{resultado.snippet}</p>
+                            </button>
+                        </li>
+                    ))}
+                </ul>
+            )}
+        </div>
+    );
+}
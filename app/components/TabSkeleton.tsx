@@ -0,0 +1,14 @@
+// Placeholder shown while a code-split tab's chunk is downloading.
+export default function TabSkeleton() {
+    return (
+        <div className="max-w-5xl mx-auto space-y-8 py-12 animate-pulse" aria-busy="true">
+            <div className="h-12 w-2/3 mx-auto rounded-xl bg-slate-800/60" />
+            <div className="h-5 w-1/2 mx-auto rounded-lg bg-slate-800/40" />
+            <div className="space-y-4 pt-8">
+                {[0, 1, 2, 3].map((i) => (
+                    <div key={i} className="h-20 rounded-2xl bg-slate-800/50 border border-slate-700/40" />
+                ))}
+            </div>
+        </div>
+    );
+}
@@ -0,0 +1,173 @@
+// Generado por pipeline/i18n.py desde app/components/Portal.tsx. No editar a mano.
+'use client';
+
+import { useEffect, useRef, useState, type ReactNode } from 'react';
+import dynamic from 'next/dynamic';
+import { gsap } from 'gsap';
+import { ScrollTrigger } from 'gsap/ScrollTrigger';
+import { Calendar, Image as ImageIcon, Newspaper, Info, Moon, Sun } from 'lucide-react';
+import { idioma, idiomas } from '../../data/en/idioma';
+import Buscador from './Buscador';
+import TabSkeleton from '../TabSkeleton';
+
+gsap.registerPlugin(ScrollTrigger);
+
+// Interactive tabs are split into their own chunks and only downloaded when opened.
+const CronogramaTab = dynamic(() => import('../../tabs/en/CronogramaTab'), { loading: () => <TabSkeleton /> });
+const GaleriaTab = dynamic(() => import('../../tabs/en/GaleriaTab'), { loading: () => <TabSkeleton /> });
+
+type TabType = 'autor' | 'proyecto' | 'cronograma' | 'galeria' | 'noticias';
+
+// Static tabs are rendered on the server by app/page.tsx and handed in already built.
+type PortalProps = {
+    autor: ReactNode;
+    proyecto: ReactNode;
+    noticias: ReactNode;
+};
+
+export default function Portal({ autor, proyecto, noticias }: PortalProps) {
+    const [activeTab, setActiveTab] = useState<TabType>('autor');
+    const [theme, setTheme] = useState<'dark' | 'light'>('dark');
+    const heroRef = useRef<HTMLDivElement>(null);
+
+    useEffect(() => {
+        // Hero animations (AutorTab is a server component, so it is targeted by selector)
+        const ctx = gsap.context(() => {
+            gsap.from('[data-anim="title"]', {
+                opacity: 0,
+                y: 100,
+                duration: 1.2,
+                ease: 'power3.out',
+            });
+
+            gsap.from('[data-anim="subtitle"]', {
+                opacity: 0,
+                y: 50,
+                duration: 1,
+                delay: 0.3,
+                ease: 'power3.out',
+            });
+
+            // Scroll-triggered animations for sections
+            gsap.utils.toArray('.fade-in-section').forEach((section: any) => {
+                gsap.from(section, {
+                    opacity: 0,
+                    y: 80,
+                    duration: 1,
+                    scrollTrigger: {
+                        trigger: section,
+                        start: 'top 80%',
+                        end: 'top 50%',
+                        scrub: 1,
+                    },
+                });
+            });
+        }, heroRef);
+
+        return () => ctx.revert();
+    }, [activeTab]);
+
+    // Labels are JSX text so that pipeline/i18n.py can translate them into app/components/<idioma>/Portal.tsx.
+    const tabs = [
+        { id: 'autor', label: <>Guanarteme and the author</>, short: <>Guanarteme</>, icon: Info },
+        { id: 'proyecto', label: <>Project</>, short: <>Project</>, icon: Info },
+        { id: 'cronograma', label: <>Historical Timeline</>, short: <>Timeline</>, icon: Calendar },
+        { id: 'galeria', label: <>Photo Gallery</>, short: <>Gallery</>, icon: ImageIcon },
+        { id: 'noticias', label: <>News</>, short: <>News</>, icon: Newspaper },
+    ] as const;
+
+    return (
+        <div ref={heroRef} lang={idioma} className={`min-h-screen transition-colors duration-500 ${theme === 'dark'
+            ? 'bg-gradient-to-br from-slate-950 via-slate-900 to-slate-800'
+            : 'bg-gradient-to-br from-slate-50 via-slate-100 to-slate-200'
+            }`}>
+            {/* Navigation Tabs */}
+            <nav className={`sticky top-0 z-50 backdrop-blur-xl border-b transition-colors duration-500 ${theme === 'dark'
+                ? 'bg-slate-950/80 border-slate-800/50'
+                : 'bg-white/80 border-slate-300/50'
+                }`}>
+                <div className="container mx-auto px-4">
+                    <div className="flex flex-col sm:flex-row items-center justify-center gap-3 py-4 relative">
+                        {/* Theme Toggle and language links - positioned absolutely on the right */}
+                        <div className="absolute right-0 top-4 md:top-1/2 md:-translate-y-1/2 flex items-center gap-2">
+                            {idiomas.filter((otro) => otro.codigo !== idioma).map((otro) => (
+                                <a
+                                    key={otro.codigo}
+                                    href={otro.href}
+                                    hrefLang={otro.codigo}
+                                    lang={otro.codigo}
+                                    className={`px-3 py-2 rounded-xl text-sm font-semibold uppercase transition-all duration-300 ${theme === 'dark'
+                                        ? 'bg-slate-800/50 text-slate-300 hover:bg-slate-700/70 hover:text-white'
+                                        : 'bg-slate-200/50 text-slate-700 hover:bg-slate-300/70 hover:text-slate-900'
+                                        }`}
+                                    title={otro.nombre}
+                                >
+                                    {otro.codigo}
+                                </a>
+                            ))}
+                            <button
+                                onClick={() => setTheme(theme === 'dark' ? 'light' : 'dark')}
+                                className={`p-3 rounded-xl transition-all duration-300 ${theme === 'dark'
+                                    ? 'bg-slate-800/50 text-amber-400 hover:bg-slate-700/70 hover:text-amber-300'
+                                    : 'bg-slate-200/50 text-amber-600 hover:bg-slate-300/70 hover:text-amber-700'
+                                    }`}
+                                title={theme === 'dark' ? 'Light mode' : 'Dark mode'}
+                            >
+                                {theme === 'dark' ? <Sun className="w-5 h-5" /> : <Moon className="w-5 h-5" />}
+                            </button>
+                        </div>
+
+                        {/* Centered Navigation Tabs */}
+                        <div className="flex flex-wrap items-center justify-center gap-2 md:gap-3 pr-28 md:pr-0">
+                            {tabs.map((tab) => {
+                                const Icon = tab.icon;
+                                const isActive = activeTab === tab.id;
+                                return (
+                                    <button
+                                        key={tab.id}
+                                        onClick={() => setActiveTab(tab.id as TabType)}
+                                        className={`
+                                            flex items-center gap-2 px-6 py-3 rounded-xl font-semibold transition-all duration-300
+                                            ${isActive
+                                                ? 'bg-gradient-to-r from-amber-500 to-orange-500 text-white shadow-lg shadow-amber-500/30 scale-105'
+                                                : theme === 'dark'
+                                                    ? 'bg-slate-800/50 text-slate-300 hover:bg-slate-700/70 hover:text-white'
+                                                    : 'bg-slate-200/50 text-slate-700 hover:bg-slate-300/70 hover:text-slate-900'
+                                            }
+                                        `}
+                                    >
+                                        <Icon className="w-5 h-5" />
+                                        <span className="hidden sm:inline">{tab.label}</span>
+                                        <span className="sm:hidden">{tab.short}</span>
+                                    </button>
+                                );
+                            })}
+                        </div>
+                    </div>
+
+                    <div className="pb-4">
+                        <Buscador onSelect={(tab) => setActiveTab(tab as TabType)} />
+                    </div>
+                </div>
+            </nav>
+
+            {/* Tab Content */}
+            <div className="container mx-auto px-4 py-8">
+                {activeTab === 'autor' && autor}
+                {activeTab === 'proyecto' && proyecto}
+                {activeTab === 'cronograma' && <CronogramaTab />}
+                {activeTab === 'galeria' && <GaleriaTab />}
+                {activeTab === 'noticias' && noticias}
+            </div>
+
+            {/* Footer */}
+            <footer className="py-12 px-4 bg-slate-950/80 border-t border-slate-800">
+                <div className="container mx-auto text-center">
+                    <p className="text-slate-400 text-sm">
+                        A portal devoted to the memory and recovery of the historic neighbourhood of Guanarteme
+                    </p>
+                </div>
+            </footer>
+        </div>
+    );
+}
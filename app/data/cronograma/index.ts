@@ -0,0 +1,22 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+export type Evento = { year: string; text: string };
+
+export type Siglo = {
+    label: string;
+    subtitle: string;
+    color: string;
+    dot: string;
+    count: number;
+    load: () => Promise<Evento[]>;
+};
+
+export const siglos: Siglo[] = [
+    { label: "Siglos I al XV", subtitle: "Periodo antes de la conquista", color: "from-stone-400 to-amber-600", dot: "bg-stone-500", count: 2, load: () => import('./s-i-xv').then((m) => m.default) },
+    { label: "Siglo XVI", subtitle: "", color: "from-amber-400 to-yellow-500", dot: "bg-amber-600", count: 1, load: () => import('./s-xvi').then((m) => m.default) },
+    { label: "Siglo XVII", subtitle: "", color: "from-orange-400 to-amber-500", dot: "bg-orange-500", count: 3, load: () => import('./s-xvii').then((m) => m.default) },
+    { label: "Siglo XVIII", subtitle: "", color: "from-yellow-400 to-lime-500", dot: "bg-yellow-500", count: 1, load: () => import('./s-xviii').then((m) => m.default) },
+    { label: "Siglo XIX", subtitle: "", color: "from-teal-400 to-cyan-500", dot: "bg-teal-500", count: 2, load: () => import('./s-xix').then((m) => m.default) },
+    { label: "Siglo XX", subtitle: "", color: "from-blue-400 to-indigo-500", dot: "bg-blue-500", count: 15, load: () => import('./s-xx').then((m) => m.default) },
+    { label: "Siglo XXI", subtitle: "", color: "from-purple-400 to-fuchsia-500", dot: "bg-purple-500", count: 4, load: () => import('./s-xxi').then((m) => m.default) },
+];
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"Ss. I–XV","text":"En el Barranco de Guanarteme se localizan hoy numerosas cuevas y yacimientos como la de Hoya del Paso, donde se encontró una vasija con granos de trigo tostado y cenizas, atestiguando la presencia de cultivos de este cereal en los meandros del barranco."},{"year":"1478","text":"Fundación de la ciudad de Las Palmas en la margen derecha del barranco Guiniguada, cerca del área de Guanarteme."}];
+
+export default eventos;
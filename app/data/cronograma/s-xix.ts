@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1860","text":"La familia Apolinario adquiere 62 hectáreas en el barrio de Guanarteme, iniciando el poblamiento de la zona."},{"year":"Finales s. XIX","text":"Intensificación del poblamiento: El barrio de Guanarteme experimenta un aumento en la población, atraída por las oportunidades laborales en el Puerto de La Luz y otras actividades emergentes."}];
+
+export default eventos;
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"S. XVI","text":"Un antropónimo muy antiguo, Jacomar da nombre al barranco y al caserío, de quien existe la referencia algo lejana de Marcos Jacomar, vecino de Arucas que donó bienes a su parroquia en los primeros años del siglo XVI (SÁNCHEZ RODRÍGUEZ, J.: Historia de la Parroquia de San Juan Bautista de Arucas. 1515-1817, Sta. Cruz de Tenerife, 2013)."}];
+
+export default eventos;
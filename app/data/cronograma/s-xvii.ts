@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1669","text":"Construcción de las Salinas de Guanarteme en el Barranco de Guanarteme, también conocidas como Salinas Perdidas."},{"year":"1675","text":"En un documento del año 1675 Salvador Hernández y su esposa Catalina Hernández de Cerpa, vecinos de San Pedro de Tenoya, compraron un lote de tierras, de unas veinte fanegadas, a D. Juan Huesterling Sarmiento y Saavedra que a su vez había comprado a los herederos de D. Bartolomé de Moxica en el año 1672. Eran tierras montuosas en El Cardonal que lindaban por la parte de arriba con la Cueva del Lagarto, continuando adelante por La Cordillera del Cardonal a dar a Los Caideros del Rincón junto a las tierras que llamaban de Burgos, que hacen mención al conquistador ya mencionado Gonzalo de Burgos y que en aquel entonces pertenecían a Francisco González Enamorado y por la parte de abajo estaba el mar y los cercados que habían sido de Guillén de Ayala y que por aquellas fechas ya pertenecían al mencionado matrimonio comprador ."},{"year":"1684","text":"En el año 1684 se hablaba de Las Cordilleras del Cardonal \"vertientes abajo a dar al Lomito del Rincón y a la mar\". Este sería otro de los nombres anteriores a Los Giles y relacionada con los accidentes geográficos del lugar."}];
+
+export default eventos;
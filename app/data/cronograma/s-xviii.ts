@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"S. XVIII","text":"Lomos de los Henríquez, familias con ancestros en San Lorenzo y Tamaraceite desde el siglo XVIII; o los desconocidos Giles, familia cuyas tierras dieron nombre al nuevo barrio (SANTANA DOMÍNGUEZ, JF.: Los Giles: Notas históricas previas al Pregón de las Fiestas 2010, municipiodesanlorenzo-com, 17-jun-2010)."}];
+
+export default eventos;
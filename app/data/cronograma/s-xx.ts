@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1923-1931","text":"Se terminan las obras de la Carretera de Chile que une Guanarteme con Tamaraceite. En 1931 empieza a ser visible el nuevo \"barrio\" de Chil junto a la donde se instalan algunas pequeñas fábricas, entre ellas una de mosaicos."},{"year":"1924","text":"Los hermanos Cristóbal y Martín Saavedra Ramos solicitan una licencia para construir una capilla en la barriada de Guanarteme, proyecto encargado al arquitecto E. Laforet y aprobado el 20 de mayo de 1924."},{"year":"1928","text":"Inauguración de la Compañía Insular Colonial de Electricidad y Riesgos S.A. (CICER) en Guanarteme, destinada a suministrar electricidad a la ciudad."},{"year":"1937","text":"El barrio de Guanarteme, junto con Tamaraceite y Tenoya, es incorporado al municipio de Las Palmas de Gran Canaria, tras haber pertenecido al municipio de San Lorenzo."},{"year":"30s y 40s","text":"Establecimiento de industrias conserveras como Lloret y Llinares, Ojeda, Ortuño, Turajo y Beltrán en la zona de Guanarteme."},{"year":"30s y 40s","text":"Establecimiento de la zona tomatera de Los Giles regada con el agua de La Presa de los Giles y varios estanques."},{"year":"1940s","text":"Establecimiento del cuartel Manuel Lois y construcción del polvorín. Estos hechos forman parte de la intervención militar en la zona, que tuvo un impacto significativo en el uso del suelo y en la transformación del paisaje."},{"year":"40s y 50s","text":"Instalación de diversas industrias en Guanarteme, como la Fosforera, Jabonera Canaria, Cigarrillos Rumbo y Tirma."},{"year":"40s y 50s","text":"Actividad agrícola intensiva: Durante este periodo se intensifica la actividad agrícola en la zona."},{"year":"1951","text":"La ortofoto de GRAFCAN de 1951 muestran fincas de plataneras en el Barranco de Guanarteme, mientras que en el Llano de Burgos, por debajo de Los Giles, se observan muchos terrenos dedicadas al cultivo de tomates."},{"year":"60s y 70s","text":"Construcción de \"Los Muellitos\" para suministrar agua salada destinada a la refrigeración de las turbinas de la fábrica de la CICER."},{"year":"1970s","text":"Instalación de la empresa de Aguas de Firgas en un solar del Barranco de Guanarteme: La primera ortofoto que evidencia la actividad de la empresa de Aguas de Firgas en el barranco data de 1977, lo que indica que probablemente la instalación se realizó en la década de los 70."},{"year":"1984","text":"Cierre de la última conservera del barrio de Guanarteme."},{"year":"1993","text":"Inauguración del IES El Rincón en septiembre y del Centro Comercial Las Arenas en diciembre. La zona se desarrolla con gran número de construcciones nuevas y el derribo de viejas casas y aprovechamiento de solares."},{"year":"1997","text":"Finalización de la construcción del Auditorio Alfredo Kraus con la idea de erigir un faro que protegiera la Playa de Las Canteras. Prosigue el aumento de edificaciones en la zona."}];
+
+export default eventos;
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"2002","text":"Las fincas de plataneras se mantienen activas en el Barranco de Guanarteme hasta al menos el año 2002."},{"year":"2006","text":"Comenzó el proceso de desmilitarización de los 168.500 metros cuadrados del llamado cuartel Manuel Lois en El Barranco de Tamaraceite."},{"year":"2008-2009","text":"Se instala un gran invernadero en el Llano de Burgos para el cultivo de tomates que no ocupa toda la zona sino lo que es la zona donde hoy despegan los parapentes."},{"year":"2010","text":"Abandono de las fincas agrícolas: Tanto las fincas de tomateros (tras la instalación del invernadero) como las de plataneras en el barranco son abandonadas entre 2010 y 2011."}];
+
+export default eventos;
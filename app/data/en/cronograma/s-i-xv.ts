@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1st–15th c.","text":"Numerous caves and archaeological sites are found today in the Barranco de Guanarteme, such as Hoya del Paso, where a vessel containing toasted wheat grains and ashes was discovered, attesting to the cultivation of this cereal in the meanders of the ravine."},{"year":"1478","text":"Founding of the city of Las Palmas on the right bank of the Guiniguada ravine, near the Guanarteme area."}];
+
+export default eventos;
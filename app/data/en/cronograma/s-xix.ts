@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1860","text":"The Apolinario family acquires 62 hectares in the Guanarteme neighbourhood, beginning the settlement of the area."},{"year":"Late 19th c.","text":"Settlement intensifies: the Guanarteme neighbourhood grows in population, drawn by work at the Puerto de La Luz and other emerging activities."}];
+
+export default eventos;
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"16th c.","text":"A very old personal name, Jacomar, gives its name to the ravine and the hamlet; there is a rather distant reference to a Marcos Jacomar, a resident of Arucas who donated property to his parish in the first years of the 16th century (SÁNCHEZ RODRÍGUEZ, J.: Historia de la Parroquia de San Juan Bautista de Arucas. 1515-1817, Sta. Cruz de Tenerife, 2013)."}];
+
+export default eventos;
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1669","text":"Construction of the Guanarteme salt pans in the Barranco de Guanarteme, also known as the Salinas Perdidas (Lost Salt Pans)."},{"year":"1675","text":"In a document from 1675, Salvador Hernández and his wife Catalina Hernández de Cerpa, residents of San Pedro de Tenoya, bought a plot of about twenty fanegadas from D. Juan Huesterling Sarmiento y Saavedra, who in turn had bought it from the heirs of D. Bartolomé de Moxica in 1672. It was hilly land in El Cardonal bordered above by the Cueva del Lagarto, running on along La Cordillera del Cardonal down to Los Caideros del Rincón beside the lands called de Burgos, after the conquistador Gonzalo de Burgos mentioned earlier, which at the time belonged to Francisco González Enamorado; below lay the sea and the enclosures that had belonged to Guillén de Ayala and by then already belonged to the buyers."},{"year":"1684","text":"In 1684 there was talk of Las Cordilleras del Cardonal \"slopes down to the Lomito del Rincón and to the sea\". This would be another of the names that preceded Los Giles, related to the geographical features of the place."}];
+
+export default eventos;
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"18th c.","text":"Lomos de los Henríquez, families with ancestors in San Lorenzo and Tamaraceite since the 18th century; or the little-known Giles, the family whose lands gave their name to the new neighbourhood (SANTANA DOMÍNGUEZ, JF.: Los Giles: Notas históricas previas al Pregón de las Fiestas 2010, municipiodesanlorenzo-com, 17-jun-2010)."}];
+
+export default eventos;
@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"1923-1931","text":"Work is completed on the Carretera de Chile linking Guanarteme with Tamaraceite. In 1931 the new \"neighbourhood\" of Chil becomes visible beside it, where a few small factories set up, among them a mosaic tile works."},{"year":"1924","text":"The brothers Cristóbal and Martín Saavedra Ramos apply for a licence to build a chapel in the Guanarteme district, a project entrusted to the architect E. Laforet and approved on 20 May 1924."},{"year":"1928","text":"Opening of the Compañía Insular Colonial de Electricidad y Riesgos S.A. (CICER) in Guanarteme, built to supply electricity to the city."},{"year":"1937","text":"The Guanarteme neighbourhood, together with Tamaraceite and Tenoya, is incorporated into the municipality of Las Palmas de Gran Canaria, having previously belonged to the municipality of San Lorenzo."},{"year":"1930s and 1940s","text":"Canning industries such as Lloret y Llinares, Ojeda, Ortuño, Turajo and Beltrán set up in the Guanarteme area."},{"year":"1930s and 1940s","text":"The Los Giles tomato-growing area is established, irrigated with water from the Presa de los Giles dam and several reservoirs."},{"year":"1940s","text":"The Manuel Lois barracks are established and the powder magazine is built. These events are part of the military presence in the area, which had a significant impact on land use and on the transformation of the landscape."},{"year":"1940s and 1950s","text":"Various industries set up in Guanarteme, such as the Fosforera match factory, Jabonera Canaria, Cigarrillos Rumbo and Tirma."},{"year":"1940s and 1950s","text":"Intensive farming: agricultural activity in the area intensifies during this period."},{"year":"1951","text":"GRAFCAN's 1951 orthophoto shows banana plantations in the Barranco de Guanarteme, while on the Llano de Burgos, below Los Giles, much of the land is given over to growing tomatoes."},{"year":"1960s and 1970s","text":"Construction of \"Los Muellitos\" to supply seawater for cooling the turbines of the CICER plant."},{"year":"1970s","text":"The Aguas de Firgas company sets up on a plot in the Barranco de Guanarteme: the first orthophoto showing the company's activity in the ravine dates from 1977, which suggests it was probably installed during the 1970s."},{"year":"1984","text":"The last cannery in the Guanarteme neighbourhood closes."},{"year":"1993","text":"IES El Rincón opens in September and the Las Arenas shopping centre in December. The area develops with a large number of new buildings, the demolition of old houses and the use of empty plots."},{"year":"1997","text":"Completion of the Alfredo Kraus Auditorium, conceived as a lighthouse to protect Las Canteras beach. Building in the area keeps increasing."}];
+
+export default eventos;
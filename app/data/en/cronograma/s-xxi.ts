@@ -0,0 +1,7 @@
+// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.
+
+import type { Evento } from './index';
+
+const eventos: Evento[] = [{"year":"2002","text":"The banana plantations remain active in the Barranco de Guanarteme until at least 2002."},{"year":"2006","text":"Demilitarisation begins of the 168,500 square metres of the so-called Manuel Lois barracks in the Barranco de Tamaraceite."},{"year":"2008-2009","text":"A large greenhouse for growing tomatoes is built on the Llano de Burgos; it does not cover the whole area, only the part where paragliders take off today."},{"year":"2010","text":"The farms are abandoned: both the tomato farms (after the greenhouse was built) and the banana plantations in the ravine are abandoned between 2010 and 2011."}];
+
+export default eventos;
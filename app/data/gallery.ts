@@ -0,0 +1,73 @@
+// Generado por pipeline/gallery.py desde public/images/gallery y content/galeria.json. No editar a mano.
+
+export type Foto = {
+    src: string;
+    alt: string;
+    width: number;
+    height: number;
+    bytes: number;
+    color: string;
+    placeholder: string;
+    thumb: string;
+    srcSet: Record<string, string>;
+};
+
+export type Categoria = {
+    name: string;
+    color: string;
+    count: number;
+    cover: Foto | null;
+    photos: Foto[];
+};
+
+const fotos0: Foto[] = [
+    {"src":"/assets/34666c0881551ce0.png","alt":"Antiguo camión de transporte en Los Giles - Años 50","width":720,"height":528,"bytes":42840,"color":"#8b8b8b","placeholder":"data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAwAA4BaJaQAAucHwaoAAP7n/xZw8G5caBQSF4MHo0FZHLHvvHQKQAA=","thumb":"/optimized/34666c0881551ce0-320.webp","srcSet":{"webp":"/optimized/34666c0881551ce0-320.webp 320w, /optimized/34666c0881551ce0-640.webp 640w, /optimized/34666c0881551ce0-720.webp 720w","avif":"/optimized/34666c0881551ce0-320.avif 320w, /optimized/34666c0881551ce0-640.avif 640w, /optimized/34666c0881551ce0-720.avif 720w"}},
+    {"src":"/assets/45b7f2840115574b.png","alt":"Vista panorámica del área de Los Giles y su entorno natural","width":775,"height":476,"bytes":588787,"color":"#a09e9a","placeholder":"data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAADQAQCdASoQAAoAA4BaJZwAAua0RCdy4AD+7d3//sb9oS0FdkXF4pillW2AAA==","thumb":"/optimized/45b7f2840115574b-320.webp","srcSet":{"webp":"/optimized/45b7f2840115574b-320.webp 320w, /optimized/45b7f2840115574b-640.webp 640w, /optimized/45b7f2840115574b-775.webp 775w","avif":"/optimized/45b7f2840115574b-320.avif 320w, /optimized/45b7f2840115574b-640.avif 640w, /optimized/45b7f2840115574b-775.avif 775w"}},
+    {"src":"/assets/5fa993da7914d5cf.png","alt":"Desarrollo urbano de Los Giles - Vista histórica","width":652,"height":323,"bytes":319337,"color":"#afb1b4","placeholder":"data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACwAQCdASoQAAgAA4BaJaQAAuUxIUUoAP7yO7bW+Ndg0CcSNO7jgAAA","thumb":"/optimized/5fa993da7914d5cf-320.webp","srcSet":{"webp":"/optimized/5fa993da7914d5cf-320.webp 320w, /optimized/5fa993da7914d5cf-640.webp 640w, /optimized/5fa993da7914d5cf-652.webp 652w","avif":"/optimized/5fa993da7914d5cf-320.avif 320w, /optimized/5fa993da7914d5cf-640.avif 640w, /optimized/5fa993da7914d5cf-652.avif 652w"}},
+];
+const fotos1: Foto[] = [
+    {"src":"/assets/ba0b230547e2e1f7.jpg","alt":"Años 40-50 - 1320411257","width":567,"height":850,"bytes":105586,"color":"#a8a19e","placeholder":"data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACQAwCdASoQABgAPu1iqU2ppaOiMAgBMB2JQBWAAUgy9YVM/Y4YAP7WJpB9VLxd6JjFkR/9wmJUo2IGLdPx1CprVbhrlIT3pCTSwAAA","thumb":"/optimized/ba0b230547e2e1f7-320.webp","srcSet":{"webp":"/optimized/ba0b230547e2e1f7-320.webp 320w, /optimized/ba0b230547e2e1f7-567.webp 567w","avif":"/optimized/ba0b230547e2e1f7-320.avif 320w, /optimized/ba0b230547e2e1f7-567.avif 567w"}},
+    {"src":"/assets/4f54f880d4e606a2.jpg","alt":"Años 40-50 - 6519972241_bc59e07ddd_b","width":1024,"height":664,"bytes":149528,"color":"#a9a9a9","placeholder":"data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAACwAQCdASoQAAoAA4BaJaQAAucKp/m4AP6yPZO8Z5dpfrjxnNeja7Mz0AAAAA==","thumb":"/optimized/4f54f880d4e606a2-320.webp","srcSet":{"webp":"/optimized/4f54f880d4e606a2-320.webp 320w, /optimized/4f54f880d4e606a2-640.webp 640w, /optimized/4f54f880d4e606a2-960.webp 960w, /optimized/4f54f880d4e606a2-1024.webp 1024w","avif":"/optimized/4f54f880d4e606a2-320.avif 320w, /optimized/4f54f880d4e606a2-640.avif 640w, /optimized/4f54f880d4e606a2-960.avif 960w, /optimized/4f54f880d4e606a2-1024.avif 1024w"}},
+    {"src":"/assets/c28250cdf75c31de.jpg","alt":"Años 40-50 - accebb3c-6654-4248-a7b0-979ec106aefe_21-9-aspect-ratio_640w_0_x585y0","width":640,"height":274,"bytes":46897,"color":"#646460","placeholder":"data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAcAA4BaJZwAApZHupJgAP6D9hPSNAZ82OkQQypFroC4CAA=","thumb":"/optimized/c28250cdf75c31de-320.webp","srcSet":{"webp":"/optimized/c28250cdf75c31de-320.webp 320w, /optimized/c28250cdf75c31de-640.webp 640w","avif":"/optimized/c28250cdf75c31de-320.avif 320w, /optimized/c28250cdf75c31de-640.avif 640w"}},
+    {"src":"/assets/1d5c14ebd9ea4808.jpg","alt":"Años 40-50 - f3a81865-5e10-4e05-b3c6-4451e8c34956_16-9-aspect-ratio_default_0","width":880,"height":495,"bytes":76223,"color":"#8a92a2","placeholder":"data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAADQAQCdASoQAAkAA4BaJQBOgCFUdHArgAD+Z2PXtkDSf+zbzUs9TVGzgvjA0YmP/J/QAA==","thumb":"/optimized/1d5c14ebd9ea4808-320.webp","srcSet":{"webp":"/optimized/1d5c14ebd9ea4808-320.webp 320w, /optimized/1d5c14ebd9ea4808-640.webp 640w, /optimized/1d5c14ebd9ea4808-880.webp 880w","avif":"/optimized/1d5c14ebd9ea4808-320.avif 320w, /optimized/1d5c14ebd9ea4808-640.avif 640w, /optimized/1d5c14ebd9ea4808-880.avif 880w"}},
+];
+const fotos2: Foto[] = [
+    {"src":"/assets/48e1443287dcbb5a.jpg","alt":"Años 60-70 - 9be12fc3-39ae-43ea-ae24-03342b00bde1_16-9-discover-aspect-ratio_default_0","width":1200,"height":675,"bytes":152985,"color":"#908e8d","placeholder":"data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAADQAQCdASoQAAkAA4BaJQBdgCFqtx+WAAD+kaAi9AaG1TTWfVJ9mHQNoBdzCkAA","thumb":"/optimized/48e1443287dcbb5a-320.webp","srcSet":{"webp":"/optimized/48e1443287dcbb5a-320.webp 320w, /optimized/48e1443287dcbb5a-640.webp 640w, /optimized/48e1443287dcbb5a-960.webp 960w, /optimized/48e1443287dcbb5a-1200.webp 1200w","avif":"/optimized/48e1443287dcbb5a-320.avif 320w, /optimized/48e1443287dcbb5a-640.avif 640w, /optimized/48e1443287dcbb5a-960.avif 960w, /optimized/48e1443287dcbb5a-1200.avif 1200w"}},
+    {"src":"/assets/15010a963ae47bae.jpg","alt":"Años 60-70 - b8caa4ca-1240-4aa7-beed-06c02e1b9493_alta-libre-aspect-ratio_default_0","width":1200,"height":890,"bytes":146298,"color":"#a49e8c","placeholder":"data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAADQAQCdASoQAAwAA4BaJQBOgCHM0YfoEAD+9Ulr3DtwcGilPiuueN93gYZwPwTfEmw6schG4hMSIAAA","thumb":"/optimized/15010a963ae47bae-320.webp","srcSet":{"webp":"/optimized/15010a963ae47bae-320.webp 320w, /optimized/15010a963ae47bae-640.webp 640w, /optimized/15010a963ae47bae-960.webp 960w, /optimized/15010a963ae47bae-1200.webp 1200w","avif":"/optimized/15010a963ae47bae-320.avif 320w, /optimized/15010a963ae47bae-640.avif 640w, /optimized/15010a963ae47bae-960.avif 960w, /optimized/15010a963ae47bae-1200.avif 1200w"}},
+    {"src":"/assets/6cc15645fd64ff6b.jpg","alt":"Años 60-70 - db1031aac98bff29e010c3acbcc2ee1c","width":736,"height":476,"bytes":87726,"color":"#7d7861","placeholder":"data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAACwAQCdASoQAAoAA4BaJZgCdADPk3/YAP1vGUhyIl+KY4IGMnd5r+L8disAAA==","thumb":"/optimized/6cc15645fd64ff6b-320.webp","srcSet":{"webp":"/optimized/6cc15645fd64ff6b-320.webp 320w, /optimized/6cc15645fd64ff6b-640.webp 640w, /optimized/6cc15645fd64ff6b-736.webp 736w","avif":"/optimized/6cc15645fd64ff6b-320.avif 320w, /optimized/6cc15645fd64ff6b-640.avif 640w, /optimized/6cc15645fd64ff6b-736.avif 736w"}},
+    {"src":"/assets/ff1d7b1c5f623144.jpg","alt":"Años 60-70 - fcd0178a-2837-4718-ae51-a9d2d6c53e42_alta-libre-aspect-ratio_default_0","width":1200,"height":901,"bytes":141700,"color":"#7b7877","placeholder":"data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAABwAQCdASoQAAwAA4BaJZwAAOr5wAD+v7u4iMUkYLP6Hw4ZQFoKuso0nkUAAA==","thumb":"/optimized/ff1d7b1c5f623144-320.webp","srcSet":{"webp":"/optimized/ff1d7b1c5f623144-320.webp 320w, /optimized/ff1d7b1c5f623144-640.webp 640w, /optimized/ff1d7b1c5f623144-960.webp 960w, /optimized/ff1d7b1c5f623144-1200.webp 1200w","avif":"/optimized/ff1d7b1c5f623144-320.avif 320w, /optimized/ff1d7b1c5f623144-640.avif 640w, /optimized/ff1d7b1c5f623144-960.avif 960w, /optimized/ff1d7b1c5f623144-1200.avif 1200w"}},
+];
+const fotos3: Foto[] = [
+    {"src":"/assets/de1a50400d7a111c.jpg","alt":"Años 80-90 - 07767fde3d4479eb4c7c7f58bcd06f36","width":600,"height":874,"bytes":100123,"color":"#81766e","placeholder":"data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACwAwCdASoQABcAPu1orU6ppiSiMAgBMB2JZQC7ACIEk0mGDJIZ0AD4PUgvMHHDW4/Tda6UGySRfhFZ0YdbmSRqQOzj/TSGJs0cSAAA","thumb":"/optimized/de1a50400d7a111c-320.webp","srcSet":{"webp":"/optimized/de1a50400d7a111c-320.webp 320w, /optimized/de1a50400d7a111c-600.webp 600w","avif":"/optimized/de1a50400d7a111c-320.avif 320w, /optimized/de1a50400d7a111c-600.avif 600w"}},
+    {"src":"/assets/06c692abfd6926dd.webp","alt":"Años 80-90 - b2cd10f8f9b085f1f1e5eee77d1ccc1a","width":5051,"height":3367,"bytes":2340872,"color":"#727272","placeholder":"data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAABwAQCdASoQAAsAA4BaJaQAAWJ2gAD+0N58pWaV29u3KE1rVcXOKoZFfql4OeNEcAA=","thumb":"/optimized/06c692abfd6926dd-320.webp","srcSet":{"webp":"/optimized/06c692abfd6926dd-320.webp 320w, /optimized/06c692abfd6926dd-640.webp 640w, /optimized/06c692abfd6926dd-960.webp 960w, /optimized/06c692abfd6926dd-1280.webp 1280w","avif":"/optimized/06c692abfd6926dd-320.avif 320w, /optimized/06c692abfd6926dd-640.avif 640w, /optimized/06c692abfd6926dd-960.avif 960w, /optimized/06c692abfd6926dd-1280.avif 1280w"}},
+    {"src":"/assets/d81778938e9f8c0d.jpg","alt":"Años 80-90 - c0356791d4adeb898ded21b556127d4d","width":600,"height":358,"bytes":44047,"color":"#9a9a9a","placeholder":"data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACQAQCdASoQAAoAA4BaJaQAAuV+cwAA/lvwbMTaeNfxGMkUKMoXAAAA","thumb":"/optimized/d81778938e9f8c0d-320.webp","srcSet":{"webp":"/optimized/d81778938e9f8c0d-320.webp 320w, /optimized/d81778938e9f8c0d-600.webp 600w","avif":"/optimized/d81778938e9f8c0d-320.avif 320w, /optimized/d81778938e9f8c0d-600.avif 600w"}},
+    {"src":"/assets/a13712608922b10a.jpg","alt":"Años 80-90 - csm_Las_Canteras_02_7cac71214f","width":600,"height":400,"bytes":64032,"color":"#6d90a0","placeholder":"data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAwAgCdASoQAAsAA4BaJagCdAECl3gHfnB1EAD1uGFLnvFMy493I7WaQogk0hYEzr0PMpfxgwDsy0TPAAA=","thumb":"/optimized/a13712608922b10a-320.webp","srcSet":{"webp":"/optimized/a13712608922b10a-320.webp 320w, /optimized/a13712608922b10a-600.webp 600w","avif":"/optimized/a13712608922b10a-320.avif 320w, /optimized/a13712608922b10a-600.avif 600w"}},
+    {"src":"/assets/c06d372ca8545396.jpg","alt":"Años 80-90 - espana_islas_canarias_las_palmas_las_palmas_de_gran_canaria_0066","width":650,"height":460,"bytes":83284,"color":"#a1a493","placeholder":"data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAADwAQCdASoQAAsAA4BaJYgCdAENoF9GLTAA/utqGFBpdPEVMfkU6WByjG9+KqwEXFatQGAAAAA=","thumb":"/optimized/c06d372ca8545396-320.webp","srcSet":{"webp":"/optimized/c06d372ca8545396-320.webp 320w, /optimized/c06d372ca8545396-640.webp 640w, /optimized/c06d372ca8545396-650.webp 650w","avif":"/optimized/c06d372ca8545396-320.avif 320w, /optimized/c06d372ca8545396-640.avif 640w, /optimized/c06d372ca8545396-650.avif 650w"}},
+];
+const fotos4: Foto[] = [
+    {"src":"/assets/f32c8dd9a7d6695b.jpg","alt":"Actualidad - 1366185720","width":600,"height":300,"bytes":44361,"color":"#90989d","placeholder":"data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADwAQCdASoQAAgAA4BaJZQC7AEPDH5ZbQAA/tUOu2C4jnDbIMtOuBAIVFqHBANAAAA=","thumb":"/optimized/f32c8dd9a7d6695b-320.webp","srcSet":{"webp":"/optimized/f32c8dd9a7d6695b-320.webp 320w, /optimized/f32c8dd9a7d6695b-600.webp 600w","avif":"/optimized/f32c8dd9a7d6695b-320.avif 320w, /optimized/f32c8dd9a7d6695b-600.avif 600w"}},
+    {"src":"/assets/e6bcf5916d4635a0.jpg","alt":"Actualidad - 9be12fc3-39ae-43ea-ae24-03342b00bde1_twitter-watermarked-aspect-ratio_default_0","width":1200,"height":628,"bytes":129169,"color":"#929090","placeholder":"data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAADQAQCdASoQAAgAA4BaJZQAAloC0iUKIAD+W8n6p9b1l+CtLmPpmTytQoAAAA==","thumb":"/optimized/e6bcf5916d4635a0-320.webp","srcSet":{"webp":"/optimized/e6bcf5916d4635a0-320.webp 320w, /optimized/e6bcf5916d4635a0-640.webp 640w, /optimized/e6bcf5916d4635a0-960.webp 960w, /optimized/e6bcf5916d4635a0-1200.webp 1200w","avif":"/optimized/e6bcf5916d4635a0-320.avif 320w, /optimized/e6bcf5916d4635a0-640.avif 640w, /optimized/e6bcf5916d4635a0-960.avif 960w, /optimized/e6bcf5916d4635a0-1200.avif 1200w"}},
+    {"src":"/assets/f7a0f63309bf87e6.jpg","alt":"Actualidad - Guanarteme-1","width":720,"height":577,"bytes":112164,"color":"#5e738d","placeholder":"data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAwAgCdASoQAA0AA4BaJagCdH8AGDK7Kpp3sAD8im5i0g6SIJA7oOPDItsTHQ+/UxXr/x0irFBENDnmAAA=","thumb":"/optimized/f7a0f63309bf87e6-320.webp","srcSet":{"webp":"/optimized/f7a0f63309bf87e6-320.webp 320w, /optimized/f7a0f63309bf87e6-640.webp 640w, /optimized/f7a0f63309bf87e6-720.webp 720w","avif":"/optimized/f7a0f63309bf87e6-320.avif 320w, /optimized/f7a0f63309bf87e6-640.avif 640w, /optimized/f7a0f63309bf87e6-720.avif 720w"}},
+    {"src":"/assets/a13712608922b10a.jpg","alt":"Actualidad - csm_Las_Canteras_02_7cac71214f","width":600,"height":400,"bytes":64032,"color":"#6d90a0","placeholder":"data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAwAgCdASoQAAsAA4BaJagCdAECl3gHfnB1EAD1uGFLnvFMy493I7WaQogk0hYEzr0PMpfxgwDsy0TPAAA=","thumb":"/optimized/a13712608922b10a-320.webp","srcSet":{"webp":"/optimized/a13712608922b10a-320.webp 320w, /optimized/a13712608922b10a-600.webp 600w","avif":"/optimized/a13712608922b10a-320.avif 320w, /optimized/a13712608922b10a-600.avif 600w"}},
+];
+const fotos5: Foto[] = [
+];
+const fotos6: Foto[] = [
+];
+const fotos7: Foto[] = [
+];
+
+export const categorias: Categoria[] = [
+    { name: "Los Giles", color: "from-rose-500 to-red-500", count: 3, cover: fotos0[0], photos: fotos0 },
+    { name: "Años 40-50", color: "from-amber-400 to-orange-500", count: 4, cover: fotos1[0], photos: fotos1 },
+    { name: "Años 60-70", color: "from-teal-400 to-cyan-500", count: 4, cover: fotos2[0], photos: fotos2 },
+    { name: "Años 80-90", color: "from-blue-400 to-indigo-500", count: 5, cover: fotos3[0], photos: fotos3 },
+    { name: "Actualidad", color: "from-purple-400 to-fuchsia-500", count: 4, cover: fotos4[0], photos: fotos4 },
+    { name: "Casa Ayala", color: "from-slate-500 to-slate-700", count: 0, cover: null, photos: fotos5 },
+    { name: "Costa Ayala", color: "from-slate-500 to-slate-700", count: 0, cover: null, photos: fotos6 },
+    { name: "Ladera Alta", color: "from-slate-500 to-slate-700", count: 0, cover: null, photos: fotos7 },
+];
+
+export const proximamente = "Casa Ayala, Costa Ayala y Ladera Alta";
+
+export const plan = { sizes: {"cover":"(min-width: 1152px) 270px, (min-width: 1024px) 25vw, (min-width: 768px) 50vw, 100vw","grid":"(min-width: 1152px) 340px, (min-width: 768px) 33vw, (min-width: 640px) 50vw, 100vw","lightbox":"100vw"}, prefetch: 1 };
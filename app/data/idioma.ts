@@ -0,0 +1,5 @@
+// Generado por pipeline/i18n.py desde pipeline/i18n.py. No editar a mano.
+
+export const idioma = "es";
+
+export const idiomas = [{"codigo": "es", "nombre": "Español", "href": "/"}, {"codigo": "en", "nombre": "English", "href": "/en"}];
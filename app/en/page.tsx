@@ -0,0 +1,11 @@
+// Generado por pipeline/i18n.py desde app/page.tsx. No editar a mano.
+import Portal from '../components/en/Portal';
+import AutorTab from '../tabs/en/AutorTab';
+import NoticiasTab from '../tabs/en/NoticiasTab';
+import ProyectoTab from '../tabs/en/ProyectoTab';
+
+// Server component: the static tabs render here with no client JS or hydration cost;
+// the interactive ones are code-split inside Portal.
+export default function Home() {
+    return <Portal autor={<AutorTab />} proyecto={<ProyectoTab />} noticias={<NoticiasTab />} />;
+}
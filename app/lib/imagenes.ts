@@ -0,0 +1,35 @@
+// Precarga de las fotos vecinas del visor de la galería (ver el plan en app/data/gallery.ts).
+// Se pide la misma variante que elegirá el <picture> del visor: mismo formato y mismo sizes,
+// así que al pasar de foto la imagen ya está en la caché del navegador.
+
+import type { Foto } from '../data/gallery';
+
+// AVIF de 1x1 px: si el navegador lo decodifica, los <picture> usarán la fuente AVIF.
+const AVIF_1PX =
+    'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAADrbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAAB5pbG9jAAAAAEQAAAEAAQAAAAEAAAETAAAAIAAAAChpaW5mAAAAAAABAAAAGmluZmUCAAAAAAEAAGF2MDFDb2xvcgAAAABqaXBycAAAAEtpcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAABdpcG1hAAAAAAAAAAEAAQQBAoMEAAAAKG1kYXQSAAoIGAAGiAhoNCAyEh7Hh4VZ3///4sAAAJA1jjx+rQ==';
+
+let formato: Promise<string> | null = null;
+const precargadas = new Set<string>();
+
+export function formatoPreferido(): Promise<string> {
+    if (!formato) {
+        formato = new Promise((resolve) => {
+            const img = new Image();
+            img.onload = () => resolve(img.width > 0 ? 'avif' : 'webp');
+            img.onerror = () => resolve('webp');
+            img.src = AVIF_1PX;
+        });
+    }
+    return formato;
+}
+
+export async function precargar(foto: Foto, sizes: string): Promise<void> {
+    const fmt = await formatoPreferido();
+    const srcSet = foto.srcSet[fmt] ?? foto.srcSet.webp;
+    if (!srcSet || precargadas.has(srcSet)) return;
+    precargadas.add(srcSet);
+    // sizes antes que srcset: la variante se elige al asignar srcset.
+    const img = new Image();
+    img.sizes = sizes;
+    img.srcset = srcSet;
+}
@@ -0,0 +1,76 @@
+// Cliente del índice estático que genera pipeline/search.py en public/search (español) y
+// public/search/<idioma> (el resto de idiomas, compilados por pipeline/i18n.py).
+// normalize() y stem() replican las funciones de Python: si cambian allí, cambiarlas aquí
+// y subir STEMMER_VERSION en ambos lados.
+
+export type Resultado = { tab: string; title: string; snippet: string };
+
+type Meta = {
+    version: number;
+    shardChars: number;
+    docsPerChunk: number;
+    shards: string[];
+    stopwords: string[];
+};
+
+const STEMMER_VERSION = 1;
+
+const cache = new Map<string, Promise<any>>();
+
+function load<T>(idioma: string, name: string): Promise<T> {
+    const url = idioma === 'es' ? `/search/${name}.json` : `/search/${idioma}/${name}.json`;
+    if (!cache.has(url)) {
+        cache.set(url, fetch(url).then((res) => res.json()));
+    }
+    return cache.get(url)!;
+}
+
+export function normalize(text: string): string[] {
+    return text.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) ?? [];
+}
+
+export function stem(token: string): string {
+    if (/^\d+$/.test(token)) return token;
+    if (token.length > 4 && token.endsWith('es') && !'aeiou'.includes(token[token.length - 3])) {
+        token = token.slice(0, -2);
+    } else if (token.length > 3 && token.endsWith('s')) {
+        token = token.slice(0, -1);
+    }
+    if (token.length > 3 && 'aeo'.includes(token[token.length - 1])) {
+        token = token.slice(0, -1);
+    }
+    return token;
+}
+
+// Devuelve los documentos que contienen más términos de la consulta; el último término
+// se busca por prefijo para que los resultados aparezcan mientras se escribe.
+export async function search(query: string, idioma = 'es', limit = 10): Promise<Resultado[]> {
+    if (!normalize(query).length) return [];
+    const meta = await load<Meta>(idioma, 'meta');
+    if (meta.version !== STEMMER_VERSION) return [];
+
+    const stopwords = new Set(meta.stopwords);
+    const tokens = normalize(query).filter((t) => t.length >= meta.shardChars && !stopwords.has(t));
+    const scores = new Map<number, number>();
+
+    await Promise.all(tokens.map(async (token, i) => {
+        const term = stem(token);
+        const prefix = term.slice(0, meta.shardChars);
+        if (!meta.shards.includes(prefix)) return;
+        const shard = await load<Record<string, number[]>>(idioma, prefix);
+        const isLast = i === tokens.length - 1;
+        const matched = new Set<number>();
+        for (const [candidate, docs] of Object.entries(shard)) {
+            if (candidate === term || (isLast && candidate.startsWith(term))) {
+                docs.forEach((doc) => matched.add(doc));
+            }
+        }
+        matched.forEach((doc) => scores.set(doc, (scores.get(doc) ?? 0) + 1));
+    }));
+
+    const ranked = Array.from(scores).sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, limit);
+    return Promise.all(ranked.map(async ([doc]) => {
+        const chunk = await load<Resultado[]>(idioma, `docs-${Math.floor(doc / meta.docsPerChunk)}`);
+        return chunk[doc % meta.docsPerChunk];
+    }));
+}
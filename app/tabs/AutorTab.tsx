@@ -0,0 +1,129 @@
+// Tab 1: Origen del Autor y Guanarteme
+export default function AutorTab() {
+    return (
+        <div className="space-y-20 pb-20">
+            {/* Hero Section */}
+            <section className="relative min-h-[70vh] sm:min-h-[85vh] flex items-center justify-center overflow-hidden">
+                <picture>
+                    <source type="image/avif" srcSet="/optimized/ba0b230547e2e1f7-320.avif 320w, /optimized/ba0b230547e2e1f7-567.avif 567w" sizes="100vw" />
+                    <source type="image/webp" srcSet="/optimized/ba0b230547e2e1f7-320.webp 320w, /optimized/ba0b230547e2e1f7-567.webp 567w" sizes="100vw" />
+                    <img src="/optimized/ba0b230547e2e1f7-320.webp" alt="" aria-hidden="true" className="absolute inset-0 w-full h-full object-cover opacity-20 filter grayscale blur-sm" width={567} height={850} decoding="async" style={{ backgroundColor: '#a8a19e', backgroundImage: 'url(data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACQAwCdASoQABgAPu1iqU2ppaOiMAgBMB2JQBWAAUgy9YVM/Y4YAP7WJpB9VLxd6JjFkR/9wmJUo2IGLdPx1CprVbhrlIT3pCTSwAAA)', backgroundSize: 'cover' }} />
+                </picture>
+                <div className="absolute inset-0 bg-gradient-to-t from-slate-900 via-slate-900/90 to-slate-900/60 z-10"></div>
+
+                <div className="container mx-auto px-4 relative z-20 gap-6 md:gap-12 items-center flex flex-col pt-8 md:pt-12">
+                    <div className="text-center space-y-4 md:space-y-6 mx-auto w-full px-2 sm:px-0">
+                        <h1
+                            data-anim="title"
+                            className="text-3xl min-[390px]:text-4xl min-[500px]:text-5xl sm:text-7xl md:text-9xl font-black text-transparent bg-clip-text bg-gradient-to-br from-amber-200 via-orange-400 to-amber-600 tracking-tighter drop-shadow-2xl leading-none"
+                        >
+                            GUANARTEME
+                        </h1>
+                        <h2 className="text-xl min-[375px]:text-2xl sm:text-3xl md:text-5xl text-amber-300/80 font-serif italic tracking-tight sm:tracking-wide">
+                            por Leandro Perdomo
+                        </h2>
+
+                        <div
+                            data-anim="subtitle"
+                            className="inline-block w-full sm:w-auto mt-4 md:mt-8 border border-amber-500/30 bg-slate-900/60 backdrop-blur-md p-4 sm:p-6 rounded-2xl shadow-xl shadow-amber-900/20 mx-auto"
+                        >
+                            <p className="text-amber-500 font-bold uppercase tracking-wider sm:tracking-widest md:tracking-[0.3em] text-[10px] sm:text-xs md:text-sm mb-2 sm:mb-3">Publicado en Falange: 5-5-1954</p>
+                            <p className="text-base sm:text-xl md:text-2xl text-slate-300 font-light leading-relaxed text-center italic">
+                                "Guanarteme es, sencillamente, el barrio más importante que tiene la ciudad. Más que barrio, prolongación, proyección del apretado casco porteño."
+                            </p>
+                        </div>
+                    </div>
+                </div>
+            </section>
+
+            {/* Artículo Section */}
+            <section className="fade-in-section relative z-30 -mt-20">
+                <div className="max-w-4xl mx-auto">
+                    <div className="bg-slate-800/80 backdrop-blur-xl p-8 md:p-16 rounded-[2.5rem] border border-slate-700/50 shadow-2xl relative">
+                        {/* Quotes decoration */}
+                        <div className="absolute top-10 left-8 md:left-12 text-6xl text-amber-500/20 font-serif">"</div>
+
+                        <div className="space-y-8 text-lg md:text-xl text-slate-300 leading-[1.8] text-justify font-serif relative z-10">
+
+                            <p className="drop-cap first-letter:text-6xl first-letter:font-bold first-letter:text-amber-400 first-letter:mr-3 first-letter:float-left">
+                                Arenas solitarias, movedizas; arenas blancas, rubias, con reminiscencias africanas y fallidos deseos de playa y monte, esas arenas que enmarcan el populoso barrio industrial. Ni playa, con sus bañistas, ni verde monte. Guanarteme es, sencillamente, el barrio más importante que tiene la ciudad. Más que barrio, prolongación, proyección del apretado casco porteño. No tiene historia. Una casa humilde, y otra luego y otra; hasta que empezaron las fábricas a empinar sus chimeneas, las factorías a aventar sus nauseabundos olores y la Cicer a ennegrecer las albas arenas que quisieron ser playa. Cuando la proyectada Avenida Marítima alcance el término marcado, remontado Italcable, Guanarteme al fin quedará incorporado a la categoría estival que ostenta las Canteras; pero sus contornos marinos habrán de ser ciertamente remozados, higiénicamente removidos. Esto todos lo saben. Y eso se verá, dentro de años.
+                            </p>
+
+                            <p>
+                                Guanarteme, simplemente, es un barrio de trabajadores, de obreros, de pobres. No tiene de qué jactarse. Fue declarado zona industrial y allí se admiten toda clase de ruidos y olores. Casas, muchas casas terreras con cabra y gallinero en lo alto, calles polvorientas y muchas fábricas, una iglesia, un "cine" y un cementerio. Eso es Guanarteme, sin un árbol; un pueblo que no tiene tradición y sí bares y tiendas a porfía. Tiene, también, un barranco sucio y seco, con su fuente, y sus perros vagabundos aullando en las orillas.
+                            </p>
+
+                            <div className="py-6 flex justify-center">
+                                <div className="h-px w-24 bg-gradient-to-r from-transparent via-amber-500/50 to-transparent"></div>
+                            </div>
+
+                            <p>
+                                Guanarteme, que es hoy lo que es y nada más, tuvo al futuro apuñado en su mano. La aviación tardó y la gran estación aérea de la isla, que debió nacer junto al mar y junto a la ciudad, fue desplazada hacia el sur, a muchos kilómetros. Porque el primer avión que tomó tierra insular lo hizo en Guanarteme. Allí, y como queriendo eternizar la memoria, fue pronunciada la palabra magnífica que yo no sé, no me lo explico, como no ha sido incorporada al léxico militar en su más genuina expresión de mando. Fue Gabino, cabo veterano en funciones de guardia municipal, quien lanzó a los cuatro vientos el magnífico vocablo.
+                            </p>
+
+                            <div className="bg-slate-900/50 p-8 rounded-2xl border-l-4 border-amber-500 text-amber-100 my-8 italic text-xl">
+                                El artefacto (parece) se acercaba bajo, muy bajo y ya el público iba a dispersarse sintiendo el temor, cuando Gabino, adelantándose a los grupos, impuso el orden y la tranquilidad con su tajante: <strong className="text-amber-400 font-bold block mt-2 text-2xl">¡Atórrense!</strong>
+                            </div>
+
+                            <p>
+                                Como obedeciendo a una orden suprema, autoridades y público quedaron al instante "cuerpo a tierra", y allí no ha pasado nada. Yo no sé, no me lo explico, como esta vieja y arcaica expresión, no ha sido sustituida por el tajante "atórrense" de Gabino, cabo veterano en funciones de guardia municipal que debió ser, sin demora, ascendido por lo menos a Sargento y que murió, ya anciano, de simple guardia.
+                            </p>
+
+                            <p>
+                                La barriada de Guanarteme tiene una peculiar fisonomía. No es como otros barrios, también pobres, donde lo vulgar por lo bajo impera. Guanarteme, que no tiene historia ni pasado, tiene su orgullo. Con sus calles sin asfaltos, con su barranco yerto y sus fuentes sin agua, resiste al tiempo y espera, porque sabe de su importancia económica. Ya el solar, que hasta hace unos años se regalaba casi, cotiza cifras parejas a céntricos sectores de la urbe.
+                            </p>
+
+                            <p>
+                                Guanarteme es más bien rústico que marinero. Algún pescador de caña y algún vendedor de pescado son sus aficiones a la mar. En cambio cabreros, tratantes en bestias y negociantes en cereales y otros productos agrícolas, sobresalen en la mixta etnografía del barrio. Familias enteras, emigradas de Lanzarote y Fuerteventura, en los diversos tiempos fueron cimentando la actual fisonomía. Por eso Guanarteme guarda en su inquietud ciudadana y comercial el aliento sencillo del alma campesina. Allí, el timple suena con el runruneo elemental del viento montañero, y la guitarra, nostálgica de eras y vendimias, evoca en los portales los apacibles días de sol y las noches estrelladas del campo abierto. Una folía en Guanarteme suena a campo, a montaña, a volcán, a cielo y tierra fecunda. La folía que canta el roncote es distinta completamente.
+                            </p>
+
+                            <div className="py-6 flex justify-center">
+                                <div className="h-px w-24 bg-gradient-to-r from-transparent via-amber-500/50 to-transparent"></div>
+                            </div>
+
+                            <p>
+                                Residuos de un hacer campesino, el oficio de carrero. En Guanarteme hay muchos carros. Rodando por la ciudad, en medio del motorizado devaneo, el carro de Guanarteme es yunta que ara o al menos así debe parecerle al carrero, nieto de aquel rudo labrador emigrado, que labró la tierra en Lanzarote y Fuerteventura, y que seguramente, nunca tuvo burro ni vacas ni camello.
+                            </p>
+
+                            <p>
+                                En Guanarteme también hay camellos. Los camellos vienen en el correíllo, de África, saltan por Santa Catalina y van a parar a Guanarteme. De aquí los camellos son llevados por tratantes expertos a las islas menores, de donde muchos, ya viejos y quizás enfermos, hacen su último viaje: el de la batata. Y aquí éstos viejos dromedarios vencidos se quedan, vendidos unos, tratados otros, siempre con ventaja. Pero a más de todas estas cosas (barranco, fábricas, carros, tratantes, burros, camello...) para comprender bien a Guanarteme hay que sacarle la baraja.
+                            </p>
+
+                            <p>
+                                Guanarteme -lo ha sido siempre— es un barrio barajero. Gitanos y gitanas, que no se sabe de dónde vienen, en Guanarteme dan con los huesos, y allí echan la baraja. También, la baraja, la tallan otros que no son gitanos. El clásico envite, el subastado y la sanga —y otros juegos— hicieron del pobre Cristóbal un hombre infeliz. Pero Cristóbal, que fue rico varias veces, decía de Guanarteme que era estupendo, único sitio en Canarias donde se jugaba con ley, "a suerte y verdad", sin trampas, sin chanchullos. Mas... que el pobre Cristóbal dijo esto ya va para veinte años. Y el pobre Cristóbal murió escurrido.
+                            </p>
+
+                            <p>
+                                ¿Hay algo más, acaso, que se pueda decir de Guanarteme?.. Yo lo pongo en duda. Puedo decir que me he paseado por Guanarteme a cualquier hora de la noche y he visto, sí, un pueblo que duerme a pierna suelta y cuyo músculo exhausto descansa confiado en la fuerza única del viejo sereno; y éste, también, como conoce a su gente cuando le llegan las ganas se encapota... naturalmente, descabeza un sueñito.
+                            </p>
+
+                            <p className="text-2xl font-semibold text-amber-300 mt-12 pb-8 border-b border-slate-700">
+                                Ojalá fueran todos los barrios, de noche y de día, como este barrio porteño, que pudo ser espléndido aeródromo y es lo que es: el barrio más importante, más sano, más laborioso y más tranquilo de la urbe...
+                            </p>
+
+                            <div className="mt-8 flex items-center justify-between">
+                                <div className="flex items-center gap-4">
+                                    <div className="w-16 h-16 rounded-full overflow-hidden border-2 border-amber-500/50 relative">
+                                        <picture>
+                                            <source type="image/avif" srcSet="/optimized/1a5e1bc89b4f72b9-320.avif 320w, /optimized/1a5e1bc89b4f72b9-447.avif 447w" sizes="64px" />
+                                            <source type="image/webp" srcSet="/optimized/1a5e1bc89b4f72b9-320.webp 320w, /optimized/1a5e1bc89b4f72b9-447.webp 447w" sizes="64px" />
+                                            <img src="/optimized/1a5e1bc89b4f72b9-320.webp" alt="Leandro Perdomo" loading="lazy" className="w-full h-full object-cover" width={447} height={646} decoding="async" style={{ backgroundColor: '#646052', backgroundImage: 'url(data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQBACdASoQABcAPu1kqk2ppaQiMAgBMB2JYwCsAB9IdTO4l1dnZhQRqADfcSrdR6Vus6lOn9rG6InqJ0gZKkinZPcGH23WLAN7esO5TuNMEt/hJnh9itdV+TiLxUIctZbRcZ0bwo86HiBl5QAAAA==)', backgroundSize: 'cover' }} />
+                                        </picture>
+                                    </div>
+                                    <div>
+                                        <p className="text-amber-400 font-bold">Leandro Perdomo</p>
+                                        <p className="text-slate-500 text-sm">Cronista de Canarias</p>
+                                    </div>
+                                </div>
+                                <div className="text-right">
+                                    <p className="text-slate-400 italic">5 de mayo de 1954</p>
+                                    <p className="text-slate-500 text-sm font-bold tracking-widest uppercase">FALANGE</p>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </section>
+        </div>
+    );
+}
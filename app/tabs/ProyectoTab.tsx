@@ -0,0 +1,134 @@
+// Tab 2: Proyecto - Recuperación de la memoria de Guanarteme
+export default function ProyectoTab() {
+    return (
+        <div className="space-y-16 py-12">
+            <section className="fade-in-section">
+                <div className="max-w-5xl mx-auto">
+                    <h2 className="text-4xl md:text-5xl font-bold text-amber-300 mb-8 text-center leading-tight">
+                        De atrás pa' lante: Cultura e identidades en los centros escolares de Canarias
+                    </h2>
+
+                    <div className="bg-slate-800/50 backdrop-blur-sm p-10 rounded-2xl border border-slate-700/50 mb-12">
+                        <div className="space-y-6 text-slate-300 text-lg leading-relaxed">
+                            <p className="text-justify">
+                                El 19 de marzo de 2025 el arqueólogo <strong className="text-amber-300">José de León Hernández</strong> (exdirector del proyecto de Patrimonio Mundial de Risco Caído y las Montañas Sagradas de Gran Canaria) visitó nuestro centro, dentro del marco del proyecto <em>De atrás pa' lante. Cultura e identidades en los centros escolares de Canarias</em>.
+                            </p>
+                            <p className="text-justify">
+                                Dicha actividad nos sirvió como inicio, motor y fundación para nuestro programa patrimonial de centro. Nuestro objetivo es poner en valor el patrimonio material e inmaterial que rodea a nuestro instituto y del cual procede la gran mayoría de nuestro alumnado (Guanarteme, Costa Ayala, Casa Ayala, Ladera Alta, Los Giles y las zonas aledañas a los barrancos de La Ballena y El Rincón). Teniendo como actividad estrella una réplica de la actividad realizada por José De León en el año 2025 que explicaremos a continuación.
+                            </p>
+                            <p className="text-justify">
+                                Se busca que nuestro alumnado sea plenamente consciente de su pasado más cercano y de cómo le condiciona en la actualidad para crecer como individuos y sociedad activa y crítica que valora todo lo relativo a la cuestión patrimonial tanto natural como cultural e histórica. Por ello, hemos decidido crear está página web entre otras cuestiones que nos sirve como eje vertebrador de nuestra propuesta y en la cual creceremos en este sentido. Asimismo estamos elaborando otras herramientas que complementan al proyecto.
+                            </p>
+                        </div>
+                    </div>
+
+                    <div className="bg-gradient-to-br from-cyan-950/40 to-blue-900/30 backdrop-blur-sm p-10 rounded-2xl border border-cyan-700/30">
+                        <h4 className="text-3xl font-bold text-cyan-300 mb-6 font-serif italic">La Actividad Estrella</h4>
+                        <div className="space-y-6 text-slate-300 text-lg leading-relaxed">
+                            <p className="text-justify">
+                                Solamente para que se entienda exponemos a continuación la actividad realizada por José de León junto a distintos profesores y alumnado de centro en el curso 2024/2025 y que pretendemos volver a replicar en cursos venideros, adaptándonos al contexto de cada grupo clase y alumnado que participe:
+                            </p>
+                            <p className="text-justify">
+                                La actividad constó de dos partes. Una primera donde José de León realizó una <strong className="text-cyan-400">ponencia en el salón de actos</strong> del centro con todos los grupos implicados (De 8:00 a 9:00 horas). El arqueólogo explicó, partiendo de lo general para llegar a lo concreto, la historia y cultura de Canarias y su aplicación en el entorno del centro.
+                            </p>
+                            <p className="text-justify">
+                                En la segunda parte, sobre las 9:00 de la mañana, se realizó una <strong className="text-cyan-400">salida de campo</strong> que llevó al alumnado por el Barranco de Guanarteme, en las cercanías del instituto, hasta la explanada que queda justo debajo del barrio de Los Giles. En ella se explicó en detalle cuestiones de tipo histórico, etnográfico, geológico, ecológico y cultural conectadas con la realidad de dicho barranco, el barrio de Guanarteme, la ciudad de Las Palmas de Gran Canaria o el barrio de Los Giles.
+                            </p>
+                        </div>
+                    </div>
+                </div>
+            </section>
+
+            {/* Participación */}
+            <section className="fade-in-section pb-12">
+                <div className="max-w-5xl mx-auto">
+                    <h3 className="text-3xl font-bold text-amber-300 mb-8 text-center">Un Enfoque Interdisciplinar</h3>
+                    <p className="text-slate-300 text-lg text-center mb-10">
+                        Esta actividad se enmarca en un proyecto financiado por el Gobierno de Canarias que ha contado con la participación de la <strong className="text-amber-300">Coordinación de Patrimonio del IES El Rincón</strong>, además de distintas materias y grupos. La actividad fue de naturaleza interdisciplinar, trabajándose en las semanas previas y posteriores a la salida con el arqueólogo.
+                    </p>
+
+                    <div className="grid md:grid-cols-2 gap-8">
+                        {/* Grupos */}
+                        <div className="bg-slate-800/40 p-8 rounded-2xl border border-amber-500/20 h-full flex flex-col">
+                            <div>
+                                <h4 className="flex items-center gap-3 text-2xl font-bold text-amber-400 mb-6">
+                                    <span className="w-8 h-8 rounded-full bg-amber-500/20 flex items-center justify-center text-amber-300">👥</span>
+                                    Grupos Implicados
+                                </h4>
+                                <ul className="space-y-3 text-lg text-slate-300 font-medium mb-10">
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 1º Bachillerato A</li>
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3º ESO B</li>
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3º ESO C</li>
+                                </ul>
+                            </div>
+
+                            {/* Image Placeholders */}
+                            <div className="mt-auto flex flex-col gap-4 flex-1 pt-4">
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span>
+                                    <span className="text-slate-500 font-medium text-sm text-center">Foto 1º Bachillerato A<br /><span className="text-xs font-light opacity-70">(Próximamente)</span></span>
+                                </div>
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span>
+                                    <span className="text-slate-500 font-medium text-sm text-center">Foto 3º ESO B<br /><span className="text-xs font-light opacity-70">(Próximamente)</span></span>
+                                </div>
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span>
+                                    <span className="text-slate-500 font-medium text-sm text-center">Foto 3º ESO C<br /><span className="text-xs font-light opacity-70">(Próximamente)</span></span>
+                                </div>
+                            </div>
+                        </div>
+
+                        {/* Materias */}
+                        <div className="space-y-6">
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-cyan-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-cyan-300 mb-3">Geografía e Historia (3º ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    La historia de la economía en Canarias desde el mundo previo a la llegada de los Europeos hasta la actualidad, además de su vinculación con el entorno cercano al centro.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-cyan-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-cyan-300 mb-3">Historia de Canarias (3º ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    Visión general a nivel geográfico, natural, histórico y cultural de Canarias como contexto teórico y práctico para la actividad.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-amber-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-amber-300 mb-3">Matemáticas (3º ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    Cálculo y predicción de la subida del precio del alquiler durante el siglo XXI y sus posibles precios en el futuro si se mantuviera esta dinámica en el barrio de Guanarteme.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-purple-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-purple-300 mb-3">Inglés (3º ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    Presencia de la huella británica en Canarias a través de la historia y la lengua. Análisis de palabras de origen anglosajón usadas en la actualidad.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-pink-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-pink-300 mb-3">Música (3º ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    Creación y aplicación de instrumentos de percusión de origen humilde que usó la población canaria en el pasado. Especial mención a las castañetas (dos conchas de lapas).
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-green-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-green-300 mb-3">Biología, Geología y Ciencias Ambientales (1º Bach)</h4>
+                                <ul className="text-slate-400 text-base leading-relaxed space-y-2 list-disc list-inside">
+                                    <li>Identificación de formaciones geológicas, procesos erosivos y la influencia humana.</li>
+                                    <li>Reflexión sobre la biodiversidad del barranco.</li>
+                                    <li>Observación del impacto de la ocupación del territorio y vertidos.</li>
+                                    <li>Fomento de la conciencia sobre conservación sostenible y cambio climático.</li>
+                                </ul>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </section>
+        </div>
+    );
+}
@@ -0,0 +1,130 @@
+// Generado por pipeline/i18n.py desde app/tabs/AutorTab.tsx. No editar a mano.
+// Tab 1: Origen del Autor y Guanarteme
+export default function AutorTab() {
+    return (
+        <div className="space-y-20 pb-20">
+            {/* Hero Section */}
+            <section className="relative min-h-[70vh] sm:min-h-[85vh] flex items-center justify-center overflow-hidden">
+                <picture>
+                    <source type="image/avif" srcSet="/optimized/ba0b230547e2e1f7-320.avif 320w, /optimized/ba0b230547e2e1f7-567.avif 567w" sizes="100vw" />
+                    <source type="image/webp" srcSet="/optimized/ba0b230547e2e1f7-320.webp 320w, /optimized/ba0b230547e2e1f7-567.webp 567w" sizes="100vw" />
+                    <img src="/optimized/ba0b230547e2e1f7-320.webp" alt="" aria-hidden="true" className="absolute inset-0 w-full h-full object-cover opacity-20 filter grayscale blur-sm" width={567} height={850} decoding="async" style={{ backgroundColor: '#a8a19e', backgroundImage: 'url(data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACQAwCdASoQABgAPu1iqU2ppaOiMAgBMB2JQBWAAUgy9YVM/Y4YAP7WJpB9VLxd6JjFkR/9wmJUo2IGLdPx1CprVbhrlIT3pCTSwAAA)', backgroundSize: 'cover' }} />
+                </picture>
+                <div className="absolute inset-0 bg-gradient-to-t from-slate-900 via-slate-900/90 to-slate-900/60 z-10"></div>
+
+                <div className="container mx-auto px-4 relative z-20 gap-6 md:gap-12 items-center flex flex-col pt-8 md:pt-12">
+                    <div className="text-center space-y-4 md:space-y-6 mx-auto w-full px-2 sm:px-0">
+                        <h1
+                            data-anim="title"
+                            className="text-3xl min-[390px]:text-4xl min-[500px]:text-5xl sm:text-7xl md:text-9xl font-black text-transparent bg-clip-text bg-gradient-to-br from-amber-200 via-orange-400 to-amber-600 tracking-tighter drop-shadow-2xl leading-none"
+                        >
+                            GUANARTEME
+                        </h1>
+                        <h2 className="text-xl min-[375px]:text-2xl sm:text-3xl md:text-5xl text-amber-300/80 font-serif italic tracking-tight sm:tracking-wide">
+                            by Leandro Perdomo
+                        </h2>
+
+                        <div
+                            data-anim="subtitle"
+                            className="inline-block w-full sm:w-auto mt-4 md:mt-8 border border-amber-500/30 bg-slate-900/60 backdrop-blur-md p-4 sm:p-6 rounded-2xl shadow-xl shadow-amber-900/20 mx-auto"
+                        >
+                            <p className="text-amber-500 font-bold uppercase tracking-wider sm:tracking-widest md:tracking-[0.3em] text-[10px] sm:text-xs md:text-sm mb-2 sm:mb-3">Published in Falange: 5-5-1954</p>
+                            <p className="text-base sm:text-xl md:text-2xl text-slate-300 font-light leading-relaxed text-center italic">
+                                "Guanarteme is, quite simply, the most important neighbourhood the city has. More than a neighbourhood, it is an extension, a projection of the tightly packed port district."
+                            </p>
+                        </div>
+                    </div>
+                </div>
+            </section>
+
+            {/* Artículo Section */}
+            <section className="fade-in-section relative z-30 -mt-20">
+                <div className="max-w-4xl mx-auto">
+                    <div className="bg-slate-800/80 backdrop-blur-xl p-8 md:p-16 rounded-[2.5rem] border border-slate-700/50 shadow-2xl relative">
+                        {/* Quotes decoration */}
+                        <div className="absolute top-10 left-8 md:left-12 text-6xl text-amber-500/20 font-serif">"</div>
+
+                        <div className="space-y-8 text-lg md:text-xl text-slate-300 leading-[1.8] text-justify font-serif relative z-10">
+
+                            <p className="drop-cap first-letter:text-6xl first-letter:font-bold first-letter:text-amber-400 first-letter:mr-3 first-letter:float-left">
+                                Lonely, shifting sands; white, golden sands with African echoes and failed longings to be beach and hillside, the sands that frame this populous industrial neighbourhood. Neither beach, with its bathers, nor green hillside. Guanarteme is, quite simply, the most important neighbourhood the city has. More than a neighbourhood, it is an extension, a projection of the tightly packed port district. It has no history. One humble house, then another and another; until the factories began to raise their chimneys, the canneries to fan out their nauseating smells and the Cicer to blacken the white sands that wished to be a beach. When the planned Avenida Marítima reaches its intended end, past Italcable, Guanarteme will at last join the summer status that Las Canteras enjoys; but its seafront will certainly have to be refurbished and hygienically cleared. Everyone knows this. And it will be seen, years from now.
+                            </p>
+
+                            <p>
+                                Guanarteme is simply a neighbourhood of labourers, of workers, of the poor. It has nothing to boast about. It was declared an industrial zone and every kind of noise and smell is allowed there. Houses, many single-storey houses with a goat and a henhouse on the roof, dusty streets and many factories, a church, a "cinema" and a cemetery. That is Guanarteme, without a single tree; a village with no tradition but with bars and shops vying with one another. It also has a dirty, dry ravine, with its fountain, and its stray dogs howling along the banks.
+                            </p>
+
+                            <div className="py-6 flex justify-center">
+                                <div className="h-px w-24 bg-gradient-to-r from-transparent via-amber-500/50 to-transparent"></div>
+                            </div>
+
+                            <p>
+                                Guanarteme, which today is what it is and nothing more, once held the future in its fist. Aviation came late, and the island's great airport, which should have been born beside the sea and beside the city, was moved south, many kilometres away. For the first aeroplane to land on the island did so in Guanarteme. There, as if wishing to make the memory eternal, a magnificent word was uttered which, I do not know, I cannot explain why, has not been incorporated into the military lexicon in its most genuine expression of command. It was Gabino, a veteran corporal serving as a municipal guard, who cast the magnificent word to the four winds.
+                            </p>
+
+                            <div className="bg-slate-900/50 p-8 rounded-2xl border-l-4 border-amber-500 text-amber-100 my-8 italic text-xl">
+                                The machine (it seems) was coming in low, very low, and the crowd was about to scatter in fear when Gabino, stepping ahead of the groups, imposed order and calm with his curt: <strong className="text-amber-400 font-bold block mt-2 text-2xl">¡Atórrense!</strong>
+                            </div>
+
+                            <p>
+                                As if obeying a supreme order, authorities and public instantly hit the ground, and nothing happened there. I do not know, I cannot explain why this old and archaic expression has not been replaced by Gabino's curt "atórrense", a veteran corporal serving as a municipal guard who should have been promoted without delay to Sergeant at the very least, and who died, an old man, a mere guard.
+                            </p>
+
+                            <p>
+                                The district of Guanarteme has a peculiar character. It is not like other neighbourhoods, also poor, where vulgarity reigns. Guanarteme, which has neither history nor past, has its pride. With its unpaved streets, its stiff ravine and its waterless fountains, it resists time and waits, because it knows its economic importance. Building land, which until a few years ago was almost given away, now fetches prices on a par with the central districts of the city.
+                            </p>
+
+                            <p>
+                                Guanarteme is rustic rather than seafaring. The odd rod fisherman and the odd fishmonger are its only ties to the sea. Goatherds, livestock dealers and traders in grain and other farm produce, on the other hand, stand out in the neighbourhood's mixed ethnography. Whole families, emigrants from Lanzarote and Fuerteventura, laid down its present character over the years. That is why Guanarteme keeps, in its urban and commercial restlessness, the simple breath of the peasant soul. There the timple sounds with the elemental hum of the mountain wind, and the guitar, longing for threshing floors and grape harvests, evokes in the doorways the peaceful sunny days and starry nights of the open countryside. A folía in Guanarteme sounds of countryside, of mountain, of volcano, of sky and fertile earth. The folía the roncote sings is completely different.
+                            </p>
+
+                            <div className="py-6 flex justify-center">
+                                <div className="h-px w-24 bg-gradient-to-r from-transparent via-amber-500/50 to-transparent"></div>
+                            </div>
+
+                            <p>
+                                A remnant of peasant work: the trade of the carter. There are many carts in Guanarteme. Rolling through the city amid the motorised bustle, the Guanarteme cart is a yoke of oxen ploughing, or at least so it must seem to the carter, grandson of that rough emigrant farmer who tilled the land in Lanzarote and Fuerteventura and who surely never owned a donkey, cows or a camel.
+                            </p>
+
+                            <p>
+                                There are camels in Guanarteme too. The camels come from Africa on the mail boat, land at Santa Catalina and end up in Guanarteme. From here expert dealers take the camels to the smaller islands, from where many, already old and perhaps sick, make their last journey: the sweet-potato run. And here these old, defeated dromedaries stay, some sold, some traded, always at a profit. But beyond all these things (ravine, factories, carts, dealers, donkeys, camel...) to truly understand Guanarteme you have to bring out the cards.
+                            </p>
+
+                            <p>
+                                Guanarteme -it always has been— is a card-playing neighbourhood. Gypsy men and women, no one knows from where, end up in Guanarteme, and there they deal the cards. Others who are not gypsies deal them too. The classic envite, the subastado and the sanga —and other games— made poor Cristóbal an unhappy man. But Cristóbal, who was rich several times over, said of Guanarteme that it was splendid, the only place in the Canaries where the game was played fairly, "by luck and truth", without cheating, without tricks. But... poor Cristóbal said this nearly twenty years ago. And poor Cristóbal died penniless.
+                            </p>
+
+                            <p>
+                                Is there anything more, perhaps, that can be said of Guanarteme?.. I doubt it. I can say that I have walked through Guanarteme at every hour of the night and I have seen, yes, a village that sleeps soundly and whose exhausted muscle rests, trusting in the sole strength of the old night watchman; and he too, since he knows his people, when the mood takes him wraps himself in his cloak... and naturally nods off for a little nap.
+                            </p>
+
+                            <p className="text-2xl font-semibold text-amber-300 mt-12 pb-8 border-b border-slate-700">
+                                If only every neighbourhood were, by night and by day, like this port neighbourhood, which could have been a splendid aerodrome and is what it is: the most important, healthiest, most hard-working and most peaceful neighbourhood in the city...
+                            </p>
+
+                            <div className="mt-8 flex items-center justify-between">
+                                <div className="flex items-center gap-4">
+                                    <div className="w-16 h-16 rounded-full overflow-hidden border-2 border-amber-500/50 relative">
+                                        <picture>
+                                            <source type="image/avif" srcSet="/optimized/1a5e1bc89b4f72b9-320.avif 320w, /optimized/1a5e1bc89b4f72b9-447.avif 447w" sizes="64px" />
+                                            <source type="image/webp" srcSet="/optimized/1a5e1bc89b4f72b9-320.webp 320w, /optimized/1a5e1bc89b4f72b9-447.webp 447w" sizes="64px" />
+                                            <img src="/optimized/1a5e1bc89b4f72b9-320.webp" alt="Leandro Perdomo" loading="lazy" className="w-full h-full object-cover" width={447} height={646} decoding="async" style={{ backgroundColor: '#646052', backgroundImage: 'url(data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQBACdASoQABcAPu1kqk2ppaQiMAgBMB2JYwCsAB9IdTO4l1dnZhQRqADfcSrdR6Vus6lOn9rG6InqJ0gZKkinZPcGH23WLAN7esO5TuNMEt/hJnh9itdV+TiLxUIctZbRcZ0bwo86HiBl5QAAAA==)', backgroundSize: 'cover' }} />
+                                        </picture>
+                                    </div>
+                                    <div>
+                                        <p className="text-amber-400 font-bold">Leandro Perdomo</p>
+                                        <p className="text-slate-500 text-sm">Chronicler of the Canaries</p>
+                                    </div>
+                                </div>
+                                <div className="text-right">
+                                    <p className="text-slate-400 italic">5 May 1954</p>
+                                    <p className="text-slate-500 text-sm font-bold tracking-widest uppercase">FALANGE</p>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </section>
+        </div>
+    );
+}
@@ -0,0 +1,87 @@
+// Generado por pipeline/i18n.py desde app/tabs/CronogramaTab.tsx. No editar a mano.
+'use client';
+
+import { useEffect, useState } from 'react';
+import { siglos, type Evento } from '../../data/en/cronograma';
+
+// Tab 3: Cronograma Histórico
+export default function CronogramaTab() {
+    const [expandedIndex, setExpandedIndex] = useState<number | null>(null);
+    const [eventos, setEventos] = useState<Record<number, Evento[]>>({});
+
+    // Each century's events live in their own chunk and are fetched on first expand.
+    useEffect(() => {
+        if (expandedIndex === null || eventos[expandedIndex]) return;
+        const index = expandedIndex;
+        siglos[index].load().then((lista) => setEventos((prev) => ({ ...prev, [index]: lista })));
+    }, [expandedIndex, eventos]);
+
+    return (
+        <div className="max-w-5xl mx-auto space-y-10 py-12">
+            <div className="text-center mb-12">
+                <h2 className="text-4xl md:text-5xl font-bold text-amber-300 mb-4">
+                    Timeline of the settlement of the Barranco de Guanarteme and its surroundings
+                </h2>
+                <p className="text-slate-400 text-lg">Documented history from pre-Hispanic times to the present day</p>
+            </div>
+
+            {/* Century accordion timeline */}
+            <div className="relative">
+                {/* Vertical line */}
+                <div className="absolute left-6 top-0 bottom-0 w-0.5 bg-gradient-to-b from-stone-500 via-amber-500 via-teal-500 to-blue-500 opacity-50" />
+
+                <div className="space-y-6">
+                    {siglos.map((siglo, sIdx) => (
+                        <div key={sIdx} className="relative pl-16 fade-in-section">
+                            {/* Century dot */}
+                            <div className={`absolute left-2.5 top-5 w-7 h-7 rounded-full ${siglo.dot} border-4 border-slate-900 shadow-lg z-10`} />
+
+                            <div className="bg-slate-800/50 backdrop-blur-sm rounded-2xl border border-slate-700/50 hover:border-amber-500/40 transition-all duration-300 overflow-hidden">
+                                {/* Century header — clickable */}
+                                <button
+                                    className="w-full text-left px-8 py-5 flex items-center justify-between gap-4 group"
+                                    onClick={() => setExpandedIndex(expandedIndex === sIdx ? null : sIdx)}
+                                >
+                                    <div>
+                                        <span className={`inline-block text-2xl font-bold bg-gradient-to-r ${siglo.color} bg-clip-text text-transparent`}>
+                                            {siglo.label}
+                                        </span>
+                                        {siglo.subtitle && (
+                                            <span className="ml-3 text-slate-400 text-sm italic">{siglo.subtitle}</span>
+                                        )}
+                                        <p className="text-slate-500 text-sm mt-1">
+                                            {siglo.count === 1 ? <>1 event</> : <>{siglo.count} events</>}
+                                        </p>
+                                    </div>
+                                    <span className="text-amber-400 text-xl transition-transform duration-300 group-hover:scale-110">
+                                        {expandedIndex === sIdx ? '▼' : '▶'}
+                                    </span>
+                                </button>
+
+                                {/* Events list */}
+                                {expandedIndex === sIdx && (
+                                    <div className="px-8 pb-8 border-t border-slate-700/40 pt-6 space-y-5">
+                                        {(eventos[sIdx] ?? []).map((ev, eIdx) => (
+                                            <div key={eIdx} className="flex gap-5 items-start">
+                                                <span className="shrink-0 text-amber-400 font-bold text-sm w-24 pt-0.5">{ev.year}</span>
+                                                <p className="text-slate-300 text-base leading-relaxed text-justify">{ev.text}</p>
+                                            </div>
+                                        ))}
+                                    </div>
+                                )}
+                            </div>
+                        </div>
+                    ))}
+                </div>
+            </div>
+
+            {/* Summary Card */}
+            <div className="mt-16 bg-gradient-to-br from-slate-800/50 to-slate-900/50 backdrop-blur-sm p-10 rounded-2xl border border-amber-500/30">
+                <h3 className="text-3xl font-bold text-amber-300 mb-6 text-center">The Evolution of an Emblematic Area</h3>
+                <p className="text-slate-300 text-lg leading-relaxed text-center">
+                    From the first Aboriginal traces in the ravine to the drastic demographic, industrial and urban changes of the past centuries, this timeline sums up the constant heartbeat and progress that forged the present identity of the Barranco de Guanarteme and its surroundings.
+                </p>
+            </div>
+        </div>
+    );
+}
@@ -0,0 +1,194 @@
+// Generado por pipeline/i18n.py desde app/tabs/GaleriaTab.tsx. No editar a mano.
+'use client';
+
+import { useEffect, useState } from 'react';
+import { ChevronLeft, ChevronRight, Image as ImageIcon, X } from 'lucide-react';
+import { categorias, plan, proximamente, type Foto } from '../../data/en/gallery';
+import { precargar } from '../../lib/imagenes';
+
+// Variantes AVIF/WebP con el tamaño intrínseco de la foto, para que la carga diferida no mueva el layout
+function Picture({ foto, sizes, className, eager = false }: { foto: Foto; sizes: string; className?: string; eager?: boolean }) {
+    return (
+        <picture>
+            <source type="image/avif" srcSet={foto.srcSet.avif} sizes={sizes} />
+            <source type="image/webp" srcSet={foto.srcSet.webp} sizes={sizes} />
+            <img
+                src={foto.thumb}
+                alt={foto.alt}
+                width={foto.width}
+                height={foto.height}
+                loading={eager ? 'eager' : 'lazy'}
+                decoding="async"
+                className={className}
+                style={{ backgroundColor: foto.color, backgroundImage: `url(${foto.placeholder})`, backgroundSize: 'cover' }}
+            />
+        </picture>
+    );
+}
+
+// Tab 3: Galería de Fotos
+export default function GaleriaTab() {
+    const [selectedCategory, setSelectedCategory] = useState<string | null>(null);
+    const [abierta, setAbierta] = useState<number | null>(null);
+
+    const currentCategory = categorias.find(c => c.name === selectedCategory);
+    const fotos = currentCategory?.photos ?? [];
+
+    // Visor: precarga las vecinas a la resolución del visor y navega con el teclado.
+    useEffect(() => {
+        if (abierta === null || !fotos.length) return;
+        for (let paso = 1; paso <= plan.prefetch; paso++) {
+            precargar(fotos[(abierta + paso) % fotos.length], plan.sizes.lightbox);
+            precargar(fotos[(abierta - paso + fotos.length) % fotos.length], plan.sizes.lightbox);
+        }
+        const onKey = (e: KeyboardEvent) => {
+            if (e.key === 'Escape') setAbierta(null);
+            if (e.key === 'ArrowRight') setAbierta((abierta + 1) % fotos.length);
+            if (e.key === 'ArrowLeft') setAbierta((abierta - 1 + fotos.length) % fotos.length);
+        };
+        window.addEventListener('keydown', onKey);
+        return () => window.removeEventListener('keydown', onKey);
+    }, [abierta, fotos]);
+
+    return (
+        <div className="max-w-6xl mx-auto space-y-12 py-12">
+            <h2 className="text-5xl font-bold text-amber-300 text-center mb-16">Historical Photo Gallery</h2>
+
+            {!selectedCategory ? (
+                <div className="grid md:grid-cols-2 lg:grid-cols-4 gap-6">
+                    {categorias.map((cat, index) => (
+                        <div
+                            key={index}
+                            onClick={() => cat.count > 0 && setSelectedCategory(cat.name)}
+                            className={`group relative overflow-hidden rounded-2xl backdrop-blur-sm border border-slate-700/50 transition-all duration-300 ${cat.count > 0 ? 'cursor-pointer hover:border-amber-500/50 scale-100 hover:scale-[1.02]' : 'opacity-60 grayscale'}`}
+                        >
+                            {/* Cover Image for categories with photos */}
+                            {cat.cover ? (
+                                <>
+                                    <div className="relative h-48 w-full">
+                                        <Picture
+                                            foto={cat.cover}
+                                            sizes={plan.sizes.cover}
+                                            eager
+                                            className="absolute inset-0 h-full w-full object-cover group-hover:scale-105 transition-transform duration-700"
+                                        />
+                                        <div className="absolute inset-0 bg-gradient-to-t from-slate-950 via-slate-900/80 to-slate-900/40"></div>
+                                    </div>
+                                    <div className="relative p-6 -mt-16">
+                                        <ImageIcon className="w-10 h-10 mb-3 text-amber-400 group-hover:scale-110 transition-transform" />
+                                        <h3 className="text-xl font-bold text-white mb-2">{cat.name}</h3>
+                                        <p className="text-slate-300 text-sm font-semibold">
+                                            {cat.count} {cat.count === 1 ? 'foto' : 'fotos'}
+                                        </p>
+                                    </div>
+                                </>
+                            ) : (
+                                <>
+                                    <div className={`absolute inset-0 bg-gradient-to-br ${cat.color} opacity-0 group-hover:opacity-10 transition-opacity duration-300`}></div>
+                                    <div className="relative z-10 p-8 bg-gradient-to-br from-slate-800/50 to-slate-900/50">
+                                        <ImageIcon className={`w-12 h-12 mb-4 transition-transform ${cat.count > 0 ? 'text-amber-400 group-hover:scale-110' : 'text-slate-500'}`} />
+                                        <h3 className="text-xl font-bold text-white mb-2">{cat.name}</h3>
+                                        <p className="text-slate-400 text-sm">
+                                            Coming soon
+                                        </p>
+                                    </div>
+                                </>
+                            )}
+                        </div>
+                    ))}
+                </div>
+            ) : (
+                <div className="space-y-8">
+                    <button
+                        onClick={() => {
+                            setSelectedCategory(null);
+                            setAbierta(null);
+                        }}
+                        className="flex items-center gap-2 text-amber-400 hover:text-amber-300 transition-colors bg-slate-800/50 px-4 py-2 rounded-lg border border-slate-700"
+                    >
+                        <span>← Back to categories</span>
+                    </button>
+
+                    <div className="bg-slate-800/30 backdrop-blur-sm p-8 rounded-3xl border border-slate-700/50">
+                        <div className="flex items-center gap-4 mb-8">
+                            <div className={`w-3 h-10 rounded-full bg-gradient-to-b ${currentCategory?.color}`}></div>
+                            <h3 className="text-3xl font-bold text-white">{selectedCategory}</h3>
+                            <span className="bg-slate-700 px-3 py-1 rounded-full text-sm text-slate-300">{currentCategory?.count} images</span>
+                        </div>
+
+                        <div className="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 gap-6">
+                            {fotos.map((photo, index) => (
+                                <button
+                                    key={index}
+                                    onClick={() => setAbierta(index)}
+                                    className="group/img relative aspect-square rounded-2xl overflow-hidden border-2 border-slate-700/50 hover:border-amber-500/50 transition-all duration-500 text-left"
+                                >
+                                    <Picture
+                                        foto={photo}
+                                        sizes={plan.sizes.grid}
+                                        className="absolute inset-0 h-full w-full object-cover group-hover/img:scale-110 transition-transform duration-700"
+                                    />
+                                    <div className="absolute inset-0 bg-gradient-to-t from-slate-950/90 via-slate-950/50 to-transparent opacity-0 group-hover/img:opacity-100 transition-opacity duration-300 flex items-end p-4">
+                                        <p className="text-sm text-slate-100 font-medium">
+                                            {photo.alt}
+                                        </p>
+                                    </div>
+                                </button>
+                            ))}
+                        </div>
+                    </div>
+                </div>
+            )}
+
+            {abierta !== null && fotos[abierta] && (
+                <div
+                    className="fixed inset-0 z-50 bg-slate-950/95 backdrop-blur-sm flex flex-col items-center justify-center p-4"
+                    onClick={() => setAbierta(null)}
+                >
+                    <button onClick={() => setAbierta(null)} className="absolute top-4 right-4 text-slate-300 hover:text-amber-400" aria-label="Close">
+                        <X className="w-8 h-8" />
+                    </button>
+                    <button
+                        onClick={(e) => {
+                            e.stopPropagation();
+                            setAbierta((abierta - 1 + fotos.length) % fotos.length);
+                        }}
+                        className="absolute left-4 top-1/2 -translate-y-1/2 text-slate-300 hover:text-amber-400"
+                        aria-label="Previous"
+                    >
+                        <ChevronLeft className="w-10 h-10" />
+                    </button>
+                    <div onClick={(e) => e.stopPropagation()} className="max-w-6xl w-full flex flex-col items-center gap-4">
+                        <Picture
+                            key={abierta}
+                            foto={fotos[abierta]}
+                            sizes={plan.sizes.lightbox}
+                            eager
+                            className="max-h-[80vh] w-auto h-auto object-contain rounded-xl"
+                        />
+                        <p className="text-slate-200 text-center">{fotos[abierta].alt}</p>
+                        <p className="text-slate-500 text-sm">{abierta + 1} / {fotos.length}</p>
+                    </div>
+                    <button
+                        onClick={(e) => {
+                            e.stopPropagation();
+                            setAbierta((abierta + 1) % fotos.length);
+                        }}
+                        className="absolute right-4 top-1/2 -translate-y-1/2 text-slate-300 hover:text-amber-400"
+                        aria-label="Next"
+                    >
+                        <ChevronRight className="w-10 h-10" />
+                    </button>
+                </div>
+            )}
+
+            {!selectedCategory && (
+                <div className="bg-slate-800/20 backdrop-blur-sm p-10 rounded-2xl border border-slate-700/30 text-center">
+                    <p className="text-slate-400">
+                        Select a category to explore the historical images.<br />We are working to complete the {proximamente} areas.
+                    </p>
+                </div>
+            )}
+        </div>
+    );
+}
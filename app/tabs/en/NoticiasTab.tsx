@@ -0,0 +1,31 @@
+// Generado por pipeline/i18n.py desde app/tabs/NoticiasTab.tsx. No editar a mano.
+import { Newspaper } from 'lucide-react';
+
+// Tab 4: Noticias
+export default function NoticiasTab() {
+    return (
+        <div className="max-w-5xl mx-auto space-y-12 py-12">
+            <h2 className="text-5xl font-bold text-amber-300 text-center mb-16">News and Updates</h2>
+
+            <div className="space-y-8">
+                <div className="bg-slate-800/50 backdrop-blur-sm p-8 rounded-2xl border border-slate-700/50 hover:border-amber-500/50 transition-all duration-300">
+                    <div className="flex items-center gap-3 mb-4">
+                        <Newspaper className="w-6 h-6 text-amber-400" />
+                        <span className="text-sm text-slate-400">February 2026</span>
+                    </div>
+                    <h3 className="text-3xl font-bold text-orange-300 mb-4">Portal Online</h3>
+                    <p className="text-slate-300 text-lg leading-relaxed">
+                        The website devoted to recovering the historical memory of the Guanarteme neighbourhood and the work of Leandro Perdomo is launched.
+                    </p>
+                </div>
+
+                <div className="bg-slate-800/30 backdrop-blur-sm p-10 rounded-2xl border border-slate-700/50 text-center">
+                    <Newspaper className="w-20 h-20 text-amber-400/50 mx-auto mb-4" />
+                    <p className="text-slate-400 text-lg">
+                        More news and updates coming soon.
+                    </p>
+                </div>
+            </div>
+        </div>
+    );
+}
@@ -0,0 +1,131 @@
+// Generado por pipeline/i18n.py desde app/tabs/ProyectoTab.tsx. No editar a mano.
+// Tab 2: Proyecto - Recuperación de la memoria de Guanarteme
+export default function ProyectoTab() {
+    return (
+        <div className="space-y-16 py-12">
+            <section className="fade-in-section">
+                <div className="max-w-5xl mx-auto">
+                    <h2 className="text-4xl md:text-5xl font-bold text-amber-300 mb-8 text-center leading-tight">
+                        De atrás pa' lante: Culture and identities in the schools of the Canary Islands
+                    </h2>
+
+                    <div className="bg-slate-800/50 backdrop-blur-sm p-10 rounded-2xl border border-slate-700/50 mb-12">
+                        <div className="space-y-6 text-slate-300 text-lg leading-relaxed">
+                            <p className="text-justify">
+                                On 19 March 2025 the archaeologist <strong className="text-amber-300">José de León Hernández</strong> (former director of the World Heritage project for Risco Caído and the Sacred Mountains of Gran Canaria) visited our school as part of the project <em>De atrás pa' lante. Culture and identities in the schools of the Canary Islands</em>.
+                            </p>
+                            <p className="text-justify">
+                                This activity served as the starting point, driving force and foundation of our school heritage programme. Our aim is to highlight the tangible and intangible heritage surrounding our school, where the great majority of our students come from (Guanarteme, Costa Ayala, Casa Ayala, Ladera Alta, Los Giles and the areas around the La Ballena and El Rincón ravines). Its flagship activity is a replica of the one led by José De León in 2025, described below.
+                            </p>
+                            <p className="text-justify">
+                                We want our students to be fully aware of their most recent past and of how it shapes them today, so that they grow as individuals and as an active, critical society that values everything related to heritage, whether natural, cultural or historical. That is why, among other things, we decided to create this website, which serves as the backbone of our proposal and through which we will keep growing in this direction. We are also preparing other tools that complement the project.
+                            </p>
+                        </div>
+                    </div>
+
+                    <div className="bg-gradient-to-br from-cyan-950/40 to-blue-900/30 backdrop-blur-sm p-10 rounded-2xl border border-cyan-700/30">
+                        <h4 className="text-3xl font-bold text-cyan-300 mb-6 font-serif italic">The Flagship Activity</h4>
+                        <div className="space-y-6 text-slate-300 text-lg leading-relaxed">
+                            <p className="text-justify">
+                                So that it can be understood, we describe below the activity carried out by José de León together with several teachers and students of the school in the 2024/2025 school year, which we intend to repeat in coming years, adapted to the context of each class group and the students taking part:
+                            </p>
+                            <p className="text-justify">
+                                The activity had two parts. In the first, José de León gave a <strong className="text-cyan-400">talk in the assembly hall</strong> of the school to all the groups involved (from 8:00 to 9:00). Moving from the general to the specific, the archaeologist explained the history and culture of the Canary Islands and how they apply to the school's surroundings.
+                            </p>
+                            <p className="text-justify">
+                                In the second part, at about 9:00 in the morning, a <strong className="text-cyan-400">field trip</strong> took the students through the Barranco de Guanarteme, near the school, up to the esplanade just below the Los Giles neighbourhood. There, historical, ethnographic, geological, ecological and cultural questions connected with the reality of the ravine, the Guanarteme neighbourhood, the city of Las Palmas de Gran Canaria and the Los Giles neighbourhood were explained in detail.
+                            </p>
+                        </div>
+                    </div>
+                </div>
+            </section>
+
+            {/* Participación */}
+            <section className="fade-in-section pb-12">
+                <div className="max-w-5xl mx-auto">
+                    <h3 className="text-3xl font-bold text-amber-300 mb-8 text-center">An Interdisciplinary Approach</h3>
+                    <p className="text-slate-300 text-lg text-center mb-10">
+                        This activity is part of a project funded by the Government of the Canary Islands with the participation of the <strong className="text-amber-300">Heritage Coordination of IES El Rincón</strong>, as well as several subjects and groups. The activity was interdisciplinary, with work carried out in the weeks before and after the outing with the archaeologist.
+                    </p>
+
+                    <div className="grid md:grid-cols-2 gap-8">
+                        {/* Grupos */}
+                        <div className="bg-slate-800/40 p-8 rounded-2xl border border-amber-500/20 h-full flex flex-col">
+                            <div>
+                                <h4 className="flex items-center gap-3 text-2xl font-bold text-amber-400 mb-6">
+                                    <span className="w-8 h-8 rounded-full bg-amber-500/20 flex items-center justify-center text-amber-300">👥</span>Groups Involved
+                                </h4>
+                                <ul className="space-y-3 text-lg text-slate-300 font-medium mb-10">
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 1st year Bachillerato A</li>
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3rd year ESO B</li>
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3rd year ESO C</li>
+                                </ul>
+                            </div>
+
+                            {/* Image Placeholders */}
+                            <div className="mt-auto flex flex-col gap-4 flex-1 pt-4">
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span><span className="text-slate-500 font-medium text-sm text-center">Photo 1st year Bachillerato A<br /><span className="text-xs font-light opacity-70">(Coming soon)</span></span>
+                                </div>
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span><span className="text-slate-500 font-medium text-sm text-center">Photo 3rd year ESO B<br /><span className="text-xs font-light opacity-70">(Coming soon)</span></span>
+                                </div>
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span><span className="text-slate-500 font-medium text-sm text-center">Photo 3rd year ESO C<br /><span className="text-xs font-light opacity-70">(Coming soon)</span></span>
+                                </div>
+                            </div>
+                        </div>
+
+                        {/* Materias */}
+                        <div className="space-y-6">
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-cyan-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-cyan-300 mb-3">Geography and History (3rd ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    The history of the economy of the Canary Islands from the world before the arrival of the Europeans to the present day, and its links with the area around the school.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-cyan-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-cyan-300 mb-3">History of the Canary Islands (3rd ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    An overview of the geography, nature, history and culture of the Canary Islands as the theoretical and practical context for the activity.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-amber-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-amber-300 mb-3">Mathematics (3rd ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    Calculating and forecasting the rise in rents during the 21st century and the prices they could reach in the Guanarteme neighbourhood if the trend continued.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-purple-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-purple-300 mb-3">English (3rd ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    The British imprint on the Canary Islands through history and language. An analysis of words of Anglo-Saxon origin in use today.
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-pink-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-pink-300 mb-3">Music (3rd ESO)</h4>
+                                <p className="text-slate-400 text-base leading-relaxed">
+                                    Making and playing the humble percussion instruments used by Canarian people in the past, with special mention of the castañetas (two limpet shells).
+                                </p>
+                            </div>
+
+                            <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-green-500/30 transition-colors">
+                                <h4 className="text-xl font-bold text-green-300 mb-3">Biology, Geology and Environmental Sciences (1st Bach)</h4>
+                                <ul className="text-slate-400 text-base leading-relaxed space-y-2 list-disc list-inside">
+                                    <li>Identifying geological formations, erosion processes and human influence.</li>
+                                    <li>Reflecting on the biodiversity of the ravine.</li>
+                                    <li>Observing the impact of land occupation and dumping.</li>
+                                    <li>Raising awareness of sustainable conservation and climate change.</li>
+                                </ul>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </section>
+        </div>
+    );
+}
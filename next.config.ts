@@ -1,7 +1,21 @@
 import type { NextConfig } from "next";
 
+const IMMUTABLE = "public, max-age=31536000, immutable";
+
+// `python -m pipeline publish` builds with NEXT_OUTPUT=export: a static site in out/ served by
+// pipeline/serve.py, which applies the cache headers from out/asset-manifest.json itself.
+const EXPORT = process.env.NEXT_OUTPUT === "export";
+
 const nextConfig: NextConfig = {
-    /* config options here */
+    output: EXPORT ? "export" : undefined,
+    images: { unoptimized: EXPORT },
+    // Content-addressed outputs of the Python pipeline never change under the same URL.
+    headers: EXPORT
+        ? undefined
+        : async () => [
+              { source: "/assets/:path*", headers: [{ key: "Cache-Control", value: IMMUTABLE }] },
+              { source: "/optimized/:path*", headers: [{ key: "Cache-Control", value: IMMUTABLE }] },
+          ],
 };
 
 export default nextConfig;
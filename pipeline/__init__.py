@@ -0,0 +1,5 @@
+"""Content pipeline for the Guanarteme portal.
+
+The top-level ``update_*.py`` scripts are thin callers of the modules in
+this package; run them from the repository root.
+"""
@@ -0,0 +1,291 @@
+"""Command line entry point: ``python -m pipeline <command>``."""
+
+import argparse
+
+from pipeline.assets import load_map, rewrite_urls
+from pipeline.cronograma import compile_cronograma
+from pipeline.gallery import build_gallery
+from pipeline.i18n import build_locales
+from pipeline.integrity import check_integrity
+from pipeline.patch import patch_modules
+from pipeline.search import build_search
+from pipeline.trace import session
+
+
+def cmd_update(args: argparse.Namespace) -> None:
+    # Every updater in one run, one read/scan/write cycle per tab module.
+    import update_cronograma
+    import update_galeria
+    import update_tabs
+
+    data = bool(compile_cronograma()) | build_gallery() | bool(build_search())
+    mapping = load_map()
+    modules = update_tabs.MODULES + update_cronograma.MODULES + update_galeria.MODULES
+    result = patch_modules(modules, lambda text: rewrite_urls(text, mapping))
+    for name in result.missing:
+        print(f"Could not find {name} section")
+    for name in result.changed:
+        print(f"  {name}")
+    # Other locales are compiled from what was just written.
+    locales = build_locales()
+    _pending(locales)
+    _integrity(check_integrity())
+    print("Actualizado exitosamente" if data or result.changed or locales.changed else "Sin cambios")
+
+
+def _pending(report, verbose: bool = False) -> None:
+    for locale, pending in report.missing.items():
+        if pending:
+            print(f"Traducciones pendientes ({locale}): {len(pending)}; ver 'python -m pipeline i18n --list'")
+        if verbose:
+            for group, message in pending:
+                print(f"  {group}: {message[:100]}")
+    for locale, invalid in report.invalid.items():
+        for group, message in invalid:
+            print(f"Traducción con marcadores distintos ({locale}) en {group}: {message[:100]}")
+
+
+def _integrity(report, verbose: bool = False) -> None:
+    for broken in report.broken:
+        print(f"{broken.source}:{broken.line}: {broken.message}")
+    if verbose:
+        for path, size in report.orphans:
+            print(f"sin referencias: {path} ({size:,} B)")
+    elif report.orphans:
+        size = sum(size for _, size in report.orphans)
+        print(f"{len(report.orphans)} ficheros de public/ sin referencias ({size:,} B); ver 'python -m pipeline check'")
+
+
+def cmd_images(args: argparse.Namespace) -> None:
+    from pipeline.images import build_images
+
+    encoded = build_images(jobs=args.jobs, force=args.force)
+    for url in encoded:
+        print(f"  {url}")
+    print(f"{len(encoded)} imágenes optimizadas" if encoded else "Imágenes sin cambios")
+
+
+def cmd_assets(args: argparse.Namespace) -> None:
+    from pipeline.assets import build_assets
+
+    added = build_assets()
+    print(f"{len(added)} recursos nuevos en public/assets" if added else "Recursos sin cambios")
+
+
+def cmd_build(args: argparse.Namespace) -> None:
+    cmd_images(args)
+    cmd_assets(args)
+
+
+def cmd_search(args: argparse.Namespace) -> None:
+    changed = build_search()
+    print(f"Índice de búsqueda actualizado ({len(changed)} ficheros)" if changed else "Índice de búsqueda sin cambios")
+
+
+def cmd_import(args: argparse.Namespace) -> None:
+    from pipeline.importer import import_batch
+
+    report = import_batch(args.source, jobs=args.jobs, era=args.era, threshold=args.threshold, dry_run=args.dry_run)
+    for source, target in report.imported:
+        print(f"  {source} -> {target}")
+    for source, duplicate in report.duplicates:
+        print(f"  duplicada: {source} ~ {duplicate}")
+    for source in report.undated:
+        print(f"  sin fecha: {source} (usa --era para asignarle una época)")
+    for source, error in report.failed:
+        print(f"  error: {source}: {error}")
+    verb = "se importarían" if args.dry_run else "importadas"
+    print(
+        f"{len(report.imported)} {verb}, {len(report.duplicates)} duplicadas, "
+        f"{len(report.undated)} sin fecha, {len(report.failed)} con errores"
+    )
+
+
+def cmd_publish(args: argparse.Namespace) -> None:
+    from pipeline.publish import publish
+
+    files = publish(out_dir=args.out, build=not args.skip_build, jobs=args.jobs)["files"]
+    packed = sum(1 for entry in files.values() if entry["encodings"])
+    print(f"Exportación lista en {args.out}/: {len(files)} ficheros, {packed} precomprimidos")
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    from pipeline.serve import serve
+
+    serve(host=args.host, port=args.port, root=args.root, verbose=args.verbose)
+
+
+def cmd_watch(args: argparse.Namespace) -> None:
+    from pipeline.watch import watch
+
+    watch(debounce=args.debounce, poll=args.poll, interval=args.interval)
+
+
+def cmd_i18n(args: argparse.Namespace) -> None:
+    import sys
+
+    from pipeline.i18n import messages, sync_catalog, targets
+
+    groups = messages()
+    total = sum(len(keys) for keys in groups.values())
+    for locale in targets():
+        added, obsolete = sync_catalog(locale, groups, prune=args.prune)
+        verb = "eliminados" if args.prune else "obsoletos"
+        print(f"{locale}: {total} mensajes, {added} nuevos en el catálogo, {obsolete} {verb}")
+    report = build_locales()
+    for path in report.changed:
+        print(f"  {path}")
+    _pending(report, verbose=args.list)
+    if args.check and (any(report.missing.values()) or any(report.invalid.values())):
+        sys.exit(1)
+
+
+def cmd_check(args: argparse.Namespace) -> None:
+    import sys
+    import time
+
+    start = time.perf_counter()
+    report = check_integrity()
+    elapsed = (time.perf_counter() - start) * 1000
+    _integrity(report, verbose=True)
+    print(
+        f"{report.modules} módulos, {report.references} referencias: {len(report.broken)} rotas, "
+        f"{len(report.orphans)} ficheros sin referencias ({elapsed:.0f} ms)"
+    )
+    if report.broken:
+        sys.exit(1)
+
+
+def cmd_cache(args: argparse.Namespace) -> None:
+    from pipeline.cache import get_cache
+
+    cache = get_cache()
+    if args.clear:
+        cache.clear()
+        print("Caché vaciada")
+        return
+    if args.max_mb is not None:
+        print(f"{cache.evict(int(args.max_mb * (1 << 20)))} entradas descartadas")
+    print(cache.report())
+
+
+def _scales(value: str) -> list:
+    return [int(v) for v in value.split(",") if v]
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    import json
+    import sys
+
+    from pipeline.bench import check, load_budgets, page_weights, report, run_benchmarks
+
+    weights = page_weights()
+    metrics = {"bytes": weights.metrics}
+    if not args.no_timing:
+        metrics["seconds"] = run_benchmarks(args.scales, args.image_scales)
+    budgets = load_budgets(args.budgets)
+    if args.json:
+        print(json.dumps(metrics, indent=1))
+    else:
+        print(report(metrics, budgets))
+    failures = check(metrics, budgets)
+    failures += [f"{module}: {url} no existe en public/" for module, url in weights.unresolved]
+    for line in failures:
+        print(f"Presupuesto superado: {line}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m pipeline")
+    parser.add_argument("--stats", action="store_true", help="print the build cache hit rates of this run")
+    parser.add_argument("--timings", action="store_true", help="print wall/CPU time, I/O and peak memory per stage")
+    parser.add_argument("--trace", metavar="FILE", default=None, help="also write the stages as a Chrome trace (JSON)")
+    parser.add_argument("--memory", action="store_true", help="track Python allocations per stage with tracemalloc (slow)")
+    parser.add_argument("--profile", metavar="FILE", default=None, help="run under cProfile and save the stats to FILE")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    update = commands.add_parser(
+        "update",
+        help="regenerate the tab modules (app/tabs/*.tsx), the timeline, the gallery and search data "
+        "and the other locales",
+    )
+    update.set_defaults(func=cmd_update)
+
+    images = commands.add_parser("images", help="generate responsive variants of public/images")
+    images.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    images.add_argument("--force", action="store_true", help="re-encode every original")
+    images.set_defaults(func=cmd_images)
+
+    assets = commands.add_parser("assets", help="store each distinct image once under public/assets")
+    assets.set_defaults(func=cmd_assets)
+
+    build = commands.add_parser("build", help="run every asset stage (images, assets)")
+    build.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    build.add_argument("--force", action="store_true", help="re-encode every original")
+    build.set_defaults(func=cmd_build)
+
+    search = commands.add_parser("search", help="rebuild the static search index in public/search")
+    search.set_defaults(func=cmd_search)
+
+    importer = commands.add_parser("import", help="import a folder or zip of photos into the gallery eras")
+    importer.add_argument("source", help="folder or .zip with the photos")
+    importer.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    importer.add_argument("--era", default=None, help="era folder for photos without a date (default: skip them)")
+    importer.add_argument("--threshold", type=int, default=6, help="max differing dHash bits of a near-duplicate (default: 6)")
+    importer.add_argument("--dry-run", action="store_true", help="report what would be imported without moving anything")
+    importer.set_defaults(func=cmd_import)
+
+    publish = commands.add_parser("publish", help="static export in out/ with precompressed assets and a manifest")
+    publish.add_argument("--out", default="out", help="export directory (default: out)")
+    publish.add_argument("--skip-build", action="store_true", help="only post-process an existing export")
+    publish.add_argument("--jobs", type=int, default=None, help="compression threads (default: automatic)")
+    publish.set_defaults(func=cmd_publish)
+
+    serve = commands.add_parser("serve", help="serve the static export without Node")
+    serve.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=3000, help="port (default: 3000)")
+    serve.add_argument("--root", default="out", help="export directory (default: out)")
+    serve.add_argument("--verbose", action="store_true", help="log every request")
+    serve.set_defaults(func=cmd_serve)
+
+    watch = commands.add_parser("watch", help="regenerate affected outputs whenever content or images change")
+    watch.add_argument("--debounce", type=float, default=0.15, help="seconds of quiet that end a burst of saves (default: 0.15)")
+    watch.add_argument("--poll", action="store_true", help="poll file stats instead of using inotify")
+    watch.add_argument("--interval", type=float, default=0.5, help="polling interval in seconds (default: 0.5)")
+    watch.set_defaults(func=cmd_watch)
+
+    bench = commands.add_parser("bench", help="time every stage and check page weights against budgets.json")
+    bench.add_argument("--scales", type=_scales, default=[1, 10, 100, 1000], help="corpus scale factors (default: 1,10,100,1000)")
+    bench.add_argument("--image-scales", type=_scales, default=[1, 10], help="image corpus scale factors (default: 1,10)")
+    bench.add_argument("--budgets", default="budgets.json", help="budget file (default: budgets.json)")
+    bench.add_argument("--json", action="store_true", help="print the metrics as JSON")
+    bench.add_argument("--no-timing", action="store_true", help="only check page weights")
+    bench.set_defaults(func=cmd_bench)
+
+    i18n = commands.add_parser("i18n", help="update the translation catalogs and compile every locale")
+    i18n.add_argument("--list", action="store_true", help="print every pending translation")
+    i18n.add_argument("--prune", action="store_true", help="drop catalog entries no longer in the sources")
+    i18n.add_argument("--check", action="store_true", help="exit non-zero while translations are pending or invalid")
+    i18n.set_defaults(func=cmd_i18n)
+
+    check = commands.add_parser("check", help="check every link and asset reference; list unreferenced public files")
+    check.set_defaults(func=cmd_check)
+
+    cache = commands.add_parser("cache", help="show the build cache hit rates since it was created")
+    cache.add_argument("--clear", action="store_true", help="drop every entry and counter")
+    cache.add_argument("--max-mb", type=float, default=None, help="evict least recently used entries down to this size")
+    cache.set_defaults(func=cmd_cache)
+
+    args = parser.parse_args()
+    with session(args.trace, args.timings, args.memory, args.profile):
+        args.func(args)
+    if args.stats:
+        from pipeline.cache import get_cache
+
+        cache = get_cache()
+        print(cache.report(cache.session))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Content-addressed store for the originals under ``public/images``.
+
+The same photo is kept in several folders (``gallery/<Era>/`` and
+``cronograma/<era>/``), and each copy is a separate URL the browser cannot
+share a cache entry for. This stage stores every distinct blob once as
+``public/assets/<hash>.<ext>``, served with immutable caching (see
+``next.config.ts``), and writes ``app/data/assets.json`` mapping each
+original URL to its canonical one. Generators pass their output through
+:func:`rewrite_urls` so the pages only ever reference canonical URLs (or,
+for an ``<img>`` that declares ``sizes``, the responsive variants).
+
+It reuses the hashes recorded by :mod:`pipeline.images`, so it must run after
+that stage.
+"""
+
+import json
+import os
+import re
+import shutil
+from typing import Dict, List, Optional
+
+from pipeline.images import HASH_CHARS, MANIFEST as IMAGES_MANIFEST, path_for, pictures, shown_originals, url_for
+from pipeline.patch import write_if_changed
+from pipeline.trace import traced
+
+ASSET_DIR = os.path.join("public", "assets")
+MAP = os.path.join("app", "data", "assets.json")
+
+
+@traced("assets")
+def build_assets(images_manifest: str = IMAGES_MANIFEST, asset_dir: str = ASSET_DIR, map_path: str = MAP) -> List[str]:
+    """Copy every distinct original a page links to into the store; return the new blob URLs.
+
+    Originals a page only shows through their variants (see
+    :func:`pipeline.images.pictures`) are left out.
+    """
+    with open(images_manifest, "r", encoding="utf-8") as f:
+        images = json.load(f)["images"]
+
+    linked = {url_for(path) for path in shown_originals([path_for(url) for url in images], plain=True)}
+    mapping = {}
+    for url in sorted(linked):
+        digest = images[url]["sha256"][:HASH_CHARS]
+        ext = os.path.splitext(url)[1].lower()
+        mapping[url] = f"/assets/{digest}{ext}"
+
+    os.makedirs(asset_dir, exist_ok=True)
+    added = []
+    sources = {}
+    for url, canonical in mapping.items():
+        sources.setdefault(canonical, url)
+    for canonical, url in sources.items():
+        target = path_for(canonical)
+        if not os.path.exists(target):
+            shutil.copyfile(path_for(url), target)
+            added.append(canonical)
+    for name in os.listdir(asset_dir):
+        if f"/assets/{name}" not in sources:
+            os.remove(os.path.join(asset_dir, name))
+
+    write_if_changed(map_path, json.dumps(mapping, ensure_ascii=False, indent=1) + "\n")
+    return added
+
+
+def load_map(path: str = MAP) -> Dict[str, str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def rewrite_urls(text: str, mapping: Optional[Dict[str, str]] = None) -> str:
+    """Replace every original URL in ``text`` with its canonical one.
+
+    An ``<img>`` of an original that declares ``sizes`` becomes a
+    ``<picture>`` of its variants first (:func:`pipeline.images.pictures`).
+    URLs that are not in the map (e.g. dangling references) are left as is.
+    """
+    text = pictures(text)
+    if mapping is None:
+        mapping = load_map()
+    if not mapping:
+        return text
+    # Longest first so ``/images/a.jpg`` never shadows ``/images/a.jpg.webp``.
+    pattern = re.compile("|".join(re.escape(url) for url in sorted(mapping, key=len, reverse=True)))
+    return pattern.sub(lambda m: mapping[m.group()], text)
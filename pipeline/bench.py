@@ -0,0 +1,278 @@
+"""Benchmarks and byte budgets for the content pipeline.
+
+Two kinds of metrics are collected and checked against ``budgets.json``:
+
+* ``seconds``: wall time of each pipeline stage (``parse``, ``patch``,
+  ``cronograma``, ``search``, ``images``) on synthetic corpora built from the
+  real content scaled by each factor in ``--scales`` (images use
+  ``--image-scales``, since encoding is orders of magnitude slower), best of
+  ``REPEAT`` runs. Metric names are ``<stage>@<scale>``.
+* ``bytes``: a static analysis of the page. For the shell (``app/page.tsx``)
+  and every module in ``app/tabs``, and their compiled locales
+  (``en/shell``, ``en/<tab>``), it sums the eagerly imported local code
+  (``<tab>.code``), the code behind dynamic ``import()`` (``<tab>.lazy``) and
+  the images that code shows (``<tab>.images``): each photo once, at its
+  smallest WebP variant when it has any (the thumbnail a grid or cover
+  loads; larger widths are only fetched on demand), else the referenced
+  file. A reference to a file missing from ``public/`` is reported as a
+  failure, so run ``python -m pipeline build`` first.
+  ``public/images`` is the total of the originals, ``public.deployed`` what
+  the export ships of ``public/`` (only the originals a page links to) and,
+  after ``next build``,
+  ``chunks.total``/``chunks.largest`` measure ``.next/static/chunks``.
+
+Every synthetic corpus lives in a temporary directory; nothing in the tree is
+touched. A metric over its budget makes the command exit non-zero.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from pipeline.i18n import localized_path, targets
+from pipeline.images import HASH_CHARS, SOURCE_DIR, url_for
+from pipeline.patch import PAGE, TABS_DIR, PageIndex, read_page
+from pipeline.publish import linked_originals
+
+BUDGETS = "budgets.json"
+# Runs of each in-memory stage; the best is reported. Image encoding writes
+# files, so its cold run is only ever run once.
+REPEAT = 3
+
+# Type-only imports are erased by the compiler: they add nothing to a bundle.
+_STATIC_IMPORT = re.compile(r"""^import\s(?!type\s)[^'"]*?from\s+['"](\.{1,2}/[^'"]+)['"]""", re.MULTILINE)
+_DYNAMIC_IMPORT = re.compile(r"""import\(\s*['"](\.{1,2}/[^'"]+)['"]\s*\)""")
+_PUBLIC_URL = re.compile(r"""/(?:assets|optimized|images)/[^'"`)\s,]+""")
+_VARIANT = re.compile(rf"/optimized/([0-9a-f]{{{HASH_CHARS}}})-(\d+)\.(\w+)$")
+_ASSET = re.compile(rf"/assets/([0-9a-f]{{{HASH_CHARS}}})\.\w+$")
+
+
+class PageWeights(NamedTuple):
+    metrics: Dict[str, int]
+    unresolved: List[Tuple[str, str]]  # (module, URL) of references missing from public/
+
+
+# -- static analysis ----------------------------------------------------------
+
+def _resolve(base: str, spec: str) -> Optional[str]:
+    path = os.path.normpath(os.path.join(os.path.dirname(base), spec))
+    for candidate in (path, path + ".ts", path + ".tsx", os.path.join(path, "index.ts"), os.path.join(path, "index.tsx")):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _closure(entry: str, stop: Set[str] = frozenset()) -> Tuple[Set[str], Set[str]]:
+    """Modules statically reachable from ``entry`` and the targets of its dynamic imports."""
+    seen, lazy, stack = set(), set(), [entry]
+    while stack:
+        path = stack.pop()
+        if path in seen or path in stop:
+            continue
+        seen.add(path)
+        text = read_page(path)
+        for spec in _STATIC_IMPORT.findall(text):
+            target = _resolve(path, spec)
+            if target:
+                stack.append(target)
+        for spec in _DYNAMIC_IMPORT.findall(text):
+            target = _resolve(path, spec)
+            if target:
+                lazy.add(target)
+    return seen, lazy
+
+
+def _size(paths: Iterable[str]) -> int:
+    return sum(os.path.getsize(p) for p in paths)
+
+
+def _loaded_files(paths: Iterable[str], unresolved: List[Tuple[str, str]]) -> Set[str]:
+    """The files under ``public/`` the modules show: one per photo, its thumbnail if it has variants."""
+    photos: Dict[str, Tuple[int, str]] = {}  # digest -> (width, file) of its smallest WebP
+    plain = {}
+    for path in sorted(paths):
+        for url in _PUBLIC_URL.findall(read_page(path)):
+            if "${" in url:
+                continue
+            target = os.path.join("public", *url.lstrip("/").split("/"))
+            if os.path.isdir(target):
+                continue  # a folder named in a comment, not a request
+            if not os.path.isfile(target):
+                unresolved.append((path, url))
+                continue
+            variant = _VARIANT.search(url)
+            if variant:
+                if variant.group(3) == "webp":
+                    width = int(variant.group(2))
+                    if variant.group(1) not in photos or width < photos[variant.group(1)][0]:
+                        photos[variant.group(1)] = (width, target)
+                continue
+            asset = _ASSET.search(url)
+            plain[asset.group(1) if asset else target] = target
+    return {file for _, file in photos.values()} | {file for key, file in plain.items() if key not in photos}
+
+
+def _tree_size(root: str, suffix: str = "") -> List[int]:
+    sizes = []
+    for base, _, files in os.walk(root):
+        sizes += [os.path.getsize(os.path.join(base, f)) for f in files if f.endswith(suffix)]
+    return sizes
+
+
+def page_weights() -> PageWeights:
+    """Byte metrics of the shell and every tab module, in each locale."""
+    metrics = {}
+    unresolved: List[Tuple[str, str]] = []
+    sources = sorted(os.path.join(TABS_DIR, name) for name in os.listdir(TABS_DIR) if name.endswith(".tsx"))
+    for locale in [None] + targets():
+        tabs = sources if locale is None else [localized_path(t, locale) for t in sources]
+        shell = PAGE if locale is None else localized_path(PAGE, locale)
+        prefix = "" if locale is None else f"{locale}/"
+        entries = [("shell", shell)] + [(os.path.splitext(os.path.basename(t))[0], t) for t in tabs]
+        for name, entry in entries:
+            if not os.path.exists(entry):
+                continue
+            # The shell's closure stops at the tabs: they are accounted for on their own.
+            eager, lazy = _closure(entry, stop=set(tabs) if name == "shell" else set())
+            lazy_modules = set()
+            for target in lazy - eager:
+                lazy_modules |= _closure(target, stop=set(tabs) | eager)[0]
+            metrics[f"{prefix}{name}.code"] = _size(eager)
+            metrics[f"{prefix}{name}.lazy"] = _size(lazy_modules)
+            metrics[f"{prefix}{name}.images"] = _size(_loaded_files(eager | lazy_modules, unresolved))
+
+    metrics["public/images"] = sum(_tree_size(os.path.join("public", "images")))
+    linked = linked_originals()
+    metrics["public.deployed"] = sum(
+        os.path.getsize(path)
+        for base, _, files in os.walk("public")
+        for path in (os.path.join(base, f) for f in files)
+        if not path.startswith(SOURCE_DIR + os.sep) or url_for(path) in linked
+    )
+    chunks = _tree_size(os.path.join(".next", "static", "chunks"), ".js")
+    if chunks:
+        metrics["chunks.total"] = sum(chunks)
+        metrics["chunks.largest"] = max(chunks)
+    return PageWeights(metrics, sorted(set(unresolved)))
+
+
+# -- synthetic corpora --------------------------------------------------------
+
+def _timed(fn: Callable[[], object], repeat: int = 1) -> float:
+    """Best wall time of ``repeat`` runs: the least disturbed by the rest of the machine."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _synthetic_module(scale: int) -> Tuple[str, Dict[str, str]]:
+    """A module holding ``scale`` copies of every real tab section."""
+    sections = {}
+    for name in sorted(n for n in os.listdir(TABS_DIR) if n.endswith(".tsx")):
+        index = PageIndex(read_page(os.path.join(TABS_DIR, name)))
+        for section in index.sections:
+            for i in range(scale):
+                sections[f"{section}{i}"] = index.get(section).replace(f"function {section}(", f"function {section}{i}(")
+    text = "'use client';\n\n" + "\n\n".join(sections.values()) + "\n"
+    return text, sections
+
+
+def bench_parse_patch(scale: int) -> Dict[str, float]:
+    text, sections = _synthetic_module(scale)
+    index = None
+
+    def parse():
+        nonlocal index
+        index = PageIndex(text)
+
+    seconds = {f"parse@{scale}": _timed(parse, REPEAT)}
+    edited = {name: body.replace("className", "class-name") for name, body in sections.items()}
+    seconds[f"patch@{scale}"] = _timed(lambda: index.apply(edited), REPEAT)
+    return seconds
+
+
+def bench_cronograma(scale: int) -> Dict[str, float]:
+    from pipeline.cronograma import group_events, load_store, render_chunk, render_index
+
+    store = load_store()
+    store = {"siglos": store["siglos"], "eventos": store["eventos"] * scale}
+
+    def run():
+        grouped = group_events(store)
+        render_index(store, grouped)
+        for eventos in grouped.values():
+            render_chunk(eventos)
+
+    return {f"cronograma@{scale}": _timed(run, REPEAT)}
+
+
+def bench_search(scale: int) -> Dict[str, float]:
+    from pipeline.search import Doc, collect_documents, index_documents
+
+    base = collect_documents()
+    docs = [Doc(f"{d.key}#{i}", d.tab, d.title, d.text) for i in range(scale) for d in base]
+    return {f"search@{scale}": _timed(lambda: index_documents(docs), REPEAT)}
+
+
+def bench_images(scale: int, originals: int = 46) -> Dict[str, float]:
+    from PIL import Image
+
+    from pipeline.cache import use_cache
+    from pipeline.images import build_images
+
+    with tempfile.TemporaryDirectory() as tmp, use_cache(os.path.join(tmp, "cache.sqlite")):
+        source, out, manifest = (os.path.join(tmp, d) for d in ("images", "optimized", "images.json"))
+        os.makedirs(source)
+        for i in range(originals * scale):
+            # Distinct small photos; real originals are ~10x larger per side.
+            img = Image.new("RGB", (160, 120), ((i * 7) % 256, (i * 13) % 256, (i * 29) % 256))
+            img.save(os.path.join(source, f"{i}.jpg"), quality=90)
+        cold = _timed(lambda: build_images(source, out, manifest, every=True))
+        warm = _timed(lambda: build_images(source, out, manifest, every=True))
+    return {f"images@{scale}": cold, f"images-noop@{scale}": warm}
+
+
+def run_benchmarks(scales: List[int], image_scales: List[int]) -> Dict[str, float]:
+    seconds = {}
+    for scale in scales:
+        seconds.update(bench_parse_patch(scale))
+        seconds.update(bench_cronograma(scale))
+        seconds.update(bench_search(scale))
+    for scale in image_scales:
+        seconds.update(bench_images(scale))
+    return seconds
+
+
+# -- budgets ------------------------------------------------------------------
+
+def load_budgets(path: str = BUDGETS) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check(metrics: Dict[str, Dict[str, float]], budgets: dict) -> List[str]:
+    """Return one line per metric over its budget."""
+    failures = []
+    for kind, values in metrics.items():
+        for name, value in values.items():
+            limit = budgets.get(kind, {}).get(name)
+            if limit is not None and value > limit:
+                failures.append(f"{name}: {value:,.3f} > {limit:,} {kind}")
+    return failures
+
+
+def report(metrics: Dict[str, Dict[str, float]], budgets: dict) -> str:
+    lines = [f"{'métrica':<28} {'valor':>14} {'presupuesto':>14}"]
+    for kind, values in metrics.items():
+        for name, value in values.items():
+            limit = budgets.get(kind, {}).get(name)
+            shown = f"{value:,.3f} s" if kind == "seconds" else f"{value:,} B"
+            flag = "  ✗" if limit is not None and value > limit else ""
+            lines.append(f"{name:<28} {shown:>14} {'' if limit is None else f'{limit:,}':>14}{flag}")
+    return "\n".join(lines)
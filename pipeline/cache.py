@@ -0,0 +1,208 @@
+"""Shared on-disk build cache: one SQLite database under ``.cache/``.
+
+Every stage memoises its intermediate results here instead of keeping its
+own state file. Entries live in a namespace and are keyed by a content hash
+(or, for file hashes, by the file's stat) plus the producing code's
+version, so a changed input or a bumped version is simply a miss:
+
+* ``sha256``: content hash of a file by path, size, mtime, ctime and inode
+  (:func:`pipeline.images.file_hash`), so unchanged files are only stat'ed;
+* ``tsx-offsets``: section offsets of a TSX module by content hash;
+* ``variants``: the variant set encoded for an original by content hash;
+* ``search-terms``: stemmed terms of a search document by its hash;
+* ``dhash``: perceptual hash of a gallery photo by content hash;
+* ``gallery``: fingerprint of the last rendered gallery index;
+* ``i18n-messages``: translatable messages of a module by content hash;
+* ``i18n-modules``: version (source and catalog digest) of each compiled
+  locale module;
+* ``references``: imports, public URLs and links of a module by content hash.
+
+Values are JSON. Lookups update a least-recently-used stamp and, when the
+database outgrows ``max_bytes``, the oldest entries are evicted on
+:meth:`BuildCache.flush`, which the CLI runs when a command ends (and the
+watcher after each batch). Hit and miss counts are kept per namespace for
+the current process and in total (``python -m pipeline --stats <cmd>``,
+``python -m pipeline cache``). Losing the cache only costs time.
+
+Several processes may share the database (``build`` while ``watch`` runs):
+it is opened in autocommit mode with a write-ahead log, so readers never
+block and each write holds the lock only for itself, and a writer waits up
+to ``BUSY_TIMEOUT`` seconds for another. A write that still finds the
+database locked is skipped; only the time to recompute it is lost.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+CACHE_DIR = ".cache"
+DB = os.path.join(CACHE_DIR, "build.sqlite")
+MAX_BYTES = 64 << 20
+BUSY_TIMEOUT = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+CREATE TABLE IF NOT EXISTS stats (
+    ns TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class BuildCache:
+    def __init__(self, path: str = DB, max_bytes: int = MAX_BYTES):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")  # the log is fsynced at checkpoints only
+        self.db.executescript(SCHEMA)
+        self.max_bytes = max_bytes
+        self.session: Dict[str, List[int]] = {}  # ns -> [hits, misses] in this process
+        self._persisted: Dict[str, List[int]] = {}
+        self._used: Dict[Tuple[str, str], float] = {}
+
+    def get(self, ns: str, key: str, version=0):
+        row = self.db.execute(
+            "SELECT value FROM entries WHERE ns = ? AND key = ? AND version = ?", (ns, key, str(version))
+        ).fetchone()
+        counts = self.session.setdefault(ns, [0, 0])
+        if row is None:
+            counts[1] += 1
+            return None
+        counts[0] += 1
+        self._used[(ns, key)] = time.time()
+        return json.loads(row[0])
+
+    def put(self, ns: str, key: str, value, version=0) -> None:
+        text = json.dumps(value, separators=(",", ":"))
+        try:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries (ns, key, version, value, size, used) VALUES (?, ?, ?, ?, ?, ?)",
+                (ns, key, str(version), text, len(key) + len(text), time.time()),
+            )
+        except sqlite3.OperationalError:  # locked by another process past the timeout
+            pass
+
+    def memo(self, ns: str, key: str, compute: Callable[[], object], version=0):
+        value = self.get(ns, key, version)
+        if value is None:
+            value = compute()
+            self.put(ns, key, value, version)
+        return value
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least recently used entries until the cache fits; return how many."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= limit:
+            return 0
+        target = limit * 0.9  # some slack so every flush does not evict again
+        doomed = []
+        for ns, key, size in self.db.execute("SELECT ns, key, size FROM entries ORDER BY used"):
+            if total <= target:
+                break
+            doomed.append((ns, key))
+            total -= size
+        self.db.executemany("DELETE FROM entries WHERE ns = ? AND key = ?", doomed)
+        return len(doomed)
+
+    def flush(self) -> None:
+        """Persist LRU stamps and counters and evict, in one transaction.
+
+        A database still locked by another process is reported, not raised:
+        the stamps and counts are kept for the next flush.
+        """
+        used = [(stamp, ns, key) for (ns, key), stamp in self._used.items()]
+        # Only what was counted since the last flush goes into the totals.
+        deltas = []
+        for ns, (hits, misses) in self.session.items():
+            done = self._persisted.get(ns, [0, 0])
+            deltas.append((ns, hits - done[0], misses - done[1]))
+        try:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self.db.executemany("UPDATE entries SET used = ? WHERE ns = ? AND key = ?", used)
+                self.db.executemany(
+                    "INSERT INTO stats (ns, hits, misses) VALUES (?, ?, ?) "
+                    "ON CONFLICT (ns) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+                    deltas,
+                )
+                self.evict()
+            except BaseException:
+                self.db.rollback()
+                raise
+            self.db.commit()
+        except sqlite3.OperationalError as error:
+            print(f"Caché no guardada ({error}); se reintentará.", file=sys.stderr)
+            return
+        self._used.clear()
+        self._persisted = {ns: list(counts) for ns, counts in self.session.items()}
+
+    def close(self) -> None:
+        self.flush()
+        self.db.close()
+
+    def clear(self) -> None:
+        self.db.execute("DELETE FROM entries")
+        self.db.execute("DELETE FROM stats")
+
+    def report(self, session: Optional[Dict[str, List[int]]] = None) -> str:
+        """Per-namespace hit rates: of ``session`` counts, or the persisted totals."""
+        sizes = {
+            ns: (n, size)
+            for ns, n, size in self.db.execute("SELECT ns, COUNT(*), SUM(size) FROM entries GROUP BY ns")
+        }
+        if session is None:
+            counts = {ns: (hits, misses) for ns, hits, misses in self.db.execute("SELECT ns, hits, misses FROM stats")}
+        else:
+            counts = {ns: tuple(c) for ns, c in session.items()}
+        lines = [f"{'espacio':<14} {'aciertos':>9} {'fallos':>8} {'tasa':>6} {'entradas':>9} {'bytes':>11}"]
+        for ns in sorted(set(sizes) | set(counts)):
+            hits, misses = counts.get(ns, (0, 0))
+            n, size = sizes.get(ns, (0, 0))
+            rate = f"{hits / (hits + misses):.0%}" if hits + misses else "-"
+            lines.append(f"{ns:<14} {hits:>9} {misses:>8} {rate:>6} {n:>9} {size:>11,}")
+        return "\n".join(lines)
+
+
+_cache: Optional[BuildCache] = None
+
+
+def get_cache() -> BuildCache:
+    """The process-wide cache, flushed and closed at exit."""
+    global _cache
+    if _cache is None:
+        _cache = BuildCache()
+        atexit.register(_cache.close)
+    return _cache
+
+
+@contextmanager
+def use_cache(path: str) -> Iterator[BuildCache]:
+    """Make a separate cache at ``path`` the process-wide one for a while.
+
+    The benchmarks run the stages on throwaway corpora; their entries would
+    only push real ones out of the shared cache.
+    """
+    global _cache
+    previous, _cache = _cache, BuildCache(path)
+    try:
+        yield _cache
+    finally:
+        _cache.close()
+        _cache = previous
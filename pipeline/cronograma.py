@@ -0,0 +1,152 @@
+"""Compile the timeline store into lazily loaded data modules.
+
+``content/cronograma.json`` holds the centuries (``siglos``) and a flat list
+of ``eventos`` tagged with the century they belong to. The compiler groups
+and sorts the events once at build time and emits:
+
+* ``app/data/cronograma/index.ts`` with the century headers and counts, which
+  is all ``CronogramaTab`` needs for its first paint;
+* one ``app/data/cronograma/<id>.ts`` chunk per century, loaded through a
+  dynamic ``import()`` when the century is expanded.
+
+Events are ordered by ``sort`` when given, otherwise by the first four-digit
+number in ``year``; ties keep their order in the store. Image URLs in the
+output are rewritten to their canonical ``/assets/`` form. With a
+``translate`` function (see :mod:`pipeline.i18n`) the same modules are
+compiled for another locale from the translated labels and events.
+"""
+
+import json
+import os
+import re
+from typing import Callable, Dict, List, Optional
+
+from pipeline.assets import load_map, rewrite_urls
+from pipeline.patch import write_if_changed
+from pipeline.trace import span, traced
+
+STORE = os.path.join("content", "cronograma.json")
+OUT_DIR = os.path.join("app", "data", "cronograma")
+
+HEADER = "// Generado por pipeline/cronograma.py desde content/cronograma.json. No editar a mano.\n"
+
+_YEAR = re.compile(r"\d{4}")
+
+
+def load_store(path: str = STORE) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def sort_key(evento: dict) -> int:
+    if "sort" in evento:
+        return evento["sort"]
+    match = _YEAR.search(evento["year"])
+    if not match:
+        raise ValueError(f"El evento {evento['year']!r} necesita un campo 'sort'")
+    return int(match.group())
+
+
+def group_events(store: dict) -> Dict[str, List[dict]]:
+    """Return the events of each century, sorted, keyed by century id."""
+    grouped: Dict[str, List[dict]] = {siglo["id"]: [] for siglo in store["siglos"]}
+    for evento in store["eventos"]:
+        if evento["siglo"] not in grouped:
+            raise ValueError(f"Siglo desconocido {evento['siglo']!r} en el evento {evento['year']!r}")
+        grouped[evento["siglo"]].append(evento)
+    for eventos in grouped.values():
+        eventos.sort(key=sort_key)
+    return grouped
+
+
+def translate_store(store: dict, translate: Callable[[str], str]) -> dict:
+    """A copy of ``store`` with every human-readable field passed through ``translate``."""
+    def text(value: str) -> str:
+        return translate(value) if re.search(r"[^\W\d_]", value) else value
+
+    siglos = [{**s, "label": text(s["label"]), "subtitle": text(s["subtitle"])} for s in store["siglos"]]
+    # The order is fixed from the source years: a translated year may gain or lose digits.
+    eventos = [
+        {**e, "year": text(e["year"]), "text": text(e["text"]), "sort": sort_key(e)} for e in store["eventos"]
+    ]
+    return {**store, "siglos": siglos, "eventos": eventos}
+
+
+def _js(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_chunk(eventos: List[dict]) -> str:
+    data = [{"year": e["year"], "text": e["text"]} for e in eventos]
+    return (
+        HEADER
+        + "\n"
+        + "import type { Evento } from './index';\n\n"
+        + f"const eventos: Evento[] = {_js(data)};\n\n"
+        + "export default eventos;\n"
+    )
+
+
+def render_index(store: dict, grouped: Dict[str, List[dict]]) -> str:
+    lines = [
+        HEADER,
+        "export type Evento = { year: string; text: string };",
+        "",
+        "export type Siglo = {",
+        "    label: string;",
+        "    subtitle: string;",
+        "    color: string;",
+        "    dot: string;",
+        "    count: number;",
+        "    load: () => Promise<Evento[]>;",
+        "};",
+        "",
+        "export const siglos: Siglo[] = [",
+    ]
+    for siglo in store["siglos"]:
+        fields = ", ".join(
+            f"{key}: {_js(siglo[key])}" for key in ("label", "subtitle", "color", "dot")
+        )
+        lines.append(
+            f"    {{ {fields}, count: {len(grouped[siglo['id']])}, "
+            f"load: () => import('./{siglo['id']}').then((m) => m.default) }},"
+        )
+    lines.append("];")
+    return "\n".join(lines) + "\n"
+
+
+@traced("cronograma")
+def compile_cronograma(
+    store_path: str = STORE, out_dir: str = OUT_DIR, translate: Optional[Callable[[str], str]] = None
+) -> List[str]:
+    """Write the index and per-century chunks; return the paths that changed.
+
+    Chunks whose text is unchanged are not rewritten, so only the centuries
+    that were edited invalidate the dev server's cache.
+    """
+    with span("load", cat="io"):
+        store = load_store(store_path)
+    with span("render"):
+        if translate is not None:
+            store = translate_store(store, translate)
+        grouped = group_events(store)
+        outputs = {os.path.join(out_dir, "index.ts"): render_index(store, grouped)}
+        for siglo_id, eventos in grouped.items():
+            outputs[os.path.join(out_dir, f"{siglo_id}.ts")] = render_chunk(eventos)
+
+    with span("rewrite-urls"):
+        mapping = load_map()
+        outputs = {path: rewrite_urls(text, mapping) for path, text in outputs.items()}
+
+    os.makedirs(out_dir, exist_ok=True)
+    changed = []
+    with span("write", cat="io"):
+        for name in os.listdir(out_dir):
+            path = os.path.join(out_dir, name)
+            if name.endswith(".ts") and path not in outputs:
+                os.remove(path)
+                changed.append(path)
+        for path, text in outputs.items():
+            if write_if_changed(path, text):
+                changed.append(path)
+    return changed
@@ -0,0 +1,220 @@
+"""Gallery index generated from ``public/images/gallery``.
+
+Every sub-folder of the gallery is a category; its photos, count and cover
+are derived from what is on disk, so the index cannot drift from the files.
+``content/galeria.json`` only adds what the filesystem cannot know: the
+display order, gradient color, captions and optional cover file of each
+category, and the planned categories that have no folder yet (shown as
+"Próximamente").
+
+Per-photo dimensions, byte size, dominant color, placeholder and variants
+come from the :mod:`pipeline.images` manifest, and URLs are canonicalised
+through :mod:`pipeline.assets`, so both stages must run first.
+
+Alongside the data the module exports a loading ``plan`` for the tab: the
+``sizes`` attribute of each image role (category cover, grid cell,
+lightbox), matching the grids in ``update_galeria.py``, so browsers pick the
+smallest variant that fills the slot, and how many neighbours the lightbox
+prefetches at its own resolution. Every photo carries its intrinsic size
+(no layout shift while it lazy-loads) and ``thumb``, its smallest WebP
+variant, as the fallback ``src``; the originals are never requested.
+
+The output is ``app/data/gallery.ts``. A fingerprint of :data:`VERSION`
+and one stat walk over the gallery plus the input manifests is kept in the build cache
+(:mod:`pipeline.cache`); when it matches, nothing is re-indexed. Other
+locales get their own module from the translated names and captions (see
+:mod:`pipeline.i18n`).
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Optional
+
+from pipeline.assets import MAP as ASSETS_MAP, load_map
+from pipeline.cache import get_cache
+from pipeline.images import EXTENSIONS, MANIFEST as IMAGES_MANIFEST, load_manifest, url_for
+from pipeline.patch import write_if_changed
+from pipeline.trace import span, traced
+
+GALLERY_DIR = os.path.join("public", "images", "gallery")
+STORE = os.path.join("content", "galeria.json")
+OUT = os.path.join("app", "data", "gallery.ts")
+
+DEFAULT_COLOR = "from-slate-500 to-slate-700"
+
+# Rendered slot widths of each image role in GALERIA_TAB (max-w-6xl is 1152px).
+SIZES = {
+    "cover": "(min-width: 1152px) 270px, (min-width: 1024px) 25vw, (min-width: 768px) 50vw, 100vw",
+    "grid": "(min-width: 1152px) 340px, (min-width: 768px) 33vw, (min-width: 640px) 50vw, 100vw",
+    "lightbox": "100vw",
+}
+PREFETCH = 1  # lightbox neighbours preloaded on each side
+VERSION = 1  # bump when the rendered module can come out differently; part of the fingerprint
+
+HEADER = "// Generado por pipeline/gallery.py desde public/images/gallery y content/galeria.json. No editar a mano.\n"
+
+TYPES = """export type Foto = {
+    src: string;
+    alt: string;
+    width: number;
+    height: number;
+    bytes: number;
+    color: string;
+    placeholder: string;
+    thumb: string;
+    srcSet: Record<string, string>;
+};
+
+export type Categoria = {
+    name: string;
+    color: string;
+    count: number;
+    cover: Foto | null;
+    photos: Foto[];
+};
+"""
+
+
+def fingerprint(gallery_dir: str = GALLERY_DIR, inputs: tuple = (STORE, IMAGES_MANIFEST, ASSETS_MAP)) -> str:
+    """Hash of the generator (version and plan) and of every gallery file and input's stat."""
+    h = hashlib.sha256()
+    h.update(json.dumps([VERSION, SIZES, PREFETCH]).encode("utf-8"))  # the generator is part of the output
+
+    def add(path: str, st: os.stat_result) -> None:
+        h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+
+    stack = [gallery_dir]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.is_dir():
+                    stack.append(entry.path)
+                else:
+                    add(entry.path, entry.stat())
+    for path in inputs:
+        if os.path.exists(path):
+            add(path, os.stat(path))
+    return h.hexdigest()
+
+
+def _photo(path: str, caption: str, images: Dict[str, dict], mapping: Dict[str, str]) -> dict:
+    url = url_for(path)
+    if url not in images:
+        raise SystemExit(f"{url} no está en {IMAGES_MANIFEST}; ejecuta antes 'python -m pipeline images'")
+    entry = images[url]
+    smallest = entry["variants"].get("webp", [{"src": url}])[0]["src"]
+    return {
+        "src": mapping.get(url, url),
+        "alt": caption,
+        "width": entry["width"],
+        "height": entry["height"],
+        "bytes": entry["bytes"],
+        "color": entry["color"],
+        "placeholder": entry["placeholder"],
+        "thumb": mapping.get(smallest, smallest),
+        "srcSet": {
+            fmt: ", ".join(f"{v['src']} {v['w']}w" for v in variants)
+            for fmt, variants in entry["variants"].items()
+        },
+    }
+
+
+def build_categories(
+    gallery_dir: str = GALLERY_DIR, store_path: str = STORE, translate: Callable[[str], str] = lambda text: text
+) -> List[dict]:
+    with open(store_path, "r", encoding="utf-8") as f:
+        store = json.load(f)["categorias"]
+    images = load_manifest().get("images", {})
+    mapping = load_map()
+
+    folders = sorted(e.name for e in os.scandir(gallery_dir) if e.is_dir())
+    listed = {c["folder"] for c in store if "folder" in c}
+    store = store + [{"folder": name} for name in folders if name not in listed]
+
+    categorias = []
+    for cat in store:
+        folder = cat.get("folder")
+        names = []
+        if folder in folders:
+            directory = os.path.join(gallery_dir, folder)
+            names = sorted(n for n in os.listdir(directory) if n.lower().endswith(EXTENSIONS))
+        descriptions = cat.get("descriptions", {})
+        label = translate(cat.get("name", folder))
+        photos = [
+            _photo(
+                os.path.join(gallery_dir, folder, name),
+                translate(descriptions[name]) if name in descriptions else f"{label} - {os.path.splitext(name)[0]}",
+                images,
+                mapping,
+            )
+            for name in names
+        ]
+        cover = None
+        if photos:
+            cover = names.index(cat["cover"]) if cat.get("cover") in names else 0
+        categorias.append({
+            "name": label,
+            "color": cat.get("color", DEFAULT_COLOR),
+            "count": len(photos),
+            "cover": cover,
+            "photos": photos,
+        })
+    return categorias
+
+
+def _js(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _upcoming(names: List[str], conjunction: str) -> str:
+    if len(names) < 2:
+        return "".join(names)
+    return ", ".join(names[:-1]) + f" {conjunction} " + names[-1]
+
+
+def render(categorias: List[dict], conjunction: str = "y") -> str:
+    lines = [HEADER, TYPES]
+    for i, cat in enumerate(categorias):
+        lines.append(f"const fotos{i}: Foto[] = [")
+        lines.extend(f"    {_js(photo)}," for photo in cat["photos"])
+        lines.append("];")
+    lines.append("")
+    lines.append("export const categorias: Categoria[] = [")
+    for i, cat in enumerate(categorias):
+        cover = "null" if cat["cover"] is None else f"fotos{i}[{cat['cover']}]"
+        lines.append(
+            f"    {{ name: {_js(cat['name'])}, color: {_js(cat['color'])}, count: {cat['count']}, "
+            f"cover: {cover}, photos: fotos{i} }},"
+        )
+    lines.append("];")
+    lines.append("")
+    upcoming = [cat["name"] for cat in categorias if not cat["count"]]
+    lines.append(f"export const proximamente = {_js(_upcoming(upcoming, conjunction))};")
+    lines.append("")
+    lines.append(f"export const plan = {{ sizes: {_js(SIZES)}, prefetch: {PREFETCH} }};")
+    return "\n".join(lines) + "\n"
+
+
+@traced("gallery")
+def build_gallery(force: bool = False, out: str = OUT, translate: Optional[Callable[[str], str]] = None) -> bool:
+    """Regenerate the gallery module if anything changed; return whether it did.
+
+    ``translate`` (a :class:`pipeline.i18n.Translator`) compiles the module of
+    another locale; its digest joins the fingerprint.
+    """
+    cache = get_cache()
+    # The fingerprint is the entry's version: any change in the inputs is a miss.
+    with span("fingerprint", cat="io"):
+        stamp = fingerprint() if translate is None else f"{fingerprint()}:{translate.digest}"
+    if not force and cache.get("gallery", out, stamp) is not None and os.path.exists(out):
+        return False
+
+    with span("index"):
+        categorias = build_categories() if translate is None else build_categories(translate=translate)
+    with span("render"):
+        text = render(categorias) if translate is None else render(categorias, translate("y"))
+    with span("write", cat="io"):
+        changed = write_if_changed(out, text)
+    cache.put("gallery", out, True, stamp)
+    return changed
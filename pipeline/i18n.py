@@ -0,0 +1,480 @@
+"""Per-locale builds of the portal from a translation catalog.
+
+Spanish is the source language: the updaters, the content stores and the
+hand-written components stay as they are and define the Spanish site. Every
+other locale in :data:`LOCALES` is compiled from them into its own modules,
+so a visitor only ever downloads the language of the page they opened (``/``
+or ``/en``); nothing is switched at runtime.
+
+``content/i18n/<locale>.json`` is the catalog: one group per source (a module
+path or a content store), mapping each Spanish message to its translation.
+Messages are what ends up on screen:
+
+* in the TSX modules (:data:`MODULES` and every tab), JSX text and the
+  ``alt``, ``title``, ``aria-label`` and ``placeholder`` attributes (string
+  literals inside an attribute's ``{...}`` too, except comparison operands).
+  A paragraph mixing text with inline elements (``<strong>``, ``<em>``,
+  ``<br />``...) or expressions is one message, with ``<0>...</0>``, ``<1/>``
+  and ``{2}`` standing for those children, so it can be translated as a
+  sentence and the placeholders reordered;
+* in the timeline store, century labels, subtitles, years with words and
+  events; in the gallery, category names and captions.
+
+Each module becomes ``<dir>/<locale>/<name>`` (``app/page.tsx`` becomes the
+``app/en/page.tsx`` route), with its messages replaced and its relative
+imports pointing at the other compiled modules and at the locale's data
+(``app/data/<locale>/...``). The compiled files are keyed in the build cache
+by their source and the digest of their catalog group, so only the outputs
+whose source or translations changed are rebuilt. The locale's search index
+(``public/search/<locale>/``, see :mod:`pipeline.search`) is then built from
+the translated stores and the compiled article, so the compiled search box
+finds and shows the locale's own text.
+
+Untranslated messages fall back to Spanish and are reported;
+``python -m pipeline i18n`` adds new messages to the catalogs (reusing an
+identical translation from another group), and ``--check`` fails while any
+remain, for CI.
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from pipeline.cache import get_cache
+from pipeline.cronograma import OUT_DIR as CRONOGRAMA_DIR, STORE as CRONOGRAMA_STORE, compile_cronograma, load_store, translate_store
+from pipeline.gallery import OUT as GALLERY_OUT, STORE as GALLERY_STORE, build_categories, build_gallery
+from pipeline.patch import PAGE, TABS_DIR, read_page, write_if_changed
+from pipeline.search import OUT_DIR as SEARCH_DIR, build_search, collect_documents
+from pipeline.trace import span, traced
+from pipeline.tsx import JsxElement, JsxExpression, JsxScanner, JsxText
+
+SOURCE_LOCALE = "es"
+# Code, name in its own language and URL of every locale; the first is the source.
+LOCALES = (("es", "Español", "/"), ("en", "English", "/en"))
+CATALOG_DIR = os.path.join("content", "i18n")
+DATA_DIR = os.path.join("app", "data")
+IDIOMA = os.path.join(DATA_DIR, "idioma.ts")
+# Hand-written modules compiled per locale besides the tabs.
+MODULES = (PAGE, os.path.join("app", "components", "Portal.tsx"), os.path.join("app", "components", "Buscador.tsx"))
+# The tab holding the article indexed for search.
+AUTOR_MODULE = os.path.join(TABS_DIR, "AutorTab.tsx")
+VERSION = 1
+
+HEADER = "// Generado por pipeline/i18n.py desde {source}. No editar a mano.\n"
+
+INLINE = frozenset(("a", "abbr", "b", "br", "code", "em", "i", "small", "span", "strong", "sub", "sup", "u"))
+ATTRIBUTES = ("alt", "title", "aria-label", "placeholder")
+
+_LETTER = re.compile(r"[^\W\d_]")
+_ATTRIBUTE = re.compile(r"""\s(%s)=(?:"([^"]*)"|'([^']*)'|\{)""" % "|".join(ATTRIBUTES))
+_JS_STRING = re.compile(r"""'((?:[^'\\\n]|\\.)*)'|"((?:[^"\\\n]|\\.)*)\"""")
+_COMPARED = re.compile(r"""[=!]==?\s*$|^\s*[=!]==?""")
+_PLACEHOLDER = re.compile(r"<(\d+)/>|<(\d+)>|</(\d+)>|\{(\d+)\}")
+_SPECIFIER = re.compile(r"""(\bfrom\s+|\bimport\s*\(\s*|^import\s+)(['"])(\.{1,2}/[^'"]*)\2""", re.MULTILINE)
+_JSX_ESCAPES = {"{": "{'{'}", "}": "{'}'}", "<": "{'<'}", ">": "{'>'}"}
+
+
+class Message(NamedTuple):
+    text: str  # the catalog key
+    start: int  # span of the source text it replaces
+    end: int
+    quote: str  # "" for JSX text, else the quote of the string literal
+    jsx_attribute: bool  # a JSX attribute string (entities) rather than a JS literal
+    tags: List[Tuple[str, str]]  # placeholder n -> (opening or whole source, closing)
+
+
+class Translator:
+    """Lookups in one catalog group; remembers what it could not translate."""
+
+    def __init__(self, entries: Dict[str, str]):
+        self.entries = entries
+        canonical = json.dumps(entries, ensure_ascii=False, sort_keys=True)
+        self.digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+        self.missing: List[str] = []
+
+    def __call__(self, text: str) -> str:
+        found = self.entries.get(text)
+        if not found:
+            if text not in self.missing:
+                self.missing.append(text)
+            return text
+        return found
+
+
+class LocaleReport(NamedTuple):
+    changed: List[str]
+    missing: Dict[str, List[Tuple[str, str]]]  # locale -> (group, message)
+    invalid: Dict[str, List[Tuple[str, str]]]
+
+
+def targets() -> List[str]:
+    return [code for code, _, _ in LOCALES if code != SOURCE_LOCALE]
+
+
+def sources() -> List[str]:
+    """Every module compiled per locale."""
+    tabs = sorted(os.path.join(TABS_DIR, n) for n in os.listdir(TABS_DIR) if n.endswith(".tsx"))
+    return [path for path in MODULES if os.path.exists(path)] + tabs
+
+
+def localized_path(path: str, locale: str) -> str:
+    """``app/data/x`` -> ``app/data/<locale>/x``; ``dir/name`` -> ``dir/<locale>/name``."""
+    path = os.path.normpath(path)
+    if path.startswith(DATA_DIR + os.sep):
+        return os.path.join(DATA_DIR, locale, os.path.relpath(path, DATA_DIR))
+    return os.path.join(os.path.dirname(path), locale, os.path.basename(path))
+
+
+# -- extraction -----------------------------------------------------------------
+
+def _has_text(text: str) -> bool:
+    return bool(_LETTER.search(_PLACEHOLDER.sub("", text)))
+
+
+def _jsx_text(raw: str) -> str:
+    """The text JSX renders for a run: lines trimmed, blank lines dropped."""
+    lines = raw.replace("\r", "").split("\n")
+    kept = []
+    for i, line in enumerate(lines):
+        if i > 0:
+            line = line.lstrip(" \t")
+        if i < len(lines) - 1:
+            line = line.rstrip(" \t")
+        if line:
+            kept.append(line)
+    return " ".join(kept)
+
+
+def _is_comment(text: str, node: JsxExpression) -> bool:
+    inner = text[node.start + 1:node.end - 1].strip()
+    return inner.startswith("/*") and inner.endswith("*/")
+
+
+def _phrasing(text: str, element: JsxElement) -> bool:
+    """Whether ``element``'s content is text, plain expressions and inline elements only."""
+    for child in element.children:
+        if isinstance(child, JsxExpression):
+            if child.jsx or _is_comment(text, child):
+                return False
+        elif isinstance(child, JsxElement):
+            if child.tag not in INLINE or not _phrasing(text, child):
+                return False
+    return True
+
+
+def _trimmed(text: str, start: int, end: int) -> Tuple[int, int]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _group(text: str, element: JsxElement) -> Optional[Message]:
+    parts: List[str] = []
+    tags: List[Tuple[str, str]] = []
+
+    def walk(children) -> None:
+        for child in children:
+            if isinstance(child, JsxText):
+                parts.append(_jsx_text(text[child.start:child.end]))
+            elif isinstance(child, JsxExpression):
+                parts.append(f"{{{len(tags)}}}")
+                tags.append((text[child.start:child.end], ""))
+            elif child.close_start == child.end:  # self-closing
+                parts.append(f"<{len(tags)}/>")
+                tags.append((text[child.start:child.end], ""))
+            else:
+                n = len(tags)
+                tags.append((text[child.start:child.open_end], text[child.close_start:child.end]))
+                parts.append(f"<{n}>")
+                walk(child.children)
+                parts.append(f"</{n}>")
+
+    walk(element.children)
+    key = "".join(parts).strip()
+    if not _has_text(key):
+        return None
+    start, end = _trimmed(text, element.open_end, element.close_start)
+    return Message(key, start, end, "", False, tags)
+
+
+def _attributes(text: str, element: JsxElement, found: List[Message]) -> None:
+    opening = text[element.start:element.open_end]
+    for match in _ATTRIBUTE.finditer(opening):
+        if match.group(2) is not None or match.group(3) is not None:
+            group = 2 if match.group(2) is not None else 3
+            if _has_text(match.group(group)):
+                start = element.start + match.start(group)
+                quote = '"' if group == 2 else "'"
+                found.append(Message(match.group(group), start, start + len(match.group(group)), quote, True, []))
+            continue
+        brace = element.start + match.end() - 1
+        expression = next((e for e in element.attributes if e.start == brace), None)
+        if expression is None:
+            continue
+        code = text[expression.start:expression.end]
+        for literal in _JS_STRING.finditer(code):
+            value = literal.group(1) if literal.group(1) is not None else literal.group(2)
+            if not _has_text(value) or _COMPARED.search(code[:literal.start()]) or _COMPARED.search(code[literal.end():]):
+                continue
+            start = expression.start + literal.start() + 1
+            found.append(Message(value, start, start + len(value), literal.group()[0], False, []))
+
+
+def _visit(text: str, element: JsxElement, found: List[Message]) -> None:
+    _attributes(text, element, found)
+    if element.close_start == element.end:
+        return
+    if _phrasing(text, element):
+        message = _group(text, element)
+        if message:
+            found.append(message)
+            return
+    for child in element.children:
+        if isinstance(child, JsxText):
+            key = _jsx_text(text[child.start:child.end]).strip()
+            if _has_text(key):
+                start, end = _trimmed(text, child.start, child.end)
+                found.append(Message(key, start, end, "", False, []))
+        elif isinstance(child, JsxElement):
+            _visit(text, child, found)
+
+
+def extract(text: str) -> List[Message]:
+    """Every translatable message of a TSX module, in source order."""
+    scanner = JsxScanner(text)
+    scanner.declarations()
+    found: List[Message] = []
+    for root in scanner.roots:
+        _visit(text, root, found)
+    return sorted(found, key=lambda m: m.start)
+
+
+def module_messages(text: str) -> List[Message]:
+    """:func:`extract`, cached by the module's content hash."""
+    cache = get_cache()
+    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    cached = cache.get("i18n-messages", key, VERSION)
+    if cached is not None:
+        return [Message(m[0], m[1], m[2], m[3], m[4], [tuple(t) for t in m[5]]) for m in cached]
+    found = extract(text)
+    cache.put("i18n-messages", key, [list(m) for m in found], VERSION)
+    return found
+
+
+# -- rendering ------------------------------------------------------------------
+
+def placeholders(text: str) -> List[str]:
+    return sorted(match.group() for match in _PLACEHOLDER.finditer(text))
+
+
+def _render(message: Message, translation: str) -> Optional[str]:
+    """Source text for ``translation``; ``None`` when its placeholders do not match."""
+    if placeholders(translation) != placeholders(message.text):
+        return None
+    if message.quote:
+        if message.jsx_attribute:
+            entity = "&quot;" if message.quote == '"' else "&apos;"
+            return translation.replace("&", "&amp;").replace(message.quote, entity)
+        return translation.replace("\\", "\\\\").replace(message.quote, "\\" + message.quote)
+    out, last = [], 0
+    for match in _PLACEHOLDER.finditer(translation):
+        out.append("".join(_JSX_ESCAPES.get(c, c) for c in translation[last:match.start()]))
+        whole, opening, closing, expression = match.groups()
+        if closing is not None:
+            out.append(message.tags[int(closing)][1])
+        else:
+            out.append(message.tags[int(whole or opening or expression)][0])
+        last = match.end()
+    out.append("".join(_JSX_ESCAPES.get(c, c) for c in translation[last:]))
+    return "".join(out)
+
+
+def _rebase(text: str, source: str, target: str, locale: str, compiled: Iterable[str]) -> str:
+    """Point the relative imports of ``source`` (now at ``target``) at the locale's modules."""
+    compiled = {os.path.splitext(os.path.normpath(p))[0] for p in compiled}
+
+    def replace(match: re.Match) -> str:
+        spec = os.path.normpath(os.path.join(os.path.dirname(source), match.group(3)))
+        stem = os.path.splitext(spec)[0]
+        local = localized_path(spec, locale)
+        if stem in compiled or (spec.startswith(DATA_DIR + os.sep) and _exists_module(local)):
+            spec = local
+        new = os.path.relpath(spec, os.path.dirname(target)).replace(os.sep, "/")
+        if not new.startswith("."):
+            new = "./" + new
+        return f"{match.group(1)}{match.group(2)}{new}{match.group(2)}"
+
+    return _SPECIFIER.sub(replace, text)
+
+
+def _exists_module(path: str) -> bool:
+    return any(os.path.exists(p) for p in (path, path + ".ts", path + ".tsx", os.path.join(path, "index.ts")))
+
+
+def localize_module(source: str, locale: str, translate: Translator, compiled: Iterable[str]) -> str:
+    """The text of ``source`` compiled for ``locale``."""
+    text = read_page(source)
+    target = localized_path(source, locale)
+    out, last = [], 0
+    for message in module_messages(text):
+        translation = translate(message.text)
+        # Untranslated or with mismatched placeholders: the Spanish stays.
+        rendered = None if translation == message.text else _render(message, translation)
+        if rendered is None:
+            continue
+        out.append(text[last:message.start])
+        out.append(rendered)
+        last = message.end
+    out.append(text[last:])
+    return HEADER.format(source=source.replace(os.sep, "/")) + _rebase("".join(out), source, target, locale, compiled)
+
+
+def render_idioma(locale: str) -> str:
+    idiomas = [{"codigo": code, "nombre": name, "href": href} for code, name, href in LOCALES]
+    return (
+        HEADER.format(source="pipeline/i18n.py")
+        + "\n"
+        + f"export const idioma = {json.dumps(locale)};\n\n"
+        + f"export const idiomas = {json.dumps(idiomas, ensure_ascii=False)};\n"
+    )
+
+
+# -- catalog --------------------------------------------------------------------
+
+def catalog_path(locale: str) -> str:
+    return os.path.join(CATALOG_DIR, f"{locale}.json")
+
+
+def load_catalog(locale: str) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(catalog_path(locale), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def group_name(path: str) -> str:
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def _recorded(run: Callable[[Translator], object]) -> List[str]:
+    recorder = Translator({})
+    run(recorder)
+    return recorder.missing
+
+
+def messages() -> Dict[str, List[str]]:
+    """Catalog group -> its messages, in source order."""
+    groups = {}
+    for path in sources():
+        keys = []
+        for message in module_messages(read_page(path)):
+            if message.text not in keys:
+                keys.append(message.text)
+        groups[group_name(path)] = keys
+    groups[group_name(CRONOGRAMA_STORE)] = _recorded(lambda t: translate_store(load_store(), t))
+    groups[group_name(GALLERY_STORE)] = _recorded(lambda t: (build_categories(translate=t), t("y")))
+    return groups
+
+
+def sync_catalog(locale: str, groups: Dict[str, List[str]], prune: bool = False) -> Tuple[int, int]:
+    """Add new messages to the catalog of ``locale``; return (added, obsolete).
+
+    A new message gets the translation of the same text in another group,
+    or ``""`` (pending). Messages no longer in the sources are kept at the
+    end of their group unless ``prune``.
+    """
+    catalog = load_catalog(locale)
+    memory = {key: value for entries in catalog.values() for key, value in entries.items() if value}
+    updated: Dict[str, Dict[str, str]] = {}
+    added = obsolete = 0
+    for group, keys in groups.items():
+        entries = catalog.get(group, {})
+        updated[group] = {}
+        for key in keys:
+            if key not in entries:
+                added += 1
+            updated[group][key] = entries.get(key) or memory.get(key, "")
+        stale = [key for key in entries if key not in updated[group]]
+        obsolete += len(stale)
+        if not prune:
+            updated[group].update((key, entries[key]) for key in stale)
+    for group in catalog:
+        if group not in updated:
+            obsolete += len(catalog[group])
+            if not prune:
+                updated[group] = catalog[group]
+    os.makedirs(CATALOG_DIR, exist_ok=True)
+    write_if_changed(catalog_path(locale), json.dumps(updated, ensure_ascii=False, indent=2) + "\n")
+    return added, obsolete
+
+
+# -- build ----------------------------------------------------------------------
+
+def _build_module(source: str, locale: str, translate: Translator, compiled: List[str]) -> bool:
+    cache = get_cache()
+    target = localized_path(source, locale)
+    text = read_page(source)
+    # Rebuilt only when the source, its catalog group or the set of compiled modules changed.
+    version = hashlib.sha256(
+        f"{VERSION}\0{text}\0{translate.digest}\0{'|'.join(compiled)}".encode("utf-8")
+    ).hexdigest()
+    if cache.get("i18n-modules", target, version) is not None and os.path.exists(target):
+        return False
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    changed = write_if_changed(target, localize_module(source, locale, translate, compiled))
+    cache.put("i18n-modules", target, True, version)
+    return changed
+
+
+@traced("i18n")
+def build_locales(locales: Optional[List[str]] = None) -> LocaleReport:
+    """Compile every target locale; report pending and invalid translations."""
+    changed: List[str] = []
+    if write_if_changed(IDIOMA, render_idioma(SOURCE_LOCALE)):
+        changed.append(IDIOMA)
+    with span("messages"):
+        groups = messages()
+    missing: Dict[str, List[Tuple[str, str]]] = {}
+    invalid: Dict[str, List[Tuple[str, str]]] = {}
+    for locale in locales or targets():
+        catalog = load_catalog(locale)
+        translators = {group: Translator(catalog.get(group, {})) for group in groups}
+
+        idioma = localized_path(IDIOMA, locale)
+        os.makedirs(os.path.dirname(idioma), exist_ok=True)
+        if write_if_changed(idioma, render_idioma(locale)):
+            changed.append(idioma)
+        changed += compile_cronograma(
+            out_dir=localized_path(CRONOGRAMA_DIR, locale), translate=translators[group_name(CRONOGRAMA_STORE)]
+        )
+        gallery = localized_path(GALLERY_OUT, locale)
+        if build_gallery(out=gallery, translate=translators[group_name(GALLERY_STORE)]):
+            changed.append(gallery)
+        compiled = sources()
+        for source in compiled:
+            target = localized_path(source, locale)
+            with span(f"module {target}", cat="section"):
+                if _build_module(source, locale, translators[group_name(source)], compiled):
+                    changed.append(target)
+        docs = collect_documents(
+            translate_store(load_store(), translators[group_name(CRONOGRAMA_STORE)]),
+            read_page(localized_path(AUTOR_MODULE, locale)),
+            translators[group_name(GALLERY_STORE)],
+        )
+        changed += build_search(os.path.join(SEARCH_DIR, locale), docs, locale)
+
+        # Pending is judged on the sources, so outputs skipped above are still accounted for.
+        missing[locale] = [
+            (group, key) for group, keys in groups.items() for key in keys
+            if not translators[group].entries.get(key)
+        ]
+        invalid[locale] = [
+            (group, key) for group, entries in catalog.items() for key, value in entries.items()
+            if value and placeholders(value) != placeholders(key)
+        ]
+    return LocaleReport(changed, missing, invalid)
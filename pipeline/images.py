@@ -0,0 +1,299 @@
+"""Responsive variants for everything under ``public/images``.
+
+Each original is re-encoded to WebP and AVIF at the widths in ``WIDTHS`` (never
+upscaled) plus a tiny blurred WebP placeholder inlined as a data URI. The
+variants land in ``public/optimized/`` named after the original's content
+hash (``<hash>-<width>.<fmt>``), so copies of the same photo in several
+folders are encoded and stored once. ``app/data/images.json`` maps every
+original URL to its dimensions, hash, dominant color, placeholder and
+``srcset`` candidates.
+
+Only originals a page can show are encoded: every photo under
+``gallery/`` (the gallery lists its folders) and any other file a module the
+routes reach, or a generator's template (:data:`GENERATORS`), names.
+
+The stage is incremental: originals whose content hash matches the manifest
+and whose variants are all on disk are skipped, and variants nobody refers
+to any more are removed. Encoding runs in a process pool.
+
+:func:`pictures` turns an ``<img>`` of an original that declares ``sizes``
+into a ``<picture>`` of its variants; generated modules go through it with
+the URL rewrite of :mod:`pipeline.assets`.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from PIL import Image, ImageFilter, ImageOps, features
+except ImportError:  # Pillow is only needed when something must be re-encoded
+    Image = None
+
+from pipeline.cache import get_cache
+from pipeline.patch import read_page, write_if_changed
+from pipeline.trace import span, traced
+
+SOURCE_DIR = os.path.join("public", "images")
+# Templates that name originals before the pages they generate do.
+GENERATORS = ("update_tabs.py", "update_cronograma.py", "update_galeria.py")
+OUT_DIR = os.path.join("public", "optimized")
+MANIFEST = os.path.join("app", "data", "images.json")
+
+EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+WIDTHS = (320, 640, 960, 1280)
+FORMATS = {"webp": {"quality": 78, "method": 6}, "avif": {"quality": 55, "speed": 6}}
+PLACEHOLDER_WIDTH = 16
+
+VERSION = 3
+HASH_CHARS = 16
+
+# A self-closing ``<img>`` alone on its line, and its ``name="..."``/``name={...}`` attributes.
+_IMG = re.compile(r"""^([ \t]*)<img\s((?:[^>"{]|"[^"]*"|\{[^}]*\})*?)\s*/>""", re.MULTILINE)
+_ATTR = re.compile(r"""([\w-]+)=("[^"]*"|\{[^}]*\})""")
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_hash(path: str) -> str:
+    """Content hash of ``path``, re-read only when its stat changed."""
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ctime_ns}\0{st.st_ino}"
+    return get_cache().memo("sha256", key, lambda: _sha256(path))
+
+
+def url_for(path: str) -> str:
+    """Public URL of a file under ``public/``."""
+    return "/" + os.path.relpath(path, "public").replace(os.sep, "/")
+
+
+def scan_originals(source_dir: str = SOURCE_DIR) -> List[str]:
+    found = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(EXTENSIONS):
+                found.append(os.path.join(root, name))
+    return found
+
+
+def shown_originals(
+    originals: List[str], source_dir: str = SOURCE_DIR, generators: Iterable[str] = GENERATORS, plain: bool = False
+) -> List[str]:
+    """The ``originals`` some page shows.
+
+    With ``plain``, only those a page links to as a file, which need their
+    canonical copy: an ``<img>`` that :func:`pictures` expands only loads the
+    variants. The gallery links every photo (its viewer opens the original).
+    """
+    from pipeline.integrity import named_files, named_in, reachable_modules
+
+    named = named_files(reachable_modules())
+    for path in generators:
+        if os.path.isfile(path):
+            text = read_page(path)
+            if plain:
+                text = _IMG.sub(lambda m: "" if _declares_sizes(m.group(2)) else m.group(), text)
+            named |= named_in(text)
+    named = {os.path.abspath(path) for path in named}
+    gallery = os.path.join(os.path.abspath(source_dir), "gallery") + os.sep
+    return [path for path in originals if os.path.abspath(path).startswith(gallery) or os.path.abspath(path) in named]
+
+
+def _formats() -> List[str]:
+    if Image is None:
+        return list(FORMATS)
+    return [fmt for fmt in FORMATS if features.check(fmt)]
+
+
+def encode(job: Tuple[str, str, str]) -> dict:
+    """Encode every variant of one original; runs inside a worker process."""
+    source, digest, out_dir = job
+    with Image.open(source) as original:
+        img = ImageOps.exif_transpose(original)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        width, height = img.size
+
+        variants: Dict[str, List[dict]] = {}
+        widths = sorted({min(w, width) for w in WIDTHS})
+        for fmt in _formats():
+            variants[fmt] = []
+            for w in widths:
+                h = round(height * w / width)
+                path = os.path.join(out_dir, f"{digest[:HASH_CHARS]}-{w}.{fmt}")
+                resized = img if w == width else img.resize((w, h), Image.LANCZOS)
+                resized.save(path, fmt.upper(), **FORMATS[fmt])
+                variants[fmt].append({"w": w, "src": url_for(path)})
+
+        r, g, b = img.convert("RGB").resize((1, 1), Image.BOX).getpixel((0, 0))
+        tiny = img.resize((PLACEHOLDER_WIDTH, max(1, round(height * PLACEHOLDER_WIDTH / width))))
+        tiny = tiny.filter(ImageFilter.GaussianBlur(1))
+        buf = io.BytesIO()
+        tiny.save(buf, "WEBP", quality=40)
+
+    return {
+        "width": width,
+        "height": height,
+        "bytes": os.path.getsize(source),
+        "sha256": digest,
+        "color": f"#{r:02x}{g:02x}{b:02x}",
+        "placeholder": "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii"),
+        "variants": variants,
+    }
+
+
+def load_manifest(path: str = MANIFEST) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return data if data.get("version") == VERSION and data.get("widths") == list(WIDTHS) else {}
+
+
+def _declares_sizes(attrs: str) -> bool:
+    return any(name == "sizes" for name, _ in _ATTR.findall(attrs))
+
+
+def pictures(text: str, images: Optional[Dict[str, dict]] = None) -> str:
+    """Expand every ``<img>`` of an original that declares ``sizes`` into a ``<picture>``.
+
+    Like the gallery's ``Picture``, the AVIF and WebP ``srcSet`` come first and
+    the ``<img>`` falls back to the smallest WebP, with the original's
+    intrinsic size and its dominant color and placeholder behind it. Other
+    attributes are kept; originals missing from the manifest are left as is.
+    """
+    if "<img" not in text:
+        return text
+    if images is None:
+        images = load_manifest().get("images", {})
+
+    def expand(match: "re.Match[str]") -> str:
+        indent, body = match.groups()
+        attrs = dict(_ATTR.findall(body))
+        entry = images.get(attrs.get("src", "")[1:-1])
+        if entry is None or not _declares_sizes(body) or "webp" not in entry["variants"]:
+            return match.group()
+        sizes = attrs.pop("sizes")
+        lines = [f"{indent}<picture>"]
+        for fmt in ("avif", "webp"):
+            if fmt in entry["variants"]:
+                srcset = ", ".join(f"{v['src']} {v['w']}w" for v in entry["variants"][fmt])
+                lines.append(f'{indent}    <source type="image/{fmt}" srcSet="{srcset}" sizes={sizes} />')
+        attrs["src"] = f'"{entry["variants"]["webp"][0]["src"]}"'
+        attrs.setdefault("width", f"{{{entry['width']}}}")
+        attrs.setdefault("height", f"{{{entry['height']}}}")
+        attrs.setdefault("decoding", '"async"')
+        background = f"backgroundColor: '{entry['color']}', backgroundImage: 'url({entry['placeholder']})', backgroundSize: 'cover'"
+        attrs.setdefault("style", f"{{{{ {background} }}}}")
+        lines.append(f"{indent}    <img " + " ".join(f"{k}={v}" for k, v in attrs.items()) + " />")
+        lines.append(f"{indent}</picture>")
+        return "\n".join(lines)
+
+    return _IMG.sub(expand, text)
+
+
+def path_for(url: str) -> str:
+    """Inverse of :func:`url_for`."""
+    return os.path.join("public", *url.lstrip("/").split("/"))
+
+
+def _variant_version() -> str:
+    # Cached variant sets are only valid for the same encoder settings.
+    return f"{VERSION}:{','.join(map(str, WIDTHS))}:{','.join(_formats())}"
+
+
+def _variant_paths(entry: dict) -> List[str]:
+    return [path_for(v["src"]) for variants in entry["variants"].values() for v in variants]
+
+
+def _is_current(digest: str, entry: Optional[dict]) -> bool:
+    if not entry or entry["sha256"] != digest or set(entry["variants"]) != set(_formats()):
+        return False
+    return all(os.path.exists(path) for path in _variant_paths(entry))
+
+
+def _remove_stale(out_dir: str, images: Dict[str, dict]) -> None:
+    if not os.path.isdir(out_dir):
+        return  # nothing encoded yet (an empty gallery)
+    keep = {os.path.abspath(path) for entry in images.values() for path in _variant_paths(entry)}
+    for name in os.listdir(out_dir):
+        path = os.path.join(out_dir, name)
+        if os.path.isfile(path) and os.path.abspath(path) not in keep:
+            os.remove(path)
+
+
+@traced("images")
+def build_images(
+    source_dir: str = SOURCE_DIR,
+    out_dir: str = OUT_DIR,
+    manifest: str = MANIFEST,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    changed: Optional[Iterable[str]] = None,
+    every: bool = False,
+) -> List[str]:
+    """Re-encode new or changed originals; return their URLs.
+
+    ``changed`` lists the originals known to have changed (the watcher passes
+    the paths it was notified about); every other original already in the
+    manifest is trusted without re-hashing it. ``every`` encodes the
+    originals no page shows too (a synthetic corpus has no pages).
+    """
+    previous = {} if force else load_manifest(manifest).get("images", {})
+    by_hash = {entry["sha256"]: entry for entry in previous.values()}
+    hint = None if changed is None else {os.path.abspath(p) for p in changed}
+    cache = get_cache()
+
+    images = {}
+    pending: Dict[str, List[str]] = {}  # digest -> URLs of every copy
+    with span("scan", cat="io"):
+        originals = scan_originals(source_dir)
+        if not every:
+            originals = shown_originals(originals, source_dir)
+    with span("hash", originals=len(originals)):
+        for source in originals:
+            url = url_for(source)
+            trusted = previous.get(url)
+            if hint is not None and trusted and os.path.abspath(source) not in hint and _is_current(trusted["sha256"], trusted):
+                images[url] = trusted
+                continue
+            digest = file_hash(source)
+            entry = previous.get(url) or by_hash.get(digest)
+            if entry is None and not force:
+                entry = cache.get("variants", digest, _variant_version())
+            if _is_current(digest, entry):
+                images[url] = entry
+            elif digest in pending:
+                pending[digest].append(url)
+            else:
+                pending[digest] = [url]
+
+    if pending:
+        if Image is None:
+            raise SystemExit("Falta Pillow para optimizar imágenes: pip install -r requirements.txt")
+        os.makedirs(out_dir, exist_ok=True)
+        jobs_list = [(path_for(urls[0]), digest, out_dir) for digest, urls in pending.items()]
+        # Encoding runs in worker processes: only its wall time is visible here.
+        with span("encode", photos=len(jobs_list)), ProcessPoolExecutor(max_workers=jobs) as pool:
+            for (digest, urls), entry in zip(pending.items(), pool.map(encode, jobs_list)):
+                cache.put("variants", digest, entry, _variant_version())
+                for url in urls:
+                    images[url] = entry
+
+    _remove_stale(out_dir, images)
+    data = {"version": VERSION, "widths": list(WIDTHS), "images": dict(sorted(images.items()))}
+    write_if_changed(manifest, json.dumps(data, ensure_ascii=False, indent=1) + "\n")
+    return [url for urls in pending.values() for url in urls]
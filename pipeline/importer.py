@@ -0,0 +1,379 @@
+"""Bulk import of donated photo batches into the gallery.
+
+``python -m pipeline import <dir-or-zip>`` takes a folder (or a ``.zip``) of
+scans and, in a process pool:
+
+* normalises orientation (EXIF ``Orientation``) and drops the EXIF block,
+  keeping the ICC profile; files with neither are copied byte for byte;
+* dates each photo, trusting the donor's own labels first: an era folder
+  name in the path (``Años 60-70``), then a year (``1965``, ``2020s``) or a
+  decade of the 1900s (``años 60``) in a folder name, then EXIF
+  ``DateTimeOriginal``, which on scans is usually the scanning date, and
+  only then a year standing alone in the file name (``1965.jpg``,
+  ``boda 1965.jpg``; not camera counters such as ``DSC_1965.jpg``);
+* assigns it to the era folder of the existing scheme (:data:`ERAS`);
+* computes a 64-bit difference hash (dHash) for near-duplicate detection.
+
+Back in the parent, photos identical to or within ``--threshold`` bits of a
+gallery photo or of an earlier photo of the batch are skipped; candidates
+come from 8-bit bands of the hash (any two hashes within 7 bits share a
+band), so the check stays near linear on thousands of scans. Undated photos
+are skipped unless ``--era`` names a fallback folder.
+
+Accepted photos are moved into ``public/images/gallery/<era>/``, captions
+found in EXIF ``ImageDescription`` are added to ``content/galeria.json`` in
+one write, and the affected stages (variants of the new files only, asset
+store, gallery index, search) run once for the whole batch. Perceptual
+hashes of gallery photos are kept in the build cache by content hash.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # checked before any work is scheduled
+    Image = None
+
+from pipeline.cache import get_cache
+from pipeline.gallery import GALLERY_DIR, STORE
+from pipeline.images import EXTENSIONS, MANIFEST as IMAGES_MANIFEST, file_hash, load_manifest, url_for
+from pipeline.patch import write_if_changed
+from pipeline.watch import regenerate
+
+# Last year of each era folder; the final one takes everything after.
+ERAS = ((1959, "Años 40-50"), (1979, "Años 60-70"), (1999, "Años 80-90"), (None, "Actualidad"))
+THRESHOLD = 6  # max differing dHash bits of a near-duplicate
+BANDS = 8
+MIN_BITS = 4  # hashes with fewer set (or clear) bits carry too little detail to compare
+VERSION = 1  # of the dHash computation; part of its cache key
+
+_YEAR = re.compile(r"(?<!\d)(19\d{2}|20\d{2})(?!\d)")
+# In file names only a year between spaces, brackets or the name's ends counts.
+_NAMED_YEAR = re.compile(r"(?<![^\s(\[])(19\d{2}|20\d{2})s?(?![^\s)\],-])")
+_DECADE = re.compile(r"a(?:ñ|n)os\s*(\d0)(?!\d)", re.IGNORECASE)
+
+EXIF_IFD = 0x8769
+DATE_TIME_ORIGINAL = 36867
+IMAGE_DESCRIPTION = 270
+
+
+class ImportReport(NamedTuple):
+    imported: List[Tuple[str, str]]  # (source, gallery path)
+    duplicates: List[Tuple[str, str]]  # (source, photo it duplicates)
+    undated: List[str]
+    failed: List[Tuple[str, str]]  # (source, error)
+
+
+def era_for(year: int) -> str:
+    for last, folder in ERAS:
+        if last is None or year <= last:
+            return folder
+    raise AssertionError("ERAS must end with an open era")
+
+
+def year_from_path(relpath: str, taken: str = "") -> Tuple[Optional[int], Optional[str]]:
+    """Year (or era folder) of a photo at ``relpath`` in the donated batch.
+
+    Folder names win, then ``taken`` (EXIF ``DateTimeOriginal``), then the
+    file name.
+    """
+    parts = relpath.replace("\\", "/").split("/")
+    folders = {folder.lower(): folder for _, folder in ERAS}
+    for part in reversed(parts[:-1]):
+        if part.lower() in folders:
+            return None, folders[part.lower()]
+    for part in reversed(parts[:-1]):
+        year = _year_in(part, _YEAR)
+        if year:
+            return year, None
+    if _YEAR.match(taken):
+        return int(taken[:4]), None
+    return _year_in(os.path.splitext(parts[-1])[0], _NAMED_YEAR), None
+
+
+def _year_in(text: str, pattern: "re.Pattern[str]") -> Optional[int]:
+    match = pattern.search(text)
+    if match:
+        return int(match.group(1))
+    match = _DECADE.search(text)
+    if match:
+        # A bare decade is the 1900s; later ones carry four digits ("2020s").
+        return 1900 + int(match.group(1))
+    return None
+
+
+def dhash(img) -> int:
+    """64-bit difference hash: brighter-than-right-neighbour bits of a 9x8 thumbnail."""
+    small = img.convert("L").resize((9, 8), Image.BILINEAR)
+    px = list(small.getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (px[row * 9 + col] > px[row * 9 + col + 1])
+    return bits
+
+
+def analyze(job: Tuple[str, str, str]) -> dict:
+    """Normalise one photo into ``staging``; runs inside a worker process."""
+    source, relpath, staging = job
+    try:
+        with Image.open(source) as original:
+            exif = original.getexif()
+            taken = str(exif.get_ifd(EXIF_IFD).get(DATE_TIME_ORIGINAL) or "")
+            year, folder = year_from_path(relpath, taken)
+            description = str(exif.get(IMAGE_DESCRIPTION) or "").strip()
+
+            img = ImageOps.exif_transpose(original)
+            fingerprint = dhash(img)
+            ext = os.path.splitext(source)[1].lower()
+            if not exif:
+                data = None  # nothing to strip or rotate
+            else:
+                buf = io.BytesIO()
+                fmt = "PNG" if original.format == "PNG" else "WEBP" if original.format == "WEBP" else "JPEG"
+                params = {"quality": 92} if fmt == "JPEG" else {}
+                icc = original.info.get("icc_profile")
+                if icc:
+                    params["icc_profile"] = icc
+                img.save(buf, fmt, **params)
+                ext = {"PNG": ".png", "WEBP": ".webp", "JPEG": ".jpg"}[fmt]
+                data = buf.getvalue()
+        if data is None:
+            with open(source, "rb") as f:
+                data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        staged = os.path.join(staging, digest + ext)
+        with open(staged, "wb") as f:
+            f.write(data)
+    except (OSError, SyntaxError, ValueError) as error:  # PIL reports broken files with all three
+        return {"source": relpath, "error": (str(error) or type(error).__name__).replace(source, relpath)}
+    return {
+        "source": relpath,
+        "staged": staged,
+        "sha256": digest,
+        "dhash": fingerprint,
+        "year": year,
+        "era": folder or (era_for(year) if year else None),
+        "description": description,
+    }
+
+
+def hash_existing(path: str) -> int:
+    with Image.open(path) as img:
+        return dhash(ImageOps.exif_transpose(img))
+
+
+class NearDuplicates:
+    """Hamming-distance index over 64-bit hashes, bucketed by 8-bit bands."""
+
+    def __init__(self, threshold: int = THRESHOLD):
+        if threshold >= BANDS:
+            raise SystemExit(f"--threshold debe ser menor que {BANDS}")
+        self.threshold = threshold
+        self.buckets: Dict[Tuple[int, int], List[Tuple[int, str]]] = {}
+
+    def _bands(self, value: int) -> Iterable[Tuple[int, int]]:
+        return ((band, (value >> (band * 8)) & 0xFF) for band in range(BANDS))
+
+    def find(self, value: int) -> Optional[str]:
+        if not MIN_BITS <= bin(value).count("1") <= 64 - MIN_BITS:
+            return None  # flat or blank scans all hash alike; only exact copies count
+        for key in self._bands(value):
+            for other, label in self.buckets.get(key, ()):
+                if bin(value ^ other).count("1") <= self.threshold:
+                    return label
+        return None
+
+    def add(self, value: int, label: str) -> None:
+        for key in self._bands(value):
+            self.buckets.setdefault(key, []).append((value, label))
+
+
+def existing_photos(pool: ProcessPoolExecutor) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Content hash -> URL and content hash -> dHash of every gallery photo."""
+    known = load_manifest(IMAGES_MANIFEST).get("images", {})
+    by_sha = {}
+    for root, _, files in os.walk(GALLERY_DIR):
+        for name in sorted(files):
+            if name.lower().endswith(EXTENSIONS):
+                path = os.path.join(root, name)
+                url = url_for(path)
+                sha = known[url]["sha256"] if url in known else file_hash(path)
+                by_sha.setdefault(sha, url)
+    cache = get_cache()
+    hashes = {sha: cache.get("dhash", sha, VERSION) for sha in by_sha}
+    missing = [sha for sha, value in hashes.items() if value is None]
+    paths = [os.path.join("public", *by_sha[sha].lstrip("/").split("/")) for sha in missing]
+    for sha, value in zip(missing, pool.map(hash_existing, paths, chunksize=8)):
+        hashes[sha] = f"{value:016x}"
+        cache.put("dhash", sha, hashes[sha], VERSION)
+    return by_sha, hashes
+
+
+def _sources(root: str) -> List[Tuple[str, str]]:
+    found = []
+    for base, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(EXTENSIONS):
+                path = os.path.join(base, name)
+                found.append((path, os.path.relpath(path, root)))
+    return found
+
+
+def _member_name(member: zipfile.ZipInfo) -> str:
+    # Without the UTF-8 flag zipfile decodes names as cp437, but most tools
+    # that omit the flag still write UTF-8 ("Años" would become "A├▒os").
+    if member.flag_bits & 0x800:
+        return member.filename
+    try:
+        return member.filename.encode("cp437").decode("utf-8")
+    except UnicodeError:
+        return member.filename
+
+
+def _extract(archive: str, target: str) -> None:
+    """Extract the images of a zip, refusing members that escape ``target``."""
+    with zipfile.ZipFile(archive) as zf:
+        for member in zf.infolist():
+            name = os.path.normpath(_member_name(member))
+            if member.is_dir() or not name.lower().endswith(EXTENSIONS):
+                continue
+            if os.path.isabs(name) or name.startswith(".."):
+                raise SystemExit(f"Ruta no permitida en {archive}: {member.filename}")
+            path = os.path.join(target, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with zf.open(member) as src, open(path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+
+def _destination(folder: str, name: str, planned: Set[str]) -> str:
+    """First free gallery path for ``name``, skipping the ``planned`` targets of this run.
+
+    A dry run moves nothing, so the paths already handed out are only in
+    ``planned``; the chosen one is added to it.
+    """
+    directory = os.path.join(GALLERY_DIR, folder)
+    stem, ext = os.path.splitext(name)
+    path = os.path.join(directory, stem + ext.lower())
+    n = 2
+    while os.path.exists(path) or os.path.normcase(path) in planned:
+        path = os.path.join(directory, f"{stem} ({n}){ext.lower()}")
+        n += 1
+    planned.add(os.path.normcase(path))
+    return path
+
+
+def dump_store(store: dict) -> str:
+    """``content/galeria.json`` in its hand-written layout (one line per simple category)."""
+    lines = []
+    for cat in store["categorias"]:
+        if "descriptions" not in cat:
+            lines.append("        " + json.dumps(cat, ensure_ascii=False))
+            continue
+        fields = []
+        for key, value in cat.items():
+            if key == "descriptions":
+                body = ",\n".join(
+                    f"                {json.dumps(n, ensure_ascii=False)}: {json.dumps(t, ensure_ascii=False)}"
+                    for n, t in value.items()
+                )
+                fields.append(f'            "descriptions": {{\n{body}\n            }}')
+            else:
+                fields.append(f"            {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}")
+        lines.append("        {\n" + ",\n".join(fields) + "\n        }")
+    return '{\n    "categorias": [\n' + ",\n".join(lines) + "\n    ]\n}\n"
+
+
+def _add_descriptions(captions: Dict[str, Dict[str, str]], store_path: str = STORE) -> bool:
+    with open(store_path, "r", encoding="utf-8") as f:
+        store = json.load(f)
+    by_folder = {cat.get("folder"): cat for cat in store["categorias"]}
+    for folder, names in captions.items():
+        cat = by_folder.get(folder)
+        if cat is None:
+            cat = by_folder[folder] = {"folder": folder}
+            store["categorias"].append(cat)
+        cat.setdefault("descriptions", {}).update(names)
+    return write_if_changed(store_path, dump_store(store))
+
+
+def import_batch(
+    source: str,
+    jobs: Optional[int] = None,
+    era: Optional[str] = None,
+    threshold: int = THRESHOLD,
+    dry_run: bool = False,
+) -> ImportReport:
+    """Import every image under ``source`` (a folder or a zip) into the gallery."""
+    if Image is None:
+        raise SystemExit("Falta Pillow para importar imágenes: pip install -r requirements.txt")
+    if era is not None and era not in {folder for _, folder in ERAS}:
+        raise SystemExit(f"--era debe ser una de: {', '.join(folder for _, folder in ERAS)}")
+    report = ImportReport([], [], [], [])
+    index = NearDuplicates(threshold)
+    cache = get_cache()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = source
+        if zipfile.is_zipfile(source):
+            root = os.path.join(tmp, "zip")
+            _extract(source, root)
+        elif not os.path.isdir(source):
+            raise SystemExit(f"{source} no es una carpeta ni un .zip")
+        staging = os.path.join(tmp, "staging")
+        os.makedirs(staging)
+        jobs_list = [(path, rel, staging) for path, rel in _sources(root)]
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            by_sha, hashes = existing_photos(pool)
+            for sha, value in hashes.items():
+                index.add(int(value, 16), by_sha[sha])
+            results = list(pool.map(analyze, jobs_list, chunksize=8))
+
+        captions: Dict[str, Dict[str, str]] = {}
+        moved = []
+        planned: Set[str] = set()
+        for result in results:
+            if "error" in result:
+                report.failed.append((result["source"], result["error"]))
+                continue
+            duplicate = by_sha.get(result["sha256"]) or index.find(result["dhash"])
+            if duplicate:
+                report.duplicates.append((result["source"], duplicate))
+                continue
+            folder = result["era"] or era
+            if folder is None:
+                report.undated.append(result["source"])
+                continue
+            name = os.path.splitext(os.path.basename(result["source"]))[0] + os.path.splitext(result["staged"])[1]
+            target = _destination(folder, name, planned)
+            index.add(result["dhash"], url_for(target))
+            by_sha[result["sha256"]] = url_for(target)
+            cache.put("dhash", result["sha256"], f"{result['dhash']:016x}", VERSION)
+            report.imported.append((result["source"], target))
+            if dry_run:
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.move(result["staged"], target)
+            moved.append(target)
+            if result["description"]:
+                captions.setdefault(folder, {})[os.path.basename(target)] = result["description"]
+
+    if dry_run or not moved:
+        return report
+    # One batch through the same stages the watcher runs for these paths.
+    paths = {os.path.normpath(p) for p in moved}
+    if captions and _add_descriptions(captions):
+        paths.add(os.path.normpath(STORE))
+    regenerate(paths)
+    return report
@@ -0,0 +1,398 @@
+"""Build-time check of every link and asset reference the site ships.
+
+The deploy is whatever the routes reach. Starting from the route files under
+``app/`` (``page``, ``layout``, ``loading``, ``error``, ``not-found``,
+``template``), the checker follows static and dynamic imports to every
+module a bundle can load, and from each one extracts:
+
+* relative and ``@/`` import specifiers, which must resolve to a file;
+* URLs of files under ``public/`` (``/assets/...``, a ``srcSet`` candidate
+  list, ``url('...')`` in a Tailwind class, ...). A template literal such as
+  ``/search/${name}.json`` references every file under its prefix. Any
+  absolute URL in a ``src``/``srcSet``/``poster`` value or a ``url()`` is
+  checked, so one whose first folder does not exist (``/asets/x.jpg``) is
+  broken too;
+* ``href`` targets, which must be a route (a folder with a ``page``) or a
+  public file.
+
+``content/galeria.json`` is checked too: the gallery folders, captions and
+covers it names must exist under ``public/images/gallery``.
+
+A file under ``public/`` that no reachable module refers to is an orphan: it
+is deployed but never requested. Originals under ``public/images`` are the
+exception: :mod:`pipeline.publish` only exports those a page links to. The
+ones in the images manifest are in use through their variants or canonical
+``/assets/`` copy; any other is an orphan unless a page names it, even when
+another copy of the same photo is used, so unused photos still show up here.
+
+``public/assets`` and ``public/optimized`` are generated by ``python -m
+pipeline build`` and not committed. When a URL into them is not on disk (a
+fresh checkout), it is checked against the files the build would write, from
+``app/data/assets.json`` and the images manifest.
+
+The references extracted from each module are kept in the build cache
+(:mod:`pipeline.cache`) by content hash, so a recheck only re-reads the
+modules that changed; resolving them is a few ``stat`` calls. That keeps the
+check cheap enough for ``update`` and ``watch`` to run it after every
+generation; ``python -m pipeline check`` lists everything and fails on
+broken references.
+"""
+
+import difflib
+import json
+import os
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from pipeline.assets import ASSET_DIR, MAP as ASSETS_MAP, load_map
+from pipeline.cache import get_cache
+from pipeline.images import MANIFEST as IMAGES_MANIFEST, OUT_DIR as IMAGES_OUT_DIR, file_hash, load_manifest
+from pipeline.patch import read_page
+from pipeline.trace import traced
+
+APP_DIR = "app"
+PUBLIC_DIR = "public"
+GALLERY_DIR = os.path.join(PUBLIC_DIR, "images", "gallery")
+GALLERY_STORE = os.path.join("content", "galeria.json")
+
+ROUTE_FILES = ("page", "layout", "loading", "error", "not-found", "template")
+MODULE_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js", ".mjs")
+# Files that may reference others: modules plus what they import as data or styles.
+SCANNED = MODULE_EXTENSIONS + (".css", ".json")
+# Served by convention, not by reference.
+WELL_KNOWN = frozenset(("favicon.ico", "robots.txt", "sitemap.xml", "manifest.webmanifest"))
+# Written by ``python -m pipeline build``, so possibly absent: always URL roots.
+GENERATED_ROOTS = (os.path.basename(ASSET_DIR), os.path.basename(IMAGES_OUT_DIR))
+
+VERSION = 2
+
+_IMPORTS = (
+    re.compile(r"""^\s*(?:import|export)\s[^'"`;]*?from\s*['"]([^'"]+)['"]""", re.MULTILINE),
+    re.compile(r"""^\s*import\s*['"]([^'"]+)['"]""", re.MULTILINE),
+)
+_DYNAMIC_IMPORT = re.compile(r"""\bimport\(\s*['"]([^'"]+)['"]\s*\)""")
+_SOURCE = re.compile(
+    r"""\b(?:src|srcSet|poster)['"]?\s*[:=]\s*\{?\s*(['"`])(/[^/'"`][^'"`]*)\1|\burl\(\s*(['"]?)(/[^/'")][^'")]*)\3\s*\)"""
+)
+_HREF = re.compile(r"""\bhref['"]?\s*[:=]\s*\{?\s*(['"`])(/[^'"`]*)\1""")
+_EXTENSION = re.compile(r"\.[A-Za-z0-9]{2,5}$")
+
+
+class Broken(NamedTuple):
+    source: str
+    line: int
+    target: str
+    message: str
+
+
+class IntegrityReport(NamedTuple):
+    broken: List[Broken]
+    orphans: List[Tuple[str, int]]  # (path, bytes) of unreferenced public files
+    modules: int
+    references: int
+
+
+# -- extraction -----------------------------------------------------------------
+
+def public_roots(public_dir: str = PUBLIC_DIR) -> List[str]:
+    """Top-level names under ``public/`` and the generated folders."""
+    found = set(GENERATED_ROOTS)
+    if os.path.isdir(public_dir):
+        found.update(name for name in os.listdir(public_dir) if not name.startswith("."))
+    return sorted(found)
+
+
+def _url_pattern(roots: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    names = "|".join(re.escape(name) for name in sorted(roots, key=len, reverse=True))
+    if not names:
+        return None
+    # Spaces are allowed (folder names have them); which prefix is the URL is decided on disk.
+    return re.compile(rf"""(?<![\w.:/-])/(?:{names})(?:/[^'"`()\n,]*)?(?![\w.-])""")
+
+
+def _line(text: str, offset: int) -> int:
+    return text.count("\n", 0, offset) + 1
+
+
+def extract(text: str, roots: Iterable[str]) -> dict:
+    """Imports, public URLs and ``href`` targets of one module, with their lines."""
+    imports = []
+    for pattern in _IMPORTS:
+        imports += [[_line(text, m.start(1)), m.group(1), False] for m in pattern.finditer(text)]
+    imports += [[_line(text, m.start(1)), m.group(1), True] for m in _DYNAMIC_IMPORT.finditer(text)]
+    imports.sort()
+
+    pattern = _url_pattern(roots)
+    urls = [] if pattern is None else [[_line(text, m.start()), m.group()] for m in pattern.finditer(text)]
+    public = tuple(f"/{name}" for name in roots)
+    # Source values under an unknown folder; the ones under a root were matched above.
+    for m in _SOURCE.finditer(text):
+        group = 2 if m.group(2) is not None else 4
+        offset = m.start(group)
+        for candidate in m.group(group).split(","):
+            url = candidate.strip()
+            first = url[1:].split("/")[0].split("?")[0]
+            if url.startswith("/") and "${" not in first and first not in roots:
+                urls.append([_line(text, offset), url])
+            offset += len(candidate) + 1
+    urls.sort()
+    links = [
+        [_line(text, m.start(2)), m.group(2)]
+        for m in _HREF.finditer(text)
+        if not m.group(2).startswith("//") and not (m.group(2) + "/").startswith(tuple(p + "/" for p in public))
+    ]
+    return {"imports": imports, "urls": urls, "links": links}
+
+
+def module_references(path: str, roots: List[str]) -> dict:
+    """:func:`extract` of ``path``, cached by its content hash."""
+    version = f"{VERSION}:{','.join(roots)}"
+    return get_cache().memo("references", file_hash(path), lambda: extract(read_page(path), roots), version)
+
+
+# -- resolution -----------------------------------------------------------------
+
+def resolve_module(base: str, spec: str) -> Optional[str]:
+    """File a relative or ``@/`` import specifier of ``base`` resolves to."""
+    if spec.startswith("@/"):
+        path = os.path.normpath(spec[2:])
+    else:
+        path = os.path.normpath(os.path.join(os.path.dirname(base), spec))
+    candidates = [path] + [path + ext for ext in MODULE_EXTENSIONS]
+    candidates += [os.path.join(path, "index" + ext) for ext in MODULE_EXTENSIONS]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _public_path(url: str, public_dir: str = PUBLIC_DIR) -> str:
+    url = unquote(url.split("?")[0].split("#")[0])
+    return os.path.join(public_dir, *url.lstrip("/").split("/"))
+
+
+def split_url(raw: str, public_dir: str = PUBLIC_DIR) -> str:
+    """The URL at the start of ``raw``, a match that may run past it.
+
+    A ``srcSet`` candidate is followed by its descriptor and a folder name may
+    contain spaces, so the longest whitespace-delimited prefix that exists
+    wins; a broken one is cut after its file extension, if it has one.
+    """
+    raw = raw.rstrip()
+    cuts = [m.start() for m in re.finditer(r"\s+", raw)] + [len(raw)]
+    prefixes = [raw[:cut] for cut in cuts]
+    for prefix in reversed(prefixes):
+        if os.path.isfile(_public_path(prefix, public_dir)):
+            return prefix
+    for prefix in reversed(prefixes):
+        if _EXTENSION.search(prefix):
+            return prefix
+    return prefixes[0]
+
+
+def generated_files(
+    images_manifest: str = IMAGES_MANIFEST, assets_map: str = ASSETS_MAP, public_dir: str = PUBLIC_DIR
+) -> Set[str]:
+    """Public files ``python -m pipeline build`` writes: canonical blobs and variants."""
+    urls = set(load_map(assets_map).values())
+    for entry in load_manifest(images_manifest).get("images", {}).values():
+        for variants in entry.get("variants", {}).values():
+            urls.update(variant["src"] for variant in variants)
+    return {_public_path(url, public_dir) for url in urls}
+
+
+def routes(app_dir: str = APP_DIR) -> List[List[str]]:
+    """Segments of every route; route groups ``(x)`` and slots ``@x`` take none."""
+    found = []
+    for base, dirs, files in os.walk(app_dir):
+        dirs[:] = [d for d in dirs if not d.startswith(("_", "."))]
+        if any(os.path.splitext(f) == ("page", ext) for f in files for ext in MODULE_EXTENSIONS):
+            parts = os.path.relpath(base, app_dir).split(os.sep)
+            found.append([p for p in parts if p != "." and not p.startswith(("(", "@"))])
+    return found
+
+
+def _matches(segments: List[str], route: List[str]) -> bool:
+    for i, part in enumerate(route):
+        if part.startswith("[[...") or part.startswith("[..."):
+            return len(segments) > i or part.startswith("[[")
+        if i >= len(segments) or not (part.startswith("[") or part == segments[i]):
+            return False
+    return len(segments) == len(route)
+
+
+def is_route(link: str, known: List[List[str]]) -> bool:
+    path = unquote(link.split("?")[0].split("#")[0])
+    segments = [s for s in path.split("/") if s]
+    return any(_matches(segments, route) for route in known)
+
+
+def _suggest(path: str) -> str:
+    """`` (¿quizá X?)`` with the closest sibling of a missing file or folder."""
+    directory, name = os.path.split(path)
+    while directory and not os.path.isdir(directory):
+        directory, name = os.path.split(directory)
+    if not directory:
+        return ""
+    siblings = os.listdir(directory)
+    lowered = {s.lower(): s for s in siblings}
+    close = difflib.get_close_matches(name.lower(), list(lowered), n=1, cutoff=0.6)
+    return f" (¿quizá {lowered[close[0]]!r}?)" if close else ""
+
+
+# -- graph ----------------------------------------------------------------------
+
+def entries(app_dir: str = APP_DIR) -> List[str]:
+    """Route files: the roots of the reference graph."""
+    found = []
+    for base, dirs, files in os.walk(app_dir):
+        dirs.sort()
+        for name in sorted(files):
+            stem, ext = os.path.splitext(name)
+            if stem in ROUTE_FILES and ext in MODULE_EXTENSIONS:
+                found.append(os.path.join(base, name))
+    return found
+
+
+def reachable_modules(app_dir: str = APP_DIR, public_dir: str = PUBLIC_DIR) -> List[str]:
+    """Every module and data file the routes load, through static and dynamic imports."""
+    roots = public_roots(public_dir)
+    seen: Set[str] = set()
+    stack = entries(app_dir)
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for _, spec, _ in module_references(path, roots)["imports"]:
+            target = resolve_module(path, spec) if spec.startswith((".", "@/")) else None
+            if target is not None and target.endswith(SCANNED):
+                stack.append(target)
+    return sorted(seen)
+
+
+def _existing(urls: Iterable[str], public_dir: str) -> Set[str]:
+    found = set()
+    for raw in urls:
+        if "${" not in raw:
+            target = _public_path(split_url(raw, public_dir), public_dir)
+            if os.path.isfile(target):
+                found.add(target)
+    return found
+
+
+def named_files(paths: Iterable[str], public_dir: str = PUBLIC_DIR) -> Set[str]:
+    """Files under ``public/`` whose URL one of ``paths`` contains."""
+    roots = public_roots(public_dir)
+    return _existing((raw for path in paths for _, raw in module_references(path, roots)["urls"]), public_dir)
+
+
+def named_in(text: str, public_dir: str = PUBLIC_DIR) -> Set[str]:
+    """Files under ``public/`` whose URL ``text`` contains."""
+    return _existing((raw for _, raw in extract(text, public_roots(public_dir))["urls"]), public_dir)
+
+
+def _walk_public(public_dir: str) -> Dict[str, int]:
+    sizes = {}
+    for base, dirs, files in os.walk(public_dir):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in files:
+            if not name.startswith("."):
+                path = os.path.join(base, name)
+                sizes[path] = os.path.getsize(path)
+    return sizes
+
+
+def _check_gallery(store_path: str, gallery_dir: str) -> List[Broken]:
+    try:
+        text = read_page(store_path)
+    except FileNotFoundError:
+        return []
+    broken = []
+
+    def report(value: str, path: str, message: str) -> None:
+        offset = text.find(json.dumps(value, ensure_ascii=False))
+        broken.append(Broken(store_path, _line(text, max(offset, 0)), path, message + _suggest(path)))
+
+    for cat in json.loads(text)["categorias"]:
+        folder = cat.get("folder")
+        if folder is None:
+            continue  # a planned category, shown as "Próximamente"
+        directory = os.path.join(gallery_dir, folder)
+        if not os.path.isdir(directory):
+            report(folder, directory, f"la carpeta {folder!r} no existe en {gallery_dir}")
+            continue
+        for name in list(cat.get("descriptions", {})) + ([cat["cover"]] if "cover" in cat else []):
+            path = os.path.join(directory, name)
+            if not os.path.isfile(path):
+                report(name, path, f"{name!r} no está en {directory}")
+    return broken
+
+
+@traced("integrity")
+def check_integrity(
+    app_dir: str = APP_DIR,
+    public_dir: str = PUBLIC_DIR,
+    gallery_store: str = GALLERY_STORE,
+    gallery_dir: str = GALLERY_DIR,
+    images_manifest: str = IMAGES_MANIFEST,
+    assets_map: str = ASSETS_MAP,
+) -> IntegrityReport:
+    """Walk the reference graph from every route; report broken references and orphans."""
+    roots = public_roots(public_dir)
+    generated = generated_files(images_manifest, assets_map, public_dir)
+    known_routes = routes(app_dir)
+    files = _walk_public(public_dir)
+
+    broken: List[Broken] = []
+    referenced: Set[str] = set()
+    prefixes: Set[str] = set()
+    seen: Set[str] = set()
+    stack = entries(app_dir)
+    count = 0
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        refs = module_references(path, roots)
+        count += len(refs["imports"]) + len(refs["urls"]) + len(refs["links"])
+
+        for line, spec, _ in refs["imports"]:
+            if not spec.startswith((".", "@/")):
+                continue  # a package: resolved by the bundler from node_modules
+            target = resolve_module(path, spec)
+            if target is None:
+                broken.append(Broken(path, line, spec, f"importa {spec!r}, que no existe"))
+            elif target.endswith(SCANNED):
+                stack.append(target)
+
+        for line, raw in refs["urls"]:
+            if "${" in raw:
+                prefixes.add(_public_path(raw[:raw.index("${")], public_dir))
+                continue
+            url = split_url(raw, public_dir)
+            target = _public_path(url, public_dir)
+            if os.path.isfile(target) or target in generated:
+                referenced.add(target)
+            else:
+                broken.append(Broken(path, line, url, f"{url} no existe en {public_dir}/" + _suggest(target)))
+
+        for line, link in refs["links"]:
+            if not is_route(link, known_routes):
+                broken.append(Broken(path, line, link, f"el enlace {link} no lleva a ninguna página"))
+
+    broken += _check_gallery(gallery_store, gallery_dir)
+
+    # Served as variants or canonical blobs; the export leaves them out.
+    stored = {_public_path(url, public_dir) for url in load_manifest(images_manifest).get("images", {})}
+    orphans = [
+        (path, size) for path, size in sorted(files.items())
+        if path not in referenced
+        and path not in stored
+        and not path.startswith(tuple(prefixes))
+        and os.path.relpath(path, public_dir) not in WELL_KNOWN
+    ]
+    broken.sort()
+    return IntegrityReport(broken, orphans, len(seen), count)
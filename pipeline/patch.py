@@ -0,0 +1,236 @@
+"""Single-pass section patching for the generated TSX modules.
+
+Each tab lives in its own module under ``app/tabs/``; the generators own the
+tab's function and leave the module's imports to the hand-written preamble.
+A module is read once and split into an index of top-level sections: every
+top-level ``function Name`` declaration together with the ``//`` comment
+lines directly above it (``// Tab 2: Proyecto ...``), up to the brace that
+closes its body. Boundaries come from :mod:`pipeline.tsx`, which skips
+strings, template literals, comments and JSX, so sections are found by name
+whatever their comments say or contain. Any number of sections can then be
+replaced in one linear walk over the index and written back atomically.
+
+Patching is incremental: a sidecar manifest (``.page-sections.json``) records
+the hash of every section as last written together with the page's size and
+mtime. When neither the page nor the requested sections changed, the page is
+not even read; section offsets are kept in the build cache
+(:mod:`pipeline.cache`) by content hash, so a page whose bytes were seen
+before (only the mtime moved, or a reverted edit) is not re-scanned;
+otherwise only differing sections are replaced, and nothing is written when
+the result would be byte-identical, so the page's mtime (and the dev
+server's compile cache) is left alone.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, NamedTuple, Optional
+
+from pipeline.cache import get_cache
+from pipeline.trace import span
+from pipeline.tsx import VERSION as TSX_VERSION, top_level_functions, with_header_comments
+
+PAGE = os.path.join("app", "page.tsx")
+TABS_DIR = os.path.join("app", "tabs")
+MANIFEST = ".page-sections.json"
+
+class Section(NamedTuple):
+    name: str
+    start: int  # offset of the first header comment (or the declaration)
+    end: int  # offset just past the closing brace
+
+
+class PageIndex:
+    """Offsets of every top-level section of a TSX source, built in one pass.
+
+    ``offsets`` (name -> ``[start, end]``) skips the scan; :func:`patch_page`
+    passes the table cached for the same content hash.
+    """
+
+    def __init__(self, text: str, offsets: Optional[Dict[str, List[int]]] = None):
+        self.text = text
+        if offsets is None:
+            offsets = {
+                name: (with_header_comments(text, start), end)
+                for name, (start, end) in top_level_functions(text).items()
+            }
+        self.sections: Dict[str, Section] = {name: Section(name, *span) for name, span in offsets.items()}
+
+    def offsets(self) -> Dict[str, List[int]]:
+        return {name: [s.start, s.end] for name, s in self.sections.items()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sections
+
+    def get(self, name: str) -> str:
+        section = self.sections[name]
+        return self.text[section.start:section.end]
+
+    def patched(self, replacements: Dict[str, str]) -> "PageIndex":
+        """Return the index of the text with each named section swapped for its replacement.
+
+        Replacements hold the whole section, header comment included, and end
+        at the closing ``}``. Names missing from the index are ignored. The
+        new offsets are shifted arithmetically rather than re-scanned.
+        """
+        parts = []
+        offsets = {}
+        pos = 0
+        shift = 0
+        for section in sorted(self.sections.values(), key=lambda s: s.start):
+            if section.name not in replacements:
+                offsets[section.name] = [section.start + shift, section.end + shift]
+                continue
+            replacement = replacements[section.name].rstrip("\n")
+            parts.append(self.text[pos:section.start])
+            parts.append(replacement)
+            offsets[section.name] = [section.start + shift, section.start + shift + len(replacement)]
+            shift += len(replacement) - (section.end - section.start)
+            pos = section.end
+        parts.append(self.text[pos:])
+        return PageIndex("".join(parts), offsets)
+
+    def apply(self, replacements: Dict[str, str]) -> str:
+        return self.patched(replacements).text
+
+
+def read_page(path: str = PAGE) -> str:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _file_mode(path: str) -> int:
+    # mkstemp creates 0600 files; keep the mode of the file being replaced.
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomic(path: str, text: str) -> None:
+    """Write ``text`` to a sibling temp file and rename it over ``path``."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_if_changed(path: str, text: str) -> bool:
+    """Write ``text`` atomically unless ``path`` already holds it."""
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, text)
+    return True
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _stat_key(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_manifest(path: str = MANIFEST) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+class PatchResult(NamedTuple):
+    missing: List[str]
+    changed: List[str]
+
+
+def patch_page(
+    replacements: Dict[str, str],
+    path: str = PAGE,
+    manifest: str = MANIFEST,
+    preamble: Optional[str] = None,
+) -> PatchResult:
+    """Replace the sections of ``path`` that differ from ``replacements``.
+
+    Runs at most one read/scan/write cycle and returns the names that could
+    not be found and the names that were actually rewritten. If ``path`` does
+    not exist and a ``preamble`` is given, the module is created from it.
+    """
+    created = preamble is not None and not os.path.exists(path)
+    if created:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sections = "\n\n".join(text.rstrip("\n") for text in replacements.values())
+        write_atomic(path, preamble + sections + "\n")
+    wanted = {name: content_hash(text.rstrip("\n")) for name, text in replacements.items()}
+    entries = load_manifest(manifest).get(path, {})
+    recorded = entries.get("sections", {})
+    if entries.get("stat") == _stat_key(path) and all(recorded.get(n) == h for n, h in wanted.items()):
+        return PatchResult([], [])
+
+    with span("read", cat="io"):
+        text = read_page(path)
+    cache = get_cache()
+    # Bytes seen before (e.g. only the mtime moved): reuse the offsets.
+    digest = content_hash(text)
+    cached = cache.get("tsx-offsets", digest, TSX_VERSION)
+    with span("scan", cached=cached is not None):
+        index = PageIndex(text, cached)
+    if cached is None:
+        cache.put("tsx-offsets", digest, index.offsets(), TSX_VERSION)
+    missing = [name for name in replacements if name not in index]
+    changed = [
+        name for name in replacements
+        if name in index and content_hash(index.get(name)) != wanted[name]
+    ]
+    if changed:
+        with span("apply", sections=len(changed)):
+            index = index.patched({name: replacements[name] for name in changed})
+        with span("write", cat="io"):
+            write_atomic(path, index.text)
+        cache.put("tsx-offsets", content_hash(index.text), index.offsets(), TSX_VERSION)
+
+    sections = {name: content_hash(index.get(name)) for name in index.sections}
+    data = load_manifest(manifest)
+    data[path] = {"stat": _stat_key(path), "sections": sections}
+    write_if_changed(manifest, json.dumps(data, indent=2, sort_keys=True) + "\n")
+    return PatchResult(missing, list(replacements) if created else changed)
+
+
+class Module(NamedTuple):
+    path: str
+    preamble: str  # imports used when the module has to be created
+    sections: Dict[str, str]
+
+
+def patch_modules(modules: List[Module], transform=None) -> PatchResult:
+    """Patch several modules, each in its own read/scan/write cycle.
+
+    ``transform`` is applied to every section before patching (the updaters
+    use it to canonicalise asset URLs); its span is per section, while the
+    scan and splice, done once for the whole module, fall under the module's.
+    """
+    missing, changed = [], []
+    for module in modules:
+        with span(f"patch {module.path}"):
+            sections = {}
+            for name, text in module.sections.items():
+                with span(f"transform {name}", cat="section", chars=len(text)):
+                    sections[name] = text if transform is None else transform(text)
+            result = patch_page(sections, module.path, preamble=module.preamble)
+        missing += result.missing
+        changed += result.changed
+    return PatchResult(missing, changed)
@@ -0,0 +1,209 @@
+"""Static export of the portal, precompressed, for serving without Node.
+
+``python -m pipeline publish`` runs ``npm run build`` with
+``NEXT_OUTPUT=export`` (see ``next.config.ts``), which renders every tab into
+plain files under ``out/``, and then post-processes the export:
+
+* the originals under ``/images/`` that no page links to directly are
+  removed: next copies all of ``public/``, but the pages show photos through
+  their variants or canonical ``/assets/`` copy, and ``python -m pipeline
+  check`` lists the originals nothing uses at all;
+* every text asset (HTML, JS, CSS, JSON, SVG, ...) gets ``.gz`` and ``.br``
+  siblings next to it, kept only when they are actually smaller. Brotli needs
+  the optional ``Brotli`` package; without it only gzip is produced. A
+  sibling the previous manifest recorded is removed once its file is gone;
+  other ``.gz``/``.br`` files (downloads) are served as they are.
+* ``out/asset-manifest.json`` lists every servable URL with its MIME type,
+  size, ETag, ``Cache-Control`` and precompressed sizes. Content-hashed URLs
+  (``/_next/static/``, ``/assets/``, ``/optimized/``) are immutable for a
+  year; everything else must be revalidated.
+
+:mod:`pipeline.serve` serves ``out/`` from that manifest. Compression is
+incremental: a variant newer than its source is kept.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+try:
+    import brotli
+except ImportError:  # gzip alone still covers every browser
+    brotli = None
+
+from pipeline.images import SOURCE_DIR as IMAGES_DIR, url_for
+from pipeline.integrity import named_files, reachable_modules
+from pipeline.patch import write_if_changed
+from pipeline.trace import span
+
+OUT_DIR = "out"
+MANIFEST_NAME = "asset-manifest.json"
+
+COMPRESSIBLE = (".html", ".js", ".mjs", ".css", ".json", ".txt", ".svg", ".xml", ".webmanifest", ".map", ".ico")
+ENCODINGS = {".br": "br", ".gz": "gzip"}
+MIN_SIZE = 256  # below one packet compression saves nothing
+
+IMMUTABLE_PREFIXES = ("/_next/static/", "/assets/", "/optimized/")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=0, must-revalidate"
+
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("image/webp", ".webp")
+
+
+def run_export() -> None:
+    npm = shutil.which("npm")
+    if npm is None:
+        raise SystemExit("No se encontró npm; hace falta Node para generar la exportación")
+    subprocess.run([npm, "run", "build"], env={**os.environ, "NEXT_OUTPUT": "export"}, check=True)
+
+
+def url_of(path: str, out_dir: str) -> str:
+    return "/" + os.path.relpath(path, out_dir).replace(os.sep, "/")
+
+
+def cache_control(url: str) -> str:
+    return IMMUTABLE if url.startswith(IMMUTABLE_PREFIXES) else REVALIDATE
+
+
+def content_type(path: str) -> str:
+    kind, encoding = mimetypes.guess_type(path)
+    if encoding:  # a compressed download is served as the archive it is
+        kind = "application/gzip" if encoding == "gzip" else None
+    kind = kind or "application/octet-stream"
+    return kind + "; charset=utf-8" if kind.startswith("text/") or kind in ("application/json", "application/javascript") else kind
+
+
+def _fresh(variant: str, source: str) -> bool:
+    try:
+        return os.stat(variant).st_mtime_ns >= os.stat(source).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def compress(path: str) -> Dict[str, int]:
+    """Write the ``.gz``/``.br`` variants of ``path``; return their sizes."""
+    sizes = {}
+    data = None
+    for suffix, encoder in ((".gz", lambda d: gzip.compress(d, 9, mtime=0)), (".br", brotli and brotli.compress)):
+        variant = path + suffix
+        if encoder is None:
+            continue
+        if not _fresh(variant, path):
+            if data is None:
+                with open(path, "rb") as f:
+                    data = f.read()
+            packed = encoder(data)
+            if len(packed) >= len(data) * 0.9:
+                if os.path.exists(variant):
+                    os.remove(variant)
+                continue
+            with open(variant, "wb") as f:
+                f.write(packed)
+        if os.path.exists(variant):
+            sizes[ENCODINGS[suffix]] = os.path.getsize(variant)
+    return sizes
+
+
+def _etag(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+
+def linked_originals(source_dir: str = IMAGES_DIR) -> Set[str]:
+    """URLs of the originals a page links to directly; the export keeps only these."""
+    prefix = os.path.abspath(source_dir) + os.sep
+    return {url_for(path) for path in named_files(reachable_modules()) if os.path.abspath(path).startswith(prefix)}
+
+
+def drop_originals(out_dir: str, source_dir: str = IMAGES_DIR) -> List[str]:
+    """Remove the originals no page links to from the export; return their URLs."""
+    keep = linked_originals(source_dir)
+    images = os.path.join(out_dir, os.path.relpath(source_dir, "public"))
+    removed = []
+    for root, _, names in os.walk(images):
+        for name in names:
+            path = os.path.join(root, name)
+            url = url_of(path, out_dir)
+            if url not in keep:
+                os.remove(path)
+                removed.append(url)
+    # Folders left empty (an era with every photo dropped) go too.
+    for root, _, _ in os.walk(images, topdown=False):
+        if not os.listdir(root):
+            os.rmdir(root)
+    return sorted(removed)
+
+
+def _previous_sidecars(out_dir: str) -> Set[str]:
+    """URLs of the ``.gz``/``.br`` variants the last manifest recorded."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            files = json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return set()
+    suffixes = {encoding: suffix for suffix, encoding in ENCODINGS.items()}
+    return {url + suffixes[e] for url, entry in files.items() for e in entry.get("encodings", {}) if e in suffixes}
+
+
+def scan_export(out_dir: str) -> List[str]:
+    previous = _previous_sidecars(out_dir)
+    files = []
+    for root, dirs, names in os.walk(out_dir):
+        dirs.sort()
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            if name == MANIFEST_NAME and root == out_dir:
+                continue
+            if os.path.splitext(name)[1] in ENCODINGS:
+                base = os.path.splitext(path)[0]
+                if url_of(path, out_dir) in previous:
+                    # Orphaned variant of a file the export no longer contains.
+                    if not os.path.exists(base):
+                        os.remove(path)
+                    continue
+                if os.path.exists(base) and base.lower().endswith(COMPRESSIBLE):
+                    continue  # rewritten by compress()
+                # Anything else is a compressed download in its own right.
+            files.append(path)
+    return files
+
+
+def publish(out_dir: str = OUT_DIR, build: bool = True, jobs: Optional[int] = None) -> dict:
+    """Export (unless ``build`` is false), precompress and write the manifest."""
+    if build:
+        with span("next build", cat="external"):
+            run_export()
+    if not os.path.isdir(out_dir):
+        raise SystemExit(f"No existe {out_dir}/; ejecuta antes la exportación estática")
+
+    drop_originals(out_dir)
+    files = scan_export(out_dir)
+    compressible = [p for p in files if p.lower().endswith(COMPRESSIBLE) and os.path.getsize(p) >= MIN_SIZE]
+    with span("compress", files=len(compressible)), ThreadPoolExecutor(max_workers=jobs) as pool:
+        encoded = dict(zip(compressible, pool.map(compress, compressible)))
+        etags = dict(zip(files, pool.map(_etag, files)))
+
+    entries = {}
+    for path in files:
+        url = url_of(path, out_dir)
+        entries[url] = {
+            "type": content_type(path),
+            "size": os.path.getsize(path),
+            "etag": etags[path],
+            "cache": cache_control(url),
+            "encodings": encoded.get(path, {}),
+        }
+    manifest = {"version": 1, "files": entries}
+    write_if_changed(os.path.join(out_dir, MANIFEST_NAME), json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    return manifest
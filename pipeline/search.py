@@ -0,0 +1,211 @@
+"""Static full-text search index over the portal's text.
+
+Documents are the timeline events (``content/cronograma.json``), the
+paragraphs of Leandro Perdomo's article (``AUTOR_TAB`` in
+``update_tabs.py``) and the gallery captions (``content/galeria.json``).
+
+Text is lower-cased, accent-folded ("Fábricas" -> "fabricas"), stripped of
+Spanish stop words and reduced with a light stemmer (plural and final vowel),
+so "fábrica", "Fábricas" and "fabricas" share the stem ``fabric``. The
+inverted index is split into shards by the first two letters of each stem,
+``public/search/<xx>.json``, so a query only fetches the shards of its own
+terms, and prefix lookup is a scan of one shard. Document titles and
+snippets live in ``public/search/docs-<n>.json`` chunks of ``DOCS_PER_CHUNK``.
+Every other locale gets its own index in ``public/search/<locale>/``, built
+by :mod:`pipeline.i18n` from the translated stores and the compiled article;
+it shares the stemmer (only plurals and final vowels are stripped, which
+suits English just as well) and has its own stop words.
+``app/lib/search.ts`` mirrors :func:`normalize` and :func:`stem` for queries;
+keep both in sync (``STEMMER_VERSION``).
+
+The builder is incremental: the terms of each document are kept in the
+build cache (:mod:`pipeline.cache`) by content hash, and only shards whose
+contents changed are rewritten.
+"""
+
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from pipeline.cache import BuildCache, get_cache
+from pipeline.patch import write_if_changed
+from pipeline.trace import span, traced
+
+OUT_DIR = os.path.join("public", "search")
+
+DOCS_PER_CHUNK = 256
+SHARD_CHARS = 2
+STEMMER_VERSION = 1
+
+STOPWORDS = frozenset("""
+a al algo algunas algunos ante antes como con contra cual cuando de del desde donde durante e el
+ella ellos en entre era es esa ese eso esta estaba estas este esto estos fue fueron ha habia han
+hasta hay la las le les lo los mas me mi mucho muy nada ni no nos o otra otras otro otros para
+pero poco por porque que quien se ser si sin sobre son su sus tambien tanto te tiene todo todos
+tu un una uno unos y ya yo
+""".split())
+STOPWORDS_EN = frozenset("""
+a about after all also an and any are as at be been but by can could did do for from had has have
+he her his if in into is it its more my no not of on or our out she so than that the their them
+then there these they this to too up was we were what when which who will with would you your
+""".split())
+# Stop words of every locale, by code.
+LOCALE_STOPWORDS = {"es": STOPWORDS, "en": STOPWORDS_EN}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_MARKS = re.compile("[\u0300-\u036f]")
+_TAG = re.compile(r"<[^>]+>|\{[^}]*\}")
+_BYLINE = re.compile(r"<h2[^>]*>(.*?)</h2>", re.DOTALL)
+_PARAGRAPH = re.compile(r"<p(?:\s[^>]*)?>(.*?)</p>|<div className=\"bg-slate-900/50[^>]*>(.*?)</div>", re.DOTALL)
+
+
+class Doc(NamedTuple):
+    key: str
+    tab: str
+    title: str
+    text: str
+
+
+def normalize(text: str) -> List[str]:
+    """Lower-case, accent-fold and tokenize ``text``."""
+    folded = _MARKS.sub("", unicodedata.normalize("NFD", text.lower()))
+    return _TOKEN.findall(folded)
+
+
+def stem(token: str) -> str:
+    """Strip the plural and the final vowel of a folded Spanish token."""
+    if token.isdigit():
+        return token
+    if len(token) > 4 and token.endswith("es") and token[-3] not in "aeiou":
+        token = token[:-2]
+    elif len(token) > 3 and token.endswith("s"):
+        token = token[:-1]
+    if len(token) > 3 and token[-1] in "aeo":
+        token = token[:-1]
+    return token
+
+
+def terms(text: str, stopwords: frozenset = STOPWORDS) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for token in normalize(text):
+        if token in stopwords or len(token) < SHARD_CHARS:
+            continue
+        term = stem(token)
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def _clean(fragment: str) -> str:
+    return " ".join(_TAG.sub(" ", fragment).split())
+
+
+def collect_documents(
+    cronograma: Optional[dict] = None, autor: Optional[str] = None, translate: Callable[[str], str] = lambda text: text
+) -> List[Doc]:
+    """Every searchable document, from the content stores and generators.
+
+    A locale passes its translated timeline store, its compiled article
+    module and the translator of the gallery captions.
+    """
+    if autor is None:
+        from update_tabs import AUTOR_TAB as autor
+
+    docs = []
+    if cronograma is None:
+        with open(os.path.join("content", "cronograma.json"), "r", encoding="utf-8") as f:
+            cronograma = json.load(f)
+    labels = {s["id"]: s["label"] for s in cronograma["siglos"]}
+    for i, evento in enumerate(cronograma["eventos"]):
+        docs.append(Doc(f"cronograma/{i}", "cronograma", f"{evento['year']} · {labels[evento['siglo']]}", evento["text"]))
+
+    byline = _BYLINE.search(autor)
+    title = f"Guanarteme, {_clean(byline.group(1))}" if byline else "Guanarteme"
+    for i, match in enumerate(_PARAGRAPH.finditer(autor)):
+        text = _clean(match.group(1) or match.group(2))
+        if text:
+            docs.append(Doc(f"autor/{i}", "autor", title, text))
+
+    with open(os.path.join("content", "galeria.json"), "r", encoding="utf-8") as f:
+        galeria = json.load(f)["categorias"]
+    for cat in galeria:
+        folder = cat.get("folder")
+        if folder is None:
+            continue  # a planned category: no photos for its captions to point at
+        title = translate(cat.get("name", folder))
+        for name, caption in cat.get("descriptions", {}).items():
+            docs.append(Doc(f"galeria/{folder}/{name}", "galeria", title, translate(caption)))
+    return docs
+
+
+def _doc_hash(doc: Doc, locale: str = "es") -> str:
+    return hashlib.sha256(f"{STEMMER_VERSION}\0{locale}\0{doc.title}\0{doc.text}".encode("utf-8")).hexdigest()
+
+
+def _dump(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def index_documents(
+    docs: List[Doc], cache: Optional[BuildCache] = None, locale: str = "es"
+) -> Tuple[Dict[str, Dict[str, int]], Dict[str, Dict[str, List[int]]]]:
+    """Return the per-document terms (reusing ``cache``) and the sharded postings.
+
+    ``docs`` must already be in document-id order.
+    """
+    doc_terms = {}
+    for doc in docs:
+        digest = _doc_hash(doc, locale)
+        found = None if cache is None else cache.get("search-terms", digest, STEMMER_VERSION)
+        if found is None:
+            found = terms(f"{doc.title} {doc.text}", LOCALE_STOPWORDS[locale])
+            if cache is not None:
+                cache.put("search-terms", digest, found, STEMMER_VERSION)
+        doc_terms[doc.key] = found
+
+    shards: Dict[str, Dict[str, List[int]]] = {}
+    for doc_id, doc in enumerate(docs):
+        for term in doc_terms[doc.key]:
+            shards.setdefault(term[:SHARD_CHARS], {}).setdefault(term, []).append(doc_id)
+    return doc_terms, shards
+
+
+@traced("search")
+def build_search(out_dir: str = OUT_DIR, docs: Optional[List[Doc]] = None, locale: str = "es") -> List[str]:
+    """Rebuild the index of ``docs`` (the Spanish documents by default); return the files that changed."""
+    with span("collect"):
+        docs = sorted(collect_documents() if docs is None else docs, key=lambda d: d.key)
+    with span("index", docs=len(docs)):
+        _, shards = index_documents(docs, get_cache(), locale)
+
+    outputs = {}
+    for prefix, postings in shards.items():
+        outputs[os.path.join(out_dir, f"{prefix}.json")] = _dump(postings)
+    for start in range(0, len(docs), DOCS_PER_CHUNK):
+        chunk = [
+            {"tab": d.tab, "title": d.title, "snippet": d.text[:160]}
+            for d in docs[start:start + DOCS_PER_CHUNK]
+        ]
+        outputs[os.path.join(out_dir, f"docs-{start // DOCS_PER_CHUNK}.json")] = _dump(chunk)
+    outputs[os.path.join(out_dir, "meta.json")] = _dump({
+        "version": STEMMER_VERSION,
+        "shardChars": SHARD_CHARS,
+        "docsPerChunk": DOCS_PER_CHUNK,
+        "shards": sorted(shards),
+        "stopwords": sorted(LOCALE_STOPWORDS[locale]),
+    })
+
+    os.makedirs(out_dir, exist_ok=True)
+    changed = []
+    with span("write", cat="io", files=len(outputs)):
+        for name in os.listdir(out_dir):
+            path = os.path.join(out_dir, name)
+            if path not in outputs and os.path.isfile(path):  # locale indexes are subfolders
+                os.remove(path)
+                changed.append(path)
+        for path, text in outputs.items():
+            if write_if_changed(path, text):
+                changed.append(path)
+    return changed
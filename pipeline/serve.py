@@ -0,0 +1,195 @@
+"""Threaded static server for the export written by :mod:`pipeline.publish`.
+
+Stdlib only, so the Windows launcher needs nothing but Python. Every request
+is answered from ``out/asset-manifest.json``; URLs that are not in it are
+404s, so nothing outside the export can be reached. For each file it:
+
+* picks the precompressed ``.br`` or ``.gz`` variant the client accepts
+  (``Accept-Encoding``, honouring ``q=0``) and sends ``Vary: Accept-Encoding``;
+* sends the manifest's ``Cache-Control`` and an ``ETag`` per encoding
+  (``"<hash>-br"``; each variant is a different body) and answers
+  ``If-None-Match`` with ``304``;
+* serves single ``Range`` requests (``206``/``416``, with ``If-Range``) from
+  the identity bytes, for seeking in large images;
+* streams the body with ``sendfile`` and keeps HTTP/1.1 connections alive.
+
+``/`` maps to ``/index.html`` and extension-less paths to ``<path>.html``,
+matching the file names of the Next.js export; unknown paths get
+``/404.html``.
+"""
+
+import json
+import os
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from pipeline.publish import MANIFEST_NAME, OUT_DIR
+
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+def load_files(root: str) -> Dict[str, dict]:
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)["files"]
+    except FileNotFoundError:
+        raise SystemExit(f"No existe {root}/{MANIFEST_NAME}; ejecuta antes 'python -m pipeline publish'")
+
+
+def accepted(header: str) -> Dict[str, float]:
+    """Codings of an ``Accept-Encoding`` header with their q-values."""
+    codings = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            codings[name.strip().lower()] = q
+    return codings
+
+
+def choose_encoding(header: str, available: Dict[str, int]) -> Optional[str]:
+    codings = accepted(header)
+    for name in ("br", "gzip"):
+        if name in available and codings.get(name, codings.get("*", 0.0)) > 0:
+            return name
+    return None
+
+
+def entity_tag(entry: dict, encoding: Optional[str]) -> str:
+    """Strong ``ETag`` of the file's body as sent with ``encoding`` (``None``: identity)."""
+    return f'"{entry["etag"]}-{encoding}"' if encoding else f'"{entry["etag"]}"'
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """``(start, end)`` inclusive of a single byte range; ``None`` to ignore it.
+
+    Raises :class:`ValueError` when the range cannot be satisfied.
+    """
+    match = _RANGE.match(header.strip())
+    if not match:
+        return None  # multiple or malformed ranges: send the whole file
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+class StaticHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PortalEstatico/1.0"
+
+    def do_GET(self) -> None:
+        self.serve(body=True)
+
+    def do_HEAD(self) -> None:
+        self.serve(body=False)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def resolve(self) -> Tuple[str, Optional[dict]]:
+        files = self.server.files
+        path = unquote(urlsplit(self.path).path)
+        for candidate in (path, path.rstrip("/") + "/index.html", path + ".html"):
+            if candidate in files:
+                return candidate, files[candidate]
+        return "/404.html", None
+
+    def serve(self, body: bool) -> None:
+        url, entry = self.resolve()
+        status = HTTPStatus.OK
+        if entry is None:
+            status = HTTPStatus.NOT_FOUND
+            entry = self.server.files.get(url)
+            if entry is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+
+        encoding = choose_encoding(self.headers.get("Accept-Encoding", ""), entry["encodings"])
+        etag = entity_tag(entry, encoding)
+        if status == HTTPStatus.OK and etag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", entry["cache"])
+            if entry["encodings"]:
+                self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        path = os.path.join(self.server.root, *url.lstrip("/").split("/"))
+        size = entry["size"]
+        start, end = 0, size - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        identity = entity_tag(entry, None)
+        if status == HTTPStatus.OK and range_header and (if_range is None or if_range == identity):
+            try:
+                span = parse_range(range_header, size)
+            except ValueError:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if span:
+                # Ranges are served from the identity bytes.
+                start, end = span
+                status = HTTPStatus.PARTIAL_CONTENT
+                encoding, etag = None, identity
+        if encoding:
+            path += SUFFIXES[encoding]
+            end = entry["encodings"][encoding] - 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", entry["type"])
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Cache-Control", entry["cache"])
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        if entry["encodings"]:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if body and end >= start:
+            with open(path, "rb") as f:
+                self.connection.sendfile(f, start, end - start + 1)
+
+
+class StaticServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], root: str = OUT_DIR, verbose: bool = False):
+        self.root = root
+        self.files = load_files(root)
+        self.verbose = verbose
+        super().__init__(address, StaticHandler)
+
+
+def serve(host: str = "127.0.0.1", port: int = 3000, root: str = OUT_DIR, verbose: bool = False) -> None:
+    with StaticServer((host, port), root, verbose) as server:
+        print(f"Portal disponible en http://{host}:{port} ({len(server.files)} ficheros de {root}/). Ctrl+C para parar.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
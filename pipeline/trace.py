@@ -0,0 +1,292 @@
+"""Opt-in instrumentation of the pipeline stages.
+
+Stages, and the sections and modules inside them, are wrapped in
+:func:`span` or decorated with :func:`traced`. While tracing is off (the
+default) a span is a shared no-op context, so the hooks cost one function
+call. With ``python -m pipeline --trace trace.json <command>``
+(``--timings`` for the table alone), or ``PIPELINE_TRACE=trace.json`` for
+the standalone ``update_*.py`` scripts, every span records:
+
+* wall and CPU time (``perf_counter`` and ``process_time``);
+* bytes read and written by the process (``rchar``/``wchar`` from
+  ``/proc/self/io``, so Linux only; empty elsewhere);
+* the resident set high-water mark when it ended (``ru_maxrss``) and, with
+  ``--memory``, the peak of Python allocations above the level it started at
+  (``tracemalloc``, which slows the run down noticeably).
+
+When the run ends the spans are written as Chrome trace events (open the
+file in ``chrome://tracing`` or https://ui.perfetto.dev) and summarised in a
+table with one row per span path, calls aggregated. ``--memory`` also lists
+the lines holding the most memory at the end, and ``--profile out.prof``
+runs the command under ``cProfile``, saves the stats and prints the
+functions with the highest cumulative time.
+"""
+
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no rusage, the RSS column stays empty
+    resource = None
+
+PROC_IO = "/proc/self/io"
+ENV = "PIPELINE_TRACE"
+
+_NULL = contextlib.nullcontext()
+_tracer: Optional["Tracer"] = None
+
+
+class Record(NamedTuple):
+    name: str
+    cat: str
+    path: Tuple[str, ...]  # names of the enclosing spans, outermost first
+    tid: int
+    start: float  # seconds since the tracer was enabled
+    wall: float
+    cpu: float
+    read: Optional[int]
+    written: Optional[int]
+    rss: Optional[int]  # resident set high-water mark at the end, in bytes
+    peak: Optional[int]  # Python allocation peak above the level at the start (tracemalloc)
+    args: dict
+
+
+class _Open:
+    __slots__ = ("traced", "peak")
+
+    def __init__(self, traced: int):
+        self.traced = traced
+        self.peak = traced
+
+
+def _io_counters() -> Optional[Tuple[int, int]]:
+    try:
+        with open(PROC_IO, "rb") as f:
+            fields = dict(line.split(b":", 1) for line in f.read().splitlines())
+    except OSError:
+        return None
+    return int(fields[b"rchar"]), int(fields[b"wchar"])
+
+
+def _max_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # kilobytes elsewhere
+
+
+class Tracer:
+    def __init__(self, memory: bool = False):
+        self.records: List[Record] = []
+        self.memory = memory
+        self.origin = time.perf_counter()
+        self._local = threading.local()
+        self._open: List[_Open] = []
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _fold_peak(self) -> int:
+        # One peak counter serves every open span: fold it into each, then restart it.
+        current, peak = tracemalloc.get_traced_memory()
+        for span in self._open:
+            span.peak = max(span.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "stage", args: Optional[dict] = None) -> Iterator[None]:
+        stack = self._stack()
+        path = tuple(stack)
+        opened = _Open(self._fold_peak()) if self.memory else None
+        if opened is not None:
+            self._open.append(opened)
+        io_start = _io_counters()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        stack.append(name)
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.process_time() - cpu_start
+            io_end = _io_counters()
+            stack.pop()
+            peak = None
+            if opened is not None:
+                self._fold_peak()
+                self._open.remove(opened)
+                peak = opened.peak - opened.traced
+            read = written = None
+            if io_start is not None and io_end is not None:
+                read, written = io_end[0] - io_start[0], io_end[1] - io_start[1]
+            self.records.append(Record(
+                name, cat, path, threading.get_ident(), start - self.origin, wall, cpu,
+                read, written, _max_rss(), peak, args or {},
+            ))
+
+    # -- output ------------------------------------------------------------
+
+    def chrome_trace(self) -> dict:
+        """The records as Chrome trace "complete" events."""
+        pid = os.getpid()
+        threads = {tid: i for i, tid in enumerate(dict.fromkeys(r.tid for r in self.records), 1)}
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "pipeline"}}]
+        for r in sorted(self.records, key=lambda r: r.start):
+            args = dict(r.args, cpu_ms=round(r.cpu * 1000, 3))
+            for key in ("read", "written", "rss", "peak"):
+                value = getattr(r, key)
+                if value is not None:
+                    args[f"{key}_bytes"] = value
+            events.append({
+                "name": r.name, "cat": r.cat, "ph": "X", "pid": pid, "tid": threads[r.tid],
+                "ts": round(r.start * 1e6, 1), "dur": round(r.wall * 1e6, 1), "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False, default=str)
+
+    def summary(self) -> str:
+        """One row per span path (children indented under their parent), calls aggregated."""
+        rows: Dict[Tuple[str, ...], list] = {}
+        children: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+        for r in sorted(self.records, key=lambda r: r.start):
+            key = r.path + (r.name,)
+            if key not in rows:
+                rows[key] = [0, 0.0, 0.0, None, None, None, None]
+                children.setdefault(r.path, []).append(key)
+            row = rows[key]
+            row[0] += 1
+            row[1] += r.wall
+            row[2] += r.cpu
+            for i, value in ((3, r.read), (4, r.written)):
+                if value is not None:
+                    row[i] = (row[i] or 0) + value
+            for i, value in ((5, r.rss), (6, r.peak)):
+                if value is not None:
+                    row[i] = max(row[i] or 0, value)
+
+        def size(value: Optional[int]) -> str:
+            return "-" if value is None else f"{value / 1024:,.1f} KB"
+
+        lines = [
+            f"{'etapa':<44} {'llamadas':>8} {'pared ms':>10} {'cpu ms':>10} "
+            f"{'leído':>12} {'escrito':>12} {'pico RSS':>12} {'pico py':>12}"
+        ]
+        pending = list(children.get((), []))
+        while pending:
+            key = pending.pop(0)
+            calls, wall, cpu, read, written, rss, peak = rows[key]
+            name = ("  " * (len(key) - 1) + key[-1])[:44]
+            lines.append(
+                f"{name:<44} {calls:>8} {wall * 1000:>10,.1f} {cpu * 1000:>10,.1f} "
+                f"{size(read):>12} {size(written):>12} {size(rss):>12} {size(peak):>12}"
+            )
+            pending[:0] = children.get(key, [])
+        return "\n".join(lines)
+
+    def top_allocations(self, limit: int = 10) -> str:
+        """The source lines holding the most traced memory right now."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        lines = [f"{'memoria viva por línea':<60} {'tamaño':>12} {'bloques':>8}"]
+        for stat in snapshot.statistics("lineno")[:limit]:
+            frame = stat.traceback[0]
+            where = f"{os.path.relpath(frame.filename)}:{frame.lineno}"
+            lines.append(f"{where[-60:]:<60} {stat.size / 1024:>9,.1f} KB {stat.count:>8}")
+        return "\n".join(lines)
+
+
+# -- module interface ---------------------------------------------------------
+
+def span(name: str, cat: str = "stage", **args):
+    """Context manager timing the enclosed block while tracing is enabled."""
+    if _tracer is None:
+        return _NULL
+    return _tracer.span(name, cat, args)
+
+
+def traced(name: str, cat: str = "stage"):
+    """Decorator: the whole call is one span."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name, cat):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def enable(memory: bool = False) -> Tracer:
+    global _tracer
+    _tracer = Tracer(memory)
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None and tracer.memory:
+        tracemalloc.stop()
+    return tracer
+
+
+def profile_report(profiler: cProfile.Profile, path: Optional[str] = None, limit: int = 25) -> str:
+    if path:
+        profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue().strip("\n")
+
+
+@contextlib.contextmanager
+def session(
+    trace: Optional[str] = None, timings: bool = False, memory: bool = False, profile: Optional[str] = None
+) -> Iterator[Optional[Tracer]]:
+    """Trace (and optionally profile) the enclosed run, then report.
+
+    ``trace`` defaults to ``$PIPELINE_TRACE``, which is how the standalone
+    updaters are traced.
+    """
+    trace = trace or os.environ.get(ENV) or None
+    tracer = enable(memory) if trace or timings or memory else None
+    profiler = cProfile.Profile() if profile else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        with span("total", cat="run", argv=" ".join(sys.argv)):
+            yield tracer
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            print(profile_report(profiler, profile))
+            print(f"Perfil guardado en {profile} (python -m pstats {profile})")
+        if tracer is not None:
+            allocations = tracer.top_allocations() if memory else None
+            disable()
+            print(tracer.summary())
+            if allocations:
+                print(allocations)
+            if trace:
+                tracer.write(trace)
+                print(f"Traza guardada en {trace} (ábrela en https://ui.perfetto.dev o chrome://tracing)")
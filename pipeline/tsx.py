@@ -0,0 +1,373 @@
+"""Lightweight TSX scanner that locates top-level function declarations.
+
+It is not a parser: it only understands enough of the lexical grammar to
+know whether a brace is real code. Strings, template literals (including
+``${...}`` nesting), comments, regular expression literals and JSX (tags,
+attribute strings, text children, where quotes and apostrophes are plain
+text) are skipped as units, so a ``}`` or ``function`` inside any of them
+never moves a boundary. Runs of uninteresting characters are consumed by one
+regular expression each, so a scan is a single linear pass over the text.
+
+:class:`JsxScanner` additionally records the JSX tree (elements, text runs
+and expressions) for :mod:`pipeline.i18n`.
+
+A ``<`` starts JSX only in expression position (after ``(``, ``=``,
+``return``, ``=>``, ``&&`` and so on) and when followed by a tag name or
+``>``; after an identifier it is a comparison or a type argument
+(``useState<string | null>``). ``/`` starts a regular expression under the
+same rule.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+VERSION = 1  # bump when boundaries can come out differently; keys cached offsets
+
+# Declarations are matched inside the top-level runs of code.
+_DECL = re.compile(r"(?:\bexport\s+(?:default\s+)?)?(?:\basync\s+)?\bfunction\s*\*?\s*([A-Za-z_$][\w$]*)")
+
+_TOP_RUN = re.compile(r"[^'\"`/{}<()]*")
+_CODE_RUN = re.compile(r"[^'\"`/{}<]*")
+_TEMPLATE_RUN = re.compile(r"[^`\\$]*")
+_JSX_TEXT = re.compile(r"[^{<]*")
+# JSX attribute strings have no escapes, so they are consumed with the names.
+_JSX_ATTRS = re.compile(r"""(?:[^'"{/>]+|"[^"]*"|'[^']*')*""")
+_TAG_NAME = re.compile(r"[\w$.:-]*")
+_STRINGS = {
+    "'": re.compile(r"'(?:[^'\\\n]|\\.)*'"),
+    '"': re.compile(r'"(?:[^"\\\n]|\\.)*"'),
+}
+_REGEX = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*")
+_TRAILING_WORD = re.compile(r"[\w$]+$")
+
+# Tokens after which an expression (and so JSX or a regex) may start.
+_EXPR_CHARS = frozenset("(,=:?[{}!&|;+-*%~^")
+_EXPR_WORDS = frozenset(("return", "default", "yield", "await", "case", "typeof", "void", "in", "of", "else", "do"))
+
+
+class TsxScanner:
+    def __init__(self, text: str):
+        self.text = text
+        self.n = len(text)
+
+    # -- expression position ---------------------------------------------
+
+    def _expression_position(self, i: int) -> bool:
+        j = i - 1
+        text = self.text
+        while j >= 0 and text[j] in " \t\r\n":
+            j -= 1
+        if j < 0:
+            return True
+        c = text[j]
+        if c == ">":
+            return j > 0 and text[j - 1] == "="  # arrow body
+        if c in _EXPR_CHARS:
+            return True
+        word = _TRAILING_WORD.search(text, max(0, j - 16), j + 1)
+        return bool(word) and word.group() in _EXPR_WORDS
+
+    def _starts_jsx(self, i: int) -> bool:
+        nxt = self.text[i + 1:i + 2]
+        return (nxt == ">" or nxt.isalpha() or nxt == "_") and self._expression_position(i)
+
+    # -- leaf tokens -------------------------------------------------------
+
+    def _string(self, i: int) -> int:
+        match = _STRINGS[self.text[i]].match(self.text, i)
+        if match:
+            return match.end()
+        end = self.text.find("\n", i)  # unterminated: give up at the line end
+        return self.n if end < 0 else end
+
+    def _comment(self, i: int) -> int:
+        if self.text[i + 1] == "/":
+            end = self.text.find("\n", i)
+            return self.n if end < 0 else end
+        end = self.text.find("*/", i + 2)
+        return self.n if end < 0 else end + 2
+
+    def _slash(self, i: int) -> int:
+        """Skip a comment, a regex literal or a division operator at ``i``."""
+        if self.text[i + 1:i + 2] in ("/", "*"):
+            return self._comment(i)
+        if self._expression_position(i):
+            match = _REGEX.match(self.text, i)
+            if match:
+                return match.end()
+        return i + 1
+
+    def _template(self, i: int) -> int:
+        text, i = self.text, i + 1
+        while True:
+            i = _TEMPLATE_RUN.match(text, i).end()
+            if i >= self.n:
+                return self.n
+            c = text[i]
+            if c == "`":
+                return i + 1
+            if c == "\\":
+                i += 2
+            elif text.startswith("${", i):
+                i = self.block(i + 2)
+            else:
+                i += 1
+
+    # -- JSX ---------------------------------------------------------------
+
+    def _jsx(self, i: int) -> int:
+        """Skip the element (or fragment) opening at ``i``; return the offset after it.
+
+        JSX is most of a tab module, so it is walked tag by tag in one loop
+        with a depth count, using ``str.find`` rather than stepping through
+        it with a regex: text runs are jumped over to the next ``<`` (a
+        ``{`` before it opens an expression), a closing tag only lowers the
+        depth, and an opening tag whose attributes hold no ``{`` or ``'`` and
+        an even number of ``"`` ends at the next ``>``; other tags are
+        skipped attribute by attribute.
+        """
+        text, n = self.text, self.n
+        find, count = text.find, text.count
+        depth = 0
+        lt = i
+        # Offsets of the next ``{`` and ``'``, looked up again only once passed.
+        brace = quote = -1
+        while True:
+            if brace < i:
+                brace = find("{", i)
+                if brace < 0:
+                    brace = n
+            if brace < lt:
+                i = self.block(brace + 1)
+            elif text[lt + 1] == "/":
+                depth -= 1
+                if not depth:
+                    gt = find(">", lt)
+                    return n if gt < 0 else gt + 1
+                i = lt + 2
+            else:
+                gt = find(">", lt)
+                if gt < 0:
+                    return n
+                if quote < lt:
+                    quote = find("'", lt)
+                    if quote < 0:
+                        quote = n
+                if brace > gt and quote > gt and not count('"', lt, gt) % 2:
+                    i = gt + 1
+                else:
+                    i = self._tag(lt)
+                if text[i - 2] != "/":
+                    depth += 1
+                elif not depth:
+                    return i  # a self-closing root
+            lt = find("<", i)
+            if lt < 0:
+                return n
+
+    def _tag(self, i: int) -> int:
+        """Skip the opening tag at ``i``, ``{...}`` attributes included; return the offset after it."""
+        text = self.text
+        find, count = text.find, text.count
+        i = _TAG_NAME.match(text, i + 1).end()
+        while True:
+            gt = find(">", i)
+            if gt < 0:
+                return self.n
+            brace = find("{", i, gt)
+            end = gt if brace < 0 else brace
+            if find("'", i, end) < 0 and not count('"', i, end) % 2:
+                # No string around the ``{`` or ``>`` found.
+                if brace < 0:
+                    return gt + 1
+                i = self.block(brace + 1)
+                continue
+            i = _JSX_ATTRS.match(text, i).end()
+            if i >= self.n:
+                return self.n
+            c = text[i]
+            if c == "{":
+                i = self.block(i + 1)
+            elif c == ">":
+                return i + 1
+            else:
+                i += 1
+
+    # -- code --------------------------------------------------------------
+
+    def _token(self, i: int) -> int:
+        """Skip the string, template, comment, regex or JSX at ``i`` (if any)."""
+        c = self.text[i]
+        if c in "'\"":
+            return self._string(i)
+        if c == "`":
+            return self._template(i)
+        if c == "/":
+            return self._slash(i)
+        if c == "<" and self._starts_jsx(i):
+            return self._jsx(i)
+        return i + 1
+
+    def block(self, i: int) -> int:
+        """Skip code up to the ``}`` closing a block opened just before ``i``."""
+        text = self.text
+        while True:
+            i = _CODE_RUN.match(text, i).end()
+            if i >= self.n:
+                return self.n
+            c = text[i]
+            if c == "}":
+                return i + 1
+            i = self.block(i + 1) if c == "{" else self._token(i)
+
+    def declarations(self) -> Dict[str, Tuple[int, int]]:
+        """Offsets ``(start, end)`` of every top-level function declaration.
+
+        ``start`` is the start of the declaration's line (or of the keyword
+        when other code precedes it on the line) and ``end`` the offset just
+        past the closing brace of its body.
+        """
+        text = self.text
+        found: Dict[str, Tuple[int, int]] = {}
+        pending: Optional[Tuple[str, int]] = None
+        parens = 0
+        i = 0
+        while True:
+            end = _TOP_RUN.match(text, i).end()
+            for match in _DECL.finditer(text, i, end):
+                pending = (match.group(1), self._line_start(match.start()))
+            i = end
+            if i >= self.n:
+                return found
+            c = text[i]
+            if c == "(":
+                parens += 1
+                i += 1
+            elif c == ")":
+                parens = max(0, parens - 1)
+                i += 1
+            elif c == "{":
+                end = self.block(i + 1)
+                if pending and parens == 0 and self._body_brace(i):
+                    found[pending[0]] = (pending[1], end)
+                    pending = None
+                i = end
+            else:
+                i = self._token(i)
+
+    def _body_brace(self, i: int) -> bool:
+        # ``function f(): { a: string } {``: a brace after ``:`` is a return type.
+        j = i - 1
+        while j >= 0 and self.text[j] in " \t\r\n":
+            j -= 1
+        return j < 0 or self.text[j] != ":"
+
+    def _line_start(self, i: int) -> int:
+        start = self.text.rfind("\n", 0, i) + 1
+        return start if not self.text[start:i].strip() else i
+
+
+class JsxText(NamedTuple):
+    start: int
+    end: int
+
+
+class JsxExpression(NamedTuple):
+    start: int  # offset of the ``{``
+    end: int  # offset just past the ``}``
+    jsx: bool  # whether JSX was found inside
+
+
+class JsxElement(NamedTuple):
+    tag: str  # "" for a fragment
+    start: int
+    open_end: int  # just past the opening tag (``end`` when self-closing)
+    close_start: int  # offset of the closing tag (``end`` when self-closing)
+    end: int
+    attributes: List[JsxExpression]  # ``{...}`` attribute values
+    children: List[Union[JsxText, JsxExpression, "JsxElement"]]
+
+
+class JsxScanner(TsxScanner):
+    """A :class:`TsxScanner` that also records the JSX it skips.
+
+    After :meth:`declarations` (or any other full scan), ``roots`` holds every
+    JSX element that is not the child of another element: those returned or
+    assigned in code and those nested in ``{...}`` expressions.
+    """
+
+    def __init__(self, text: str):
+        super().__init__(text)
+        self.roots: List[JsxElement] = []
+        self._elements = 0
+
+    def _jsx(self, i: int) -> int:
+        element = self._element(i)
+        self.roots.append(element)
+        return element.end
+
+    def _expression(self, i: int) -> JsxExpression:
+        before = self._elements
+        end = self.block(i + 1)
+        return JsxExpression(i, end, self._elements > before)
+
+    def _done(self, *fields) -> JsxElement:
+        self._elements += 1
+        return JsxElement(*fields)
+
+    def _element(self, start: int) -> JsxElement:
+        text = self.text
+        i = _TAG_NAME.match(text, start + 1).end()
+        tag = text[start + 1:i]
+        attributes: List[JsxExpression] = []
+        while True:
+            i = _JSX_ATTRS.match(text, i).end()
+            if i >= self.n:
+                return self._done(tag, start, self.n, self.n, self.n, attributes, [])
+            c = text[i]
+            if c == "{":
+                expression = self._expression(i)
+                attributes.append(expression)
+                i = expression.end
+            elif text.startswith("/>", i):
+                return self._done(tag, start, i + 2, i + 2, i + 2, attributes, [])
+            elif c == ">":
+                i += 1
+                break
+            else:
+                i += 1
+        open_end = i
+        children: List[Union[JsxText, JsxExpression, JsxElement]] = []
+        while True:
+            run = _JSX_TEXT.match(text, i).end()
+            if run > i:
+                children.append(JsxText(i, run))
+            i = run
+            if i >= self.n:
+                return self._done(tag, start, open_end, self.n, self.n, attributes, children)
+            if text[i] == "{":
+                expression = self._expression(i)
+                children.append(expression)
+                i = expression.end
+            elif text.startswith("</", i):
+                end = text.find(">", i)
+                end = self.n if end < 0 else end + 1
+                return self._done(tag, start, open_end, i, end, attributes, children)
+            else:
+                child = self._element(i)
+                children.append(child)
+                i = child.end
+
+
+def top_level_functions(text: str) -> Dict[str, Tuple[int, int]]:
+    return TsxScanner(text).declarations()
+
+
+def with_header_comments(text: str, start: int) -> int:
+    """Move ``start`` up over the ``//`` lines directly above it."""
+    while start > 0 and text[start - 1] == "\n":
+        line = text.rfind("\n", 0, start - 1) + 1
+        if not text[line:start].rstrip("\r\n").startswith("//"):
+            break
+        start = line
+    return start
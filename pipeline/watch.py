@@ -0,0 +1,288 @@
+"""Watch mode: regenerate only what an edit affects.
+
+``python -m pipeline watch`` stays running next to ``npm run dev``. It
+watches the content stores (``content/*.json``), the updater scripts
+(``update_*.py``) and every original under ``public/images``, coalesces a
+burst of saves (editors write, rename and touch in quick succession) into one
+batch once the files have been quiet for ``--debounce`` seconds, and maps the
+batch to the smallest set of stages:
+
+* ``content/cronograma.json``: the timeline modules (only the chunks of the
+  centuries whose events changed are rewritten) and the search index.
+* ``content/galeria.json``: ``app/data/gallery.ts`` and the search index.
+* ``update_<x>.py``: the script is reloaded and only its own tab modules are
+  patched (plus the search index for ``update_tabs.py``, which holds the
+  article).
+* ``public/images/...``: the variants of the changed originals only, the
+  asset store and, since canonical URLs may move, the gallery, the timeline
+  and every tab module. A folder moved away or deleted counts as a change
+  to the originals it held.
+* ``content/i18n/<locale>.json``, or any batch that changed an output: the
+  per-locale modules (see :mod:`pipeline.i18n`), of which only those whose
+  source or catalog group changed are rewritten.
+
+On Linux the watcher uses inotify through ctypes; elsewhere (the Windows
+launcher) it falls back to polling ``stat`` every ``--interval`` seconds.
+A failing stage (say, a half-typed JSON file) is reported and the watcher
+keeps running. After a batch that changed outputs, the references they break
+are reported (see :mod:`pipeline.integrity`).
+"""
+
+import ctypes
+import ctypes.util
+import importlib
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pipeline.cache import get_cache
+from pipeline.i18n import CATALOG_DIR
+from pipeline.images import EXTENSIONS, SOURCE_DIR
+from pipeline.integrity import check_integrity
+from pipeline.trace import span
+
+CONTENT_DIR = "content"
+SCRIPTS = ("update_tabs.py", "update_cronograma.py", "update_galeria.py")
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+
+def is_watched(path: str) -> bool:
+    """Whether a change to ``path`` (relative to the repo root) matters."""
+    path = os.path.normpath(path)
+    head = os.path.dirname(path)
+    if head == "":
+        return path in SCRIPTS
+    if head in (CONTENT_DIR, CATALOG_DIR):
+        return path.endswith(".json")
+    return path.startswith(SOURCE_DIR + os.sep) and path.lower().endswith(EXTENSIONS)
+
+
+class InotifyWatcher:
+    """Recursive inotify watch over the content, the scripts and the originals."""
+
+    def __init__(self, roots: Iterable[str] = (".", CONTENT_DIR, CATALOG_DIR, SOURCE_DIR)):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self.dirs: Dict[int, str] = {}
+        for root in roots:
+            # Only the originals are watched recursively; "." would drag in node_modules.
+            self._add(root, recursive=root == SOURCE_DIR)
+
+    def _add(self, directory: str, recursive: bool) -> None:
+        if not os.path.isdir(directory):
+            return
+        wd = self._add_watch(self.fd, os.fsencode(directory), _MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch {directory}")
+        self.dirs[wd] = os.path.normpath(directory)
+        if recursive:
+            for entry in os.scandir(directory):
+                if entry.is_dir():
+                    self._add(entry.path, recursive)
+
+    def _drop(self, directory: str) -> None:
+        """Forget the watches on ``directory`` and below, which moved away or went."""
+        for wd, path in list(self.dirs.items()):
+            if path == directory or path.startswith(directory + os.sep):
+                del self.dirs[wd]
+                self._rm_watch(self.fd, wd)  # fails harmlessly if the kernel already dropped it
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """Paths changed within ``timeout`` seconds (``None`` blocks)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 1 << 16)
+        changed = set()
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            name = os.fsdecode(data[pos:pos + length].rstrip(b"\0"))
+            pos += length
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_DELETE_SELF:
+                path = directory
+            else:
+                path = os.path.normpath(os.path.join(directory, name))
+            if mask & (IN_ISDIR | IN_DELETE_SELF):
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add(path, recursive=True)
+                    # Files copied in with the folder raced the new watch.
+                    changed.update(f for f in _walk(path) if is_watched(f))
+                else:
+                    self._drop(path)
+                    # Its originals left with it: the folder stands for them.
+                    if path.startswith(SOURCE_DIR + os.sep):
+                        changed.add(path)
+                continue
+            if is_watched(path):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _walk(root: str) -> List[str]:
+    found = []
+    for base, _, files in os.walk(root):
+        found += [os.path.normpath(os.path.join(base, f)) for f in files]
+    return found
+
+
+class PollingWatcher:
+    """Portable fallback: diff a ``stat`` snapshot of the watched files."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        paths = list(SCRIPTS) + _walk(SOURCE_DIR)
+        for directory in (CONTENT_DIR, CATALOG_DIR):
+            if os.path.isdir(directory):
+                paths += [os.path.join(directory, name) for name in os.listdir(directory)]
+        stats = {}
+        for path in paths:
+            if is_watched(path):
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                stats[os.path.normpath(path)] = (st.st_size, st.st_mtime_ns)
+        return stats
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic()))
+            time.sleep(delay)
+            current = self._scan()
+            changed = {p for p in current.keys() | self.snapshot.keys() if current.get(p) != self.snapshot.get(p)}
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(poll: bool = False, interval: float = 0.5):
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(interval)
+
+
+def collect(watcher, debounce: float) -> Set[str]:
+    """Block for the next change, then absorb the rest of the burst."""
+    changed = set()
+    while not changed:
+        changed = watcher.wait(None)
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+def _reload(name: str):
+    module = sys.modules.get(name)
+    return importlib.reload(module) if module else importlib.import_module(name)
+
+
+def regenerate(paths: Set[str]) -> List[str]:
+    """Run the stages affected by ``paths``; return the outputs that changed."""
+    from pipeline.assets import build_assets, load_map, rewrite_urls
+    from pipeline.cronograma import compile_cronograma
+    from pipeline.gallery import build_gallery
+    from pipeline.i18n import build_locales
+    from pipeline.images import build_images
+    from pipeline.patch import patch_modules
+    from pipeline.search import build_search
+
+    images = {p for p in paths if p.startswith(SOURCE_DIR + os.sep)}
+    scripts = {os.path.splitext(p)[0] for p in paths if p in SCRIPTS}
+    cronograma = os.path.join(CONTENT_DIR, "cronograma.json") in paths or bool(images)
+    gallery = os.path.join(CONTENT_DIR, "galeria.json") in paths or bool(images)
+    search = cronograma or gallery or "update_tabs" in scripts
+    catalogs = any(os.path.dirname(p) == CATALOG_DIR for p in paths)
+
+    if images:
+        # Canonical URLs may have moved: every tab module is re-checked.
+        scripts |= {os.path.splitext(s)[0] for s in SCRIPTS}
+    # Reload the edited scripts first: the search index reads their text.
+    modules = []
+    for name in sorted(scripts):
+        modules += _reload(name).MODULES
+
+    outputs: List[str] = []
+    if images:
+        outputs += build_images(changed=images)
+        build_assets()
+    if cronograma:
+        outputs += compile_cronograma()
+    if gallery and build_gallery():
+        outputs.append("app/data/gallery.ts")
+    if search:
+        outputs += build_search()
+
+    mapping = load_map()
+    outputs += patch_modules(modules, lambda text: rewrite_urls(text, mapping)).changed
+    if outputs or catalogs:
+        outputs += build_locales().changed
+    return outputs
+
+
+def watch(debounce: float = 0.15, poll: bool = False, interval: float = 0.5) -> None:
+    watcher = open_watcher(poll, interval)
+    kind = "inotify" if isinstance(watcher, InotifyWatcher) else "sondeo"
+    print(f"Vigilando content/, content/i18n/, update_*.py y {SOURCE_DIR} ({kind}). Ctrl+C para salir.")
+    try:
+        while True:
+            paths = collect(watcher, debounce)
+            start = time.perf_counter()
+            try:
+                with span("batch", cat="run", paths=len(paths)):
+                    outputs = regenerate(paths)
+            except (Exception, SystemExit) as error:
+                print(f"Error al regenerar ({', '.join(sorted(paths))}): {error}")
+                continue
+            finally:
+                get_cache().flush()  # the watcher may run for hours: persist and evict per batch
+            elapsed = (time.perf_counter() - start) * 1000
+            summary = ", ".join(outputs) if outputs else "sin cambios"
+            print(f"[{time.strftime('%H:%M:%S')}] {', '.join(sorted(paths))} -> {summary} ({elapsed:.0f} ms)")
+            if outputs:
+                for broken in check_integrity().broken:
+                    print(f"  {broken.source}:{broken.line}: {broken.message}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
@@ -1,16 +1,12 @@
-import re
+import os
 
-with open("app/page.tsx", "r", encoding="utf-8") as f:
-    content = f.read()
+from pipeline.assets import rewrite_urls
+from pipeline.patch import TABS_DIR, Module, patch_modules
+from pipeline.trace import session
 
-# Replace ProyectoTab
-proyecto_match = re.search(r"// Tab 2: Proyecto - Recuperación de la memoria de Guanarteme\nfunction ProyectoTab.*?^\}", content, re.MULTILINE | re.DOTALL)
-if not proyecto_match:
-    proyecto_match = re.search(r"// Tab 2: Proyecto.*?\nfunction ProyectoTab.*?\n\}", content, re.MULTILINE | re.DOTALL)
-
-if proyecto_match:
-    new_proyecto = """// Tab 2: Proyecto - Recuperación de la memoria de Guanarteme
-function ProyectoTab() {
+# Both tabs are static prose and render as server components: no 'use client'.
+PROYECTO_TAB = """// Tab 2: Proyecto - Recuperación de la memoria de Guanarteme
+export default function ProyectoTab() {
     return (
         <div className="space-y-16 py-12">
             <section className="fade-in-section">
@@ -18,7 +14,7 @@ function ProyectoTab() {
                     <h2 className="text-4xl md:text-5xl font-bold text-amber-300 mb-8 text-center leading-tight">
                         De atrás pa' lante: Cultura e identidades en los centros escolares de Canarias
                     </h2>
-                    
+
                     <div className="bg-slate-800/50 backdrop-blur-sm p-10 rounded-2xl border border-slate-700/50 mb-12">
                         <div className="space-y-6 text-slate-300 text-lg leading-relaxed">
                             <p className="text-justify">
@@ -60,16 +56,34 @@ function ProyectoTab() {
 
                     <div className="grid md:grid-cols-2 gap-8">
                         {/* Grupos */}
-                        <div className="bg-slate-800/40 p-8 rounded-2xl border border-amber-500/20">
-                            <h4 className="flex items-center gap-3 text-2xl font-bold text-amber-400 mb-6">
-                                <span className="w-8 h-8 rounded-full bg-amber-500/20 flex items-center justify-center text-amber-300">👥</span>
-                                Grupos Implicados
-                            </h4>
-                            <ul className="space-y-3 text-lg text-slate-300 font-medium">
-                                <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 1º Bachillerato A</li>
-                                <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3º ESO B</li>
-                                <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3º ESO C</li>
-                            </ul>
+                        <div className="bg-slate-800/40 p-8 rounded-2xl border border-amber-500/20 h-full flex flex-col">
+                            <div>
+                                <h4 className="flex items-center gap-3 text-2xl font-bold text-amber-400 mb-6">
+                                    <span className="w-8 h-8 rounded-full bg-amber-500/20 flex items-center justify-center text-amber-300">👥</span>
+                                    Grupos Implicados
+                                </h4>
+                                <ul className="space-y-3 text-lg text-slate-300 font-medium mb-10">
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 1º Bachillerato A</li>
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3º ESO B</li>
+                                    <li className="flex items-center gap-2"><span className="text-amber-500">•</span> 3º ESO C</li>
+                                </ul>
+                            </div>
+
+                            {/* Image Placeholders */}
+                            <div className="mt-auto flex flex-col gap-4 flex-1 pt-4">
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span>
+                                    <span className="text-slate-500 font-medium text-sm text-center">Foto 1º Bachillerato A<br /><span className="text-xs font-light opacity-70">(Próximamente)</span></span>
+                                </div>
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span>
+                                    <span className="text-slate-500 font-medium text-sm text-center">Foto 3º ESO B<br /><span className="text-xs font-light opacity-70">(Próximamente)</span></span>
+                                </div>
+                                <div className="flex-1 w-full bg-slate-900/60 rounded-xl border border-slate-700/50 shadow-inner flex flex-col items-center justify-center min-h-[140px] transition-colors hover:bg-slate-800/60 group">
+                                    <span className="text-amber-500/30 text-3xl mb-2 group-hover:scale-110 transition-transform">📷</span>
+                                    <span className="text-slate-500 font-medium text-sm text-center">Foto 3º ESO C<br /><span className="text-xs font-light opacity-70">(Próximamente)</span></span>
+                                </div>
+                            </div>
                         </div>
 
                         {/* Materias */}
@@ -80,7 +94,7 @@ function ProyectoTab() {
                                     La historia de la economía en Canarias desde el mundo previo a la llegada de los Europeos hasta la actualidad, además de su vinculación con el entorno cercano al centro.
                                 </p>
                             </div>
-                            
+
                             <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-cyan-500/30 transition-colors">
                                 <h4 className="text-xl font-bold text-cyan-300 mb-3">Historia de Canarias (3º ESO)</h4>
                                 <p className="text-slate-400 text-base leading-relaxed">
@@ -94,14 +108,14 @@ function ProyectoTab() {
                                     Cálculo y predicción de la subida del precio del alquiler durante el siglo XXI y sus posibles precios en el futuro si se mantuviera esta dinámica en el barrio de Guanarteme.
                                 </p>
                             </div>
-                            
+
                             <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-purple-500/30 transition-colors">
                                 <h4 className="text-xl font-bold text-purple-300 mb-3">Inglés (3º ESO)</h4>
                                 <p className="text-slate-400 text-base leading-relaxed">
                                     Presencia de la huella británica en Canarias a través de la historia y la lengua. Análisis de palabras de origen anglosajón usadas en la actualidad.
                                 </p>
                             </div>
-                            
+
                             <div className="bg-slate-800/40 p-6 rounded-2xl border border-slate-700/50 hover:border-pink-500/30 transition-colors">
                                 <h4 className="text-xl font-bold text-pink-300 mb-3">Música (3º ESO)</h4>
                                 <p className="text-slate-400 text-base leading-relaxed">
@@ -125,41 +139,34 @@ function ProyectoTab() {
         </div>
     );
 }"""
-    content = content[:proyecto_match.start()] + new_proyecto + content[proyecto_match.end():]
-else:
-    print("Could not find ProyectoTab section")
 
-# Replace AutorTab
-autor_match = re.search(r"// Tab 1: Origen del Autor\s*\(Leandro Perdomo\)\nfunction AutorTab.*?^\}", content, re.MULTILINE | re.DOTALL)
-
-if autor_match:
-    new_autor = """// Tab 1: Origen del Autor y Guanarteme
-function AutorTab({ titleRef, subtitleRef, imageRef }: any) {
+AUTOR_TAB = """// Tab 1: Origen del Autor y Guanarteme
+export default function AutorTab() {
     return (
         <div className="space-y-20 pb-20">
             {/* Hero Section */}
-            <section className="relative min-h-[85vh] flex items-center justify-center overflow-hidden">
-                <div className="absolute inset-0 bg-[url('/images/gallery/anos40/1320411257.jpg')] bg-cover bg-center bg-no-repeat opacity-20 filter grayscale blur-sm"></div>
+            <section className="relative min-h-[70vh] sm:min-h-[85vh] flex items-center justify-center overflow-hidden">
+                <img src="/images/gallery/Años 40-50/1320411257.jpg" alt="" aria-hidden="true" sizes="100vw" className="absolute inset-0 w-full h-full object-cover opacity-20 filter grayscale blur-sm" />
                 <div className="absolute inset-0 bg-gradient-to-t from-slate-900 via-slate-900/90 to-slate-900/60 z-10"></div>
 
-                <div className="container mx-auto relative z-20 gap-12 items-center flex flex-col pt-12">
-                    <div className="text-center space-y-6 max-w-4xl mx-auto">
+                <div className="container mx-auto px-4 relative z-20 gap-6 md:gap-12 items-center flex flex-col pt-8 md:pt-12">
+                    <div className="text-center space-y-4 md:space-y-6 mx-auto w-full px-2 sm:px-0">
                         <h1
-                            ref={titleRef}
-                            className="text-7xl md:text-9xl font-black text-transparent bg-clip-text bg-gradient-to-br from-amber-200 via-orange-400 to-amber-600 tracking-tighter drop-shadow-2xl"
+                            data-anim="title"
+                            className="text-3xl min-[390px]:text-4xl min-[500px]:text-5xl sm:text-7xl md:text-9xl font-black text-transparent bg-clip-text bg-gradient-to-br from-amber-200 via-orange-400 to-amber-600 tracking-tighter drop-shadow-2xl leading-none"
                         >
                             GUANARTEME
                         </h1>
-                        <h2 className="text-3xl md:text-5xl text-amber-300/80 font-serif italic tracking-wide">
+                        <h2 className="text-xl min-[375px]:text-2xl sm:text-3xl md:text-5xl text-amber-300/80 font-serif italic tracking-tight sm:tracking-wide">
                             por Leandro Perdomo
                         </h2>
-                        
+
                         <div
-                            ref={subtitleRef}
-                            className="inline-block mt-8 border border-amber-500/30 bg-slate-900/60 backdrop-blur-md p-6 rounded-2xl shadow-xl shadow-amber-900/20"
+                            data-anim="subtitle"
+                            className="inline-block w-full sm:w-auto mt-4 md:mt-8 border border-amber-500/30 bg-slate-900/60 backdrop-blur-md p-4 sm:p-6 rounded-2xl shadow-xl shadow-amber-900/20 mx-auto"
                         >
-                            <p className="text-amber-500 font-bold uppercase tracking-[0.3em] text-sm mb-3">Publicado en Falange: 5-5-1954</p>
-                            <p className="text-xl md:text-2xl text-slate-300 font-light leading-relaxed text-center italic">
+                            <p className="text-amber-500 font-bold uppercase tracking-wider sm:tracking-widest md:tracking-[0.3em] text-[10px] sm:text-xs md:text-sm mb-2 sm:mb-3">Publicado en Falange: 5-5-1954</p>
+                            <p className="text-base sm:text-xl md:text-2xl text-slate-300 font-light leading-relaxed text-center italic">
                                 "Guanarteme es, sencillamente, el barrio más importante que tiene la ciudad. Más que barrio, prolongación, proyección del apretado casco porteño."
                             </p>
                         </div>
@@ -173,9 +180,9 @@ function AutorTab({ titleRef, subtitleRef, imageRef }: any) {
                     <div className="bg-slate-800/80 backdrop-blur-xl p-8 md:p-16 rounded-[2.5rem] border border-slate-700/50 shadow-2xl relative">
                         {/* Quotes decoration */}
                         <div className="absolute top-10 left-8 md:left-12 text-6xl text-amber-500/20 font-serif">"</div>
-                        
+
                         <div className="space-y-8 text-lg md:text-xl text-slate-300 leading-[1.8] text-justify font-serif relative z-10">
-                            
+
                             <p className="drop-cap first-letter:text-6xl first-letter:font-bold first-letter:text-amber-400 first-letter:mr-3 first-letter:float-left">
                                 Arenas solitarias, movedizas; arenas blancas, rubias, con reminiscencias africanas y fallidos deseos de playa y monte, esas arenas que enmarcan el populoso barrio industrial. Ni playa, con sus bañistas, ni verde monte. Guanarteme es, sencillamente, el barrio más importante que tiene la ciudad. Más que barrio, prolongación, proyección del apretado casco porteño. No tiene historia. Una casa humilde, y otra luego y otra; hasta que empezaron las fábricas a empinar sus chimeneas, las factorías a aventar sus nauseabundos olores y la Cicer a ennegrecer las albas arenas que quisieron ser playa. Cuando la proyectada Avenida Marítima alcance el término marcado, remontado Italcable, Guanarteme al fin quedará incorporado a la categoría estival que ostenta las Canteras; pero sus contornos marinos habrán de ser ciertamente remozados, higiénicamente removidos. Esto todos lo saben. Y eso se verá, dentro de años.
                             </p>
@@ -231,11 +238,11 @@ function AutorTab({ titleRef, subtitleRef, imageRef }: any) {
                             <p className="text-2xl font-semibold text-amber-300 mt-12 pb-8 border-b border-slate-700">
                                 Ojalá fueran todos los barrios, de noche y de día, como este barrio porteño, que pudo ser espléndido aeródromo y es lo que es: el barrio más importante, más sano, más laborioso y más tranquilo de la urbe...
                             </p>
-                            
+
                             <div className="mt-8 flex items-center justify-between">
                                 <div className="flex items-center gap-4">
                                     <div className="w-16 h-16 rounded-full overflow-hidden border-2 border-amber-500/50 relative">
-                                        <img src="/images/Leandro.png" alt="Leandro Perdomo" className="w-full h-full object-cover" />
+                                        <img src="/images/Leandro.png" alt="Leandro Perdomo" sizes="64px" loading="lazy" className="w-full h-full object-cover" />
                                     </div>
                                     <div>
                                         <p className="text-amber-400 font-bold">Leandro Perdomo</p>
@@ -254,11 +261,16 @@ function AutorTab({ titleRef, subtitleRef, imageRef }: any) {
         </div>
     );
 }"""
-    content = content[:autor_match.start()] + new_autor + content[autor_match.end():]
-else:
-    print("Could not find AutorTab section")
 
-with open("app/page.tsx", "w", encoding="utf-8") as f:
-    f.write(content)
+MODULES = [
+    Module(os.path.join(TABS_DIR, "ProyectoTab.tsx"), "", {"ProyectoTab": PROYECTO_TAB}),
+    Module(os.path.join(TABS_DIR, "AutorTab.tsx"), "", {"AutorTab": AUTOR_TAB}),
+]
+
+if __name__ == "__main__":
+    with session():  # PIPELINE_TRACE=trace.json times every stage
+        result = patch_modules(MODULES, rewrite_urls)
+    for name in result.missing:
+        print(f"Could not find {name} section")
 
-print("Actualizado exitosamente")
+    print("Actualizado exitosamente" if result.changed else "Sin cambios")